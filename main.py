@@ -1,13 +1,11 @@
+import argparse
 import logging
 import logging.config
 
 from sudoku_solve.solver import Solver, SolveStrategy
 from sudoku_solve.puzzle_library import PuzzleLibrary
-from sudoku_solve.only_option_solver import OnlyOptionSolver
-from sudoku_solve.group_exclusive_solver import GroupExclusiveSolver
-from sudoku_solve.naked_pairs_solver import NakedPairsSolver
-from sudoku_solve.hidden_pairs_solver import HiddenPairsSolver
-from sudoku_solve.pointing_pairs_solver import PointingPairsSolver
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.dlx_solver import DancingLinksSolver
 from sudoku_solve.puzzle_render import render_puzzle, render_puzzle_with_options
 
 
@@ -15,16 +13,22 @@ def init_logging() -> None:
     logging.basicConfig(level=logging.DEBUG)
 
 
-def solve_a_puzzle() -> None:
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Solve a sample sudoku puzzle")
+    parser.add_argument("--engine", choices=["strategies", "dlx"], default="strategies",
+                        help="solve with the logical strategies, or with the dancing links exact cover solver")
+    return parser.parse_args()
+
+
+def strategies_for(engine: str) -> list[SolveStrategy]:
+    if engine == "dlx":
+        return [DancingLinksSolver()]
+    return default_strategies()
+
+
+def solve_a_puzzle(engine: str) -> None:
     puzzle = PuzzleLibrary.extreme_puzzle()
-    strategies: list[SolveStrategy] = [
-        GroupExclusiveSolver(),
-        OnlyOptionSolver(),
-        NakedPairsSolver(),
-        HiddenPairsSolver(),
-        PointingPairsSolver(),
-    ]
-    solver = Solver(puzzle, strategies)
+    solver = Solver(puzzle, strategies_for(engine))
     stats = solver.solve()
 
     if solver.puzzle.is_solved():
@@ -39,8 +43,9 @@ def solve_a_puzzle() -> None:
 
 
 def main() -> None:
+    args = parse_args()
     init_logging()
-    solve_a_puzzle()
+    solve_a_puzzle(args.engine)
 
 
 if __name__ == '__main__':
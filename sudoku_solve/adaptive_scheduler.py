@@ -0,0 +1,63 @@
+import logging
+from dataclasses import dataclass, field
+
+from sudoku_solve.solver import SolveStrategy, StrategyScheduler
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class AdaptiveScheduler(StrategyScheduler):
+    """
+    Orders strategies by how many options they have recently eliminated per microsecond, measured as an exponential
+    moving average over their applications. A strategy which fails to make progress is left out of the following
+    steps, for a number of steps which doubles with each consecutive failure up to `max_backoff`, and is reset by a
+    success. Strategies which have not been applied yet are tried after those which have, in their original order.
+    Last resort strategies, such as :class:`SearchSolver`, are not ranked: they are tried after every other strategy,
+    and are left out of any step which leaves out another strategy so that the solver tries that one first.
+
+    The measurements are kept by strategy name, so one scheduler may be shared by the solvers of many puzzles to learn
+    from all of them. Left out strategies are still tried, in their original order, before a solver gives up, so the
+    solver makes the same progress with this scheduler as with a :class:`FixedScheduler`.
+    """
+    smoothing: float = 0.2
+    """The weight of the latest measurement in the moving average."""
+    max_backoff: int = 8
+    """The most steps a failing strategy is left out for."""
+    rates: dict[str, float] = field(default_factory=dict)
+    backoff: dict[str, int] = field(default_factory=dict)
+    skipped_steps: dict[str, int] = field(default_factory=dict)
+
+    def schedule(self, strategies: list[SolveStrategy]) -> list[SolveStrategy]:
+        scheduled: list[SolveStrategy] = []
+        last_resorts: list[SolveStrategy] = []
+        skipped = False
+        for strategy in strategies:
+            name = strategy.strategy_name()
+            remaining = self.skipped_steps.get(name, 0)
+            if remaining:
+                self.skipped_steps[name] = remaining - 1
+                skipped = True
+            elif strategy.is_last_resort():
+                last_resorts.append(strategy)
+            else:
+                scheduled.append(strategy)
+        scheduled.sort(key=self.__priority)
+        return scheduled if skipped else scheduled + last_resorts
+
+    def record(self, strategy: SolveStrategy, score: int, nanoseconds: int) -> None:
+        name = strategy.strategy_name()
+        rate = score * 1000 / max(nanoseconds, 1)
+        previous = self.rates.get(name)
+        self.rates[name] = rate if previous is None else previous + self.smoothing * (rate - previous)
+        if score:
+            self.backoff[name] = 0
+        else:
+            backoff = min(max(1, 2 * self.backoff.get(name, 0)), self.max_backoff)
+            self.backoff[name] = backoff
+            self.skipped_steps[name] = backoff
+        logger.debug("%s rate is now %.3f options/us", name, self.rates[name])
+
+    def __priority(self, strategy: SolveStrategy) -> tuple[bool, float]:
+        rate = self.rates.get(strategy.strategy_name())
+        return rate is None, -rate if rate is not None else 0.0
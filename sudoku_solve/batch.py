@@ -0,0 +1,95 @@
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass
+from typing import Iterable, Iterator, Optional
+
+from sudoku_solve.solver import SolveStatistics, StatisticsAggregator
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle, MalformedPuzzle
+from sudoku_solve.puzzle_render import render_puzzle_line
+from sudoku_solve.session import SolverSession
+
+logger = logging.getLogger(__name__)
+
+__worker_session: Optional[SolverSession] = None
+
+
+@dataclass
+class BatchResult:
+    """
+    The outcome of solving one puzzle of a batch.
+    """
+    index: int
+    """The position of the puzzle in the input."""
+    puzzle: str
+    """The puzzle as a line of 81 characters."""
+    solution: str
+    """The final state of the puzzle as a line of 81 characters, unknown cells are rendered as '-'."""
+    solved: bool
+    statistics: SolveStatistics
+    seconds: float
+    error: Optional[str] = None
+    """The reason the puzzle could not be read or solved, if it failed."""
+
+
+def solve_many(puzzles: Iterable[Puzzle | str], workers: Optional[int] = None, chunksize: int = 64,
+               ordered: bool = True, aggregate: Optional[StatisticsAggregator] = None) -> Iterator[BatchResult]:
+    """
+    Solve many puzzles using a pool of worker processes. Puzzles are sent to the workers as 81 character lines rather
+    than :class:`Puzzle` objects, so any options eliminated from a puzzle that is passed in are not sent. Each worker
+    creates one :class:`SolverSession` and loads every puzzle it solves into it.
+
+    :param puzzles: The puzzles, either as :class:`Puzzle` objects or in the format read by `read_puzzle_line`
+    :param workers: The number of worker processes, defaults to the number of CPUs; `1` solves in this process
+    :param chunksize: The number of puzzles sent to a worker at a time
+    :param ordered: When `true` results are produced in input order, otherwise as soon as they are available
+    :param aggregate: If given, the statistics of each result are added to it as the result is produced
+    :return: An iterator over the results, one for each puzzle
+    """
+    lines = enumerate(__as_line(p) for p in puzzles)
+    if workers == 1:
+        __init_worker()
+        yield from __aggregated(map(__solve_line, lines), aggregate)
+        return
+    with multiprocessing.Pool(workers, initializer=__init_worker) as pool:
+        results = pool.imap(__solve_line, lines, chunksize) if ordered \
+            else pool.imap_unordered(__solve_line, lines, chunksize)
+        yield from __aggregated(results, aggregate)
+
+
+def __aggregated(results: Iterator[BatchResult], aggregate: Optional[StatisticsAggregator]) -> Iterator[BatchResult]:
+    if aggregate is None:
+        yield from results
+        return
+    for result in results:
+        aggregate.add(result.statistics)
+        yield result
+
+
+def __as_line(puzzle: Puzzle | str) -> str:
+    if isinstance(puzzle, Puzzle):
+        return render_puzzle_line(puzzle)
+    return ''.join(puzzle.split())
+
+
+def __init_worker() -> None:
+    global __worker_session
+    __worker_session = SolverSession()
+
+
+def __solve_line(item: tuple[int, str]) -> BatchResult:
+    index, line = item
+    session = __worker_session
+    assert session is not None
+    start = time.perf_counter()
+    try:
+        statistics = session.solve(line)
+        return BatchResult(index, line, session.solution(), session.is_solved(), statistics,
+                           time.perf_counter() - start)
+    except (UnsolvablePuzzle, MalformedPuzzle) as e:
+        logger.info("Puzzle %d failed: %s", index, e)
+        return BatchResult(index, line, line, False, SolveStatistics(), time.perf_counter() - start, str(e))
+    except Exception as e:
+        logger.exception("Puzzle %d raised an unexpected error", index)
+        return BatchResult(index, line, line, False, SolveStatistics(), time.perf_counter() - start,
+                           f"{type(e).__name__}: {e}")
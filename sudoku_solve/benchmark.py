@@ -0,0 +1,185 @@
+from __future__ import annotations
+import argparse
+import json
+import time
+import tracemalloc
+from dataclasses import dataclass, field, asdict
+from functools import partial
+from io import StringIO
+from typing import Callable, Optional
+
+from sudoku_solve.solver import Solver, SolveStrategy, StrategyScheduler, FixedScheduler
+from sudoku_solve.adaptive_scheduler import AdaptiveScheduler
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.puzzle_corpus import PuzzleCorpus, CORPUS_MAGIC
+from sudoku_solve.puzzle_library import PUZZLE_STRS_BY_DIFFICULTY
+from sudoku_solve.puzzle_read import read_puzzle, read_puzzles
+from sudoku_solve.strategies import default_strategies, strategies_by_name
+
+
+@dataclass
+class BenchmarkResult:
+    """
+    The performance of a list of strategies over one set of puzzles.
+    """
+    name: str
+    puzzles: int
+    solved: int
+    failed: int
+    """The number of puzzles where solving raised an error, such as a puzzle found to have no solution."""
+    seconds: float
+    puzzles_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    peak_memory_kb: Optional[int]
+    """The most memory allocated by Python while solving this set, `None` if it was not measured."""
+    strategy_seconds: dict[str, float] = field(default_factory=dict)
+
+    def render(self) -> str:
+        """
+        Render a multiline, human readable summary of the result.
+        """
+        memory = f"{self.peak_memory_kb} kB" if self.peak_memory_kb is not None else "unknown"
+        lines = [
+            f"{self.name}: {self.solved}/{self.puzzles} solved, {self.failed} failed in {self.seconds:.3f}s "
+            f"({self.puzzles_per_second:.1f} puzzles/s)",
+            f"  latency p50={self.p50_ms:.3f}ms p95={self.p95_ms:.3f}ms p99={self.p99_ms:.3f}ms",
+            f"  peak memory: {memory}",
+        ]
+        lines += [f"  {name}: {seconds:.3f}s" for name, seconds in self.strategy_seconds.items()]
+        return '\n'.join(lines)
+
+
+def benchmark(name: str, puzzles: list[Puzzle], strategies: list[SolveStrategy], repeat: int = 1,
+              scheduler: Optional[StrategyScheduler] = None, measure_memory: bool = True) -> BenchmarkResult:
+    """
+    Solve copies of each puzzle with the strategies, measuring the time taken. A puzzle which raises an error is
+    counted as failed rather than ending the run.
+
+    :param name: The name of the set of puzzles
+    :param puzzles: The puzzles; they are copied before solving and are not changed
+    :param strategies: The strategies to apply; they are reused for every puzzle
+    :param repeat: The number of times each puzzle is solved
+    :param scheduler: The scheduler shared by every solver, defaults to a :class:`FixedScheduler`
+    :param measure_memory: When `true`, allocations are traced with :mod:`tracemalloc` to find the peak memory used
+        by this set, which slows the solvers down
+    :return: The measurements
+    """
+    if scheduler is None:
+        scheduler = FixedScheduler()
+    latencies: list[float] = []
+    solved = 0
+    failed = 0
+    strategy_seconds = {s.strategy_name(): 0.0 for s in strategies}
+    tracing = measure_memory and not tracemalloc.is_tracing()
+    if tracing:
+        tracemalloc.start()
+    if measure_memory:
+        tracemalloc.reset_peak()
+    memory_before = tracemalloc.get_traced_memory()[0] if measure_memory else 0
+    for _ in range(repeat):
+        for original in puzzles:
+            puzzle = original.copy()
+            start = time.perf_counter()
+            solver = Solver(puzzle, strategies, scheduler=scheduler)
+            try:
+                solver.solve()
+            except Exception:
+                failed += 1
+            else:
+                solved += puzzle.is_solved()
+            latencies.append(time.perf_counter() - start)
+            for stats in solver.statistics.strategies.values():
+                strategy_seconds[stats.strategy] += stats.nanoseconds / 1_000_000_000
+    peak_memory_kb = (tracemalloc.get_traced_memory()[1] - memory_before) // 1024 if measure_memory else None
+    if tracing:
+        tracemalloc.stop()
+    total = sum(latencies)
+    latencies.sort()
+    return BenchmarkResult(
+        name,
+        len(latencies),
+        solved,
+        failed,
+        total,
+        len(latencies) / total if total else 0.0,
+        __percentile(latencies, 50) * 1000,
+        __percentile(latencies, 95) * 1000,
+        __percentile(latencies, 99) * 1000,
+        peak_memory_kb,
+        strategy_seconds,
+    )
+
+
+def load_puzzles(path: str, limit: Optional[int] = None) -> list[Puzzle]:
+    """
+    Load puzzles from a binary corpus, or from a text file in any format read by :func:`read_puzzles`.
+    """
+    with open(path, "rb") as f:
+        is_corpus = f.read(len(CORPUS_MAGIC)) == CORPUS_MAGIC
+    puzzles: list[Puzzle] = []
+    if is_corpus:
+        with PuzzleCorpus(path) as corpus:
+            for i in range(len(corpus) if limit is None else min(limit, len(corpus))):
+                puzzles.append(corpus[i])
+        return puzzles
+    with open(path) as f:
+        for puzzle in read_puzzles(f, skip_invalid=True):
+            if limit is not None and len(puzzles) >= limit:
+                break
+            puzzles.append(puzzle)
+    return puzzles
+
+
+def __library_puzzles(difficulty: str) -> list[Puzzle]:
+    return [read_puzzle(StringIO(PUZZLE_STRS_BY_DIFFICULTY[difficulty]))]
+
+
+def __percentile(sorted_values: list[float], percent: int) -> float:
+    if not sorted_values:
+        return 0.0
+    rank = max(0, -(-len(sorted_values) * percent // 100) - 1)
+    return sorted_values[rank]
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure the performance of the sudoku solver")
+    parser.add_argument("--library", default=','.join(PUZZLE_STRS_BY_DIFFICULTY),
+                        help="comma separated difficulties from the puzzle library, or an empty string for none")
+    parser.add_argument("--corpus", action="append", default=[],
+                        help="a text or binary puzzle file to benchmark, may be repeated")
+    parser.add_argument("--limit", type=int, help="the most puzzles to load from each corpus file")
+    parser.add_argument("--strategies", help="comma separated strategy names, defaults to the standard strategies")
+    parser.add_argument("--scheduler", choices=["fixed", "adaptive"], default="fixed",
+                        help="the order in which strategies are tried")
+    parser.add_argument("--repeat", type=int, default=1, help="the number of times to solve each puzzle")
+    parser.add_argument("--no-memory", action="store_true",
+                        help="don't trace allocations to measure peak memory, which slows the solvers down")
+    parser.add_argument("--json", action="store_true", help="print the results as JSON")
+    args = parser.parse_args(argv)
+
+    sets: list[tuple[str, Callable[[], list[Puzzle]]]] = []
+    for difficulty in filter(None, args.library.split(',')):
+        if difficulty not in PUZZLE_STRS_BY_DIFFICULTY:
+            parser.error(f"unknown difficulty: {difficulty}")
+        sets.append((difficulty, partial(__library_puzzles, difficulty)))
+    for path in args.corpus:
+        sets.append((path, partial(load_puzzles, path, args.limit)))
+
+    results: list[BenchmarkResult] = []
+    for name, load in sets:
+        puzzles = load()
+        strategies = strategies_by_name(args.strategies.split(',')) if args.strategies else default_strategies()
+        scheduler = AdaptiveScheduler() if args.scheduler == "adaptive" else FixedScheduler()
+        results.append(benchmark(name, puzzles, strategies, args.repeat, scheduler, not args.no_memory))
+        del puzzles
+
+    if args.json:
+        print(json.dumps([asdict(r) for r in results], indent=2))
+    else:
+        print('\n'.join(r.render() for r in results))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+from typing import Final, Iterable, Sequence
+
+ALL_OPTIONS_MASK: Final[int] = 0x1FF
+"""The mask with a bit set for each of the nine possible values of a cell."""
+
+
+def option_bit(value: int) -> int:
+    """
+    Returns the mask bit representing a single value. Value `1` is represented by the lowest bit, and value `9` by the
+    ninth bit.
+    :param value: A value from 1 to 9
+    :return: The mask with only the bit for `value` set
+    """
+    return 1 << (value - 1)
+
+
+def mask_of(values: Iterable[int]) -> int:
+    """
+    Returns the mask representing a collection of values.
+    :param values: Values from 1 to 9
+    :return: The mask with a bit set for each value
+    """
+    mask = 0
+    for v in values:
+        mask |= 1 << (v - 1)
+    return mask
+
+
+def __values_of(mask: int) -> tuple[int, ...]:
+    return tuple(v for v in range(1, 10) if mask & (1 << (v - 1)))
+
+
+MASK_VALUES: Final[tuple[tuple[int, ...], ...]] = tuple(__values_of(m) for m in range(ALL_OPTIONS_MASK + 1))
+"""The ascending values represented by each of the 512 possible masks, indexed by mask."""
+
+
+def values_of(mask: int) -> tuple[int, ...]:
+    """
+    Returns the values represented by a mask, in ascending order.
+    :param mask: A mask of values
+    :return: The values with a bit set in `mask`
+    """
+    return MASK_VALUES[mask]
+
+
+def options_of(mask: int) -> set[int]:
+    """
+    Returns a new set containing the values represented by a mask.
+    :param mask: A mask of values
+    :return: The set of values with a bit set in `mask`
+    """
+    return set(MASK_VALUES[mask])
+
+
+def option_count(mask: int) -> int:
+    """
+    Returns the number of values represented by a mask.
+    :param mask: A mask of values
+    :return: The number of bits set in `mask`
+    """
+    return mask.bit_count()
+
+
+def single_value(mask: int) -> int:
+    """
+    Returns the value represented by a mask with exactly one bit set.
+    :param mask: A mask with exactly one bit set
+    :return: The value represented by `mask`
+    """
+    return mask.bit_length()
+
+
+def small_union_subsets(masks: Sequence[int], candidates: list[int], size: int) -> list[tuple[int, ...]]:
+    """
+    Find every combination of `size` candidates whose masks, taken together, have no more than `size` bits set.
+    Combinations are built one candidate at a time, and abandoned as soon as the union of their masks is too large.
+
+    :param masks: The mask of each candidate, indexed by candidate
+    :param candidates: The candidates to combine, in ascending order
+    :param size: The number of candidates in each combination, and the most bits their union may have
+    :return: The combinations, each in ascending order
+    """
+    found: list[tuple[int, ...]] = []
+    __extend_subsets(masks, candidates, size, 0, [], 0, found)
+    return found
+
+
+def __extend_subsets(masks: Sequence[int], candidates: list[int], size: int, start: int, chosen: list[int],
+                     union: int, found: list[tuple[int, ...]]) -> None:
+    if len(chosen) == size:
+        found.append(tuple(chosen))
+        return
+    for j in range(start, len(candidates) - (size - len(chosen)) + 1):
+        extended = union | masks[candidates[j]]
+        if extended.bit_count() > size:
+            continue
+        chosen.append(candidates[j])
+        __extend_subsets(masks, candidates, size, j + 1, chosen, extended, found)
+        chosen.pop()
@@ -0,0 +1,15 @@
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.intersection_solver import eliminate_claiming
+
+
+class BoxLineReductionSolver(SolveStrategy):
+    """
+    This strategy is the reverse of :class:`PointingPairsSolver`: it finds places
+    where the only possible locations for a certain value within a row or column
+    are in the same block. When this is the case, we can eliminate the value from
+    anywhere else in that block.
+    """
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        return eliminate_claiming(puzzle)
@@ -0,0 +1,193 @@
+import logging
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.puzzle_index import PEER_BITS, cells_of
+from sudoku_solve.bitmask import option_bit, values_of
+from sudoku_solve.trace import Lazy
+
+logger = logging.getLogger(__name__)
+
+
+def eliminate_xy_wings(puzzle: Puzzle) -> bool:
+    """
+    Where a bivalue pivot with options `x` and `y` sees one pincer with options `x` and `z` and another with options
+    `y` and `z`, eliminate `z` from every cell which sees both pincers.
+
+    :return: `true` if any options were eliminated
+    """
+    graph = puzzle.link_graph()
+    masks = puzzle.grid.masks
+    made_progress = False
+    for pivot in cells_of(graph.bivalue):
+        pivot_mask = masks[pivot]
+        if pivot_mask.bit_count() != 2:
+            continue
+        pincers = [p for p in cells_of(PEER_BITS[pivot] & graph.bivalue)
+                   if masks[p].bit_count() == 2 and (masks[p] & pivot_mask).bit_count() == 1]
+        for n, first in enumerate(pincers):
+            for second in pincers[n + 1:]:
+                if masks[first] & pivot_mask == masks[second] & pivot_mask:
+                    continue
+                z_mask = masks[first] & masks[second] & ~pivot_mask
+                if z_mask.bit_count() != 1:
+                    continue
+                z = values_of(z_mask)[0]
+                targets = PEER_BITS[first] & PEER_BITS[second] & graph.cells_with(z)
+                if targets:
+                    logger.debug("XY-Wing pivot %d with pincers %d and %d eliminates %d", pivot, first, second, z)
+                    made_progress |= __eliminate_value(puzzle, z, targets)
+    return made_progress
+
+
+def eliminate_by_colouring(puzzle: Puzzle) -> bool:
+    """
+    Colour each chain of strong links on a value with two alternating colours, then eliminate the value from a colour
+    with two cells which see each other, or otherwise from cells which see both colours.
+
+    :return: `true` if any options were eliminated
+    """
+    graph = puzzle.link_graph()
+    made_progress = False
+    for value in range(1, 10):
+        strong = graph.strong_links(value)
+        coloured = 0
+        eliminated = 0
+        for start in strong:
+            if coloured & (1 << start):
+                continue
+            colours = __colour(strong, start)
+            coloured |= colours[0] | colours[1]
+            eliminated |= __contradicted(colours) or __trapped(graph.cells_with(value), colours)
+        if eliminated:
+            logger.debug("Simple colouring eliminates %d from cells %s", value, Lazy(cells_of, eliminated))
+            made_progress |= __eliminate_value(puzzle, value, eliminated)
+    return made_progress
+
+
+def eliminate_x_chains(puzzle: Puzzle) -> bool:
+    """
+    Follow chains of alternating strong and weak links on each value, and eliminate the value from cells which see
+    both ends of a chain which starts and ends with a strong link.
+
+    :return: `true` if any options were eliminated
+    """
+    graph = puzzle.link_graph()
+    made_progress = False
+    for value in range(1, 10):
+        strong = graph.strong_links(value)
+        candidates = graph.cells_with(value)
+        eliminated = 0
+        for start in strong:
+            ends = __chain_ends(strong, candidates, start)
+            seen = 0
+            for end in cells_of(ends):
+                seen |= PEER_BITS[end]
+            eliminated |= PEER_BITS[start] & seen & candidates
+        if eliminated:
+            logger.debug("X-Chain eliminates %d from cells %s", value, Lazy(cells_of, eliminated))
+            made_progress |= __eliminate_value(puzzle, value, eliminated)
+    return made_progress
+
+
+def __eliminate_value(puzzle: Puzzle, value: int, cells: int) -> bool:
+    grid = puzzle.grid
+    bit = option_bit(value)
+    made_progress = False
+    for i in cells_of(cells):
+        made_progress |= grid.cant_be_mask(i, bit)
+    return made_progress
+
+
+def __colour(strong: dict[int, list[int]], start: int) -> tuple[int, int]:
+    colours = [1 << start, 0]
+    frontier = [(start, 0)]
+    while frontier:
+        cell, colour = frontier.pop()
+        for linked in strong[cell]:
+            if not (colours[0] | colours[1]) & (1 << linked):
+                colours[1 - colour] |= 1 << linked
+                frontier.append((linked, 1 - colour))
+    return colours[0], colours[1]
+
+
+def __contradicted(colours: tuple[int, int]) -> int:
+    for colour in colours:
+        for cell in cells_of(colour):
+            if PEER_BITS[cell] & colour:
+                return colour
+    return 0
+
+
+def __trapped(candidates: int, colours: tuple[int, int]) -> int:
+    seen = [0, 0]
+    for n, colour in enumerate(colours):
+        for cell in cells_of(colour):
+            seen[n] |= PEER_BITS[cell]
+    return candidates & seen[0] & seen[1] & ~(colours[0] | colours[1])
+
+
+def __chain_ends(strong: dict[int, list[int]], candidates: int, start: int) -> int:
+    """
+    Returns the cells which must hold the value if `start` doesn't: those at the end of a strong link from a cell
+    which can't hold it.
+    """
+    start_bit = 1 << start
+    ends = 0
+    excluded = start_bit
+    frontier = start_bit
+    while frontier:
+        reached = 0
+        for cell in cells_of(frontier):
+            for linked in strong.get(cell, ()):
+                reached |= 1 << linked
+        reached &= ~ends & ~start_bit
+        ends |= reached
+        frontier = 0
+        for cell in cells_of(reached):
+            frontier |= PEER_BITS[cell] & candidates
+        frontier &= ~excluded
+        excluded |= frontier
+    return ends
+
+
+class XYWingSolver(SolveStrategy):
+    """
+    This strategy finds XY-Wings: a pivot cell with options `x` and `y`, which
+    sees one cell with options `x` and `z` and another with options `y` and
+    `z`. Whichever value the pivot takes, one of the two pincers must be `z`,
+    so `z` can be eliminated from every cell which sees both pincers.
+    """
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        return eliminate_xy_wings(puzzle)
+
+
+class SimpleColoringSolver(SolveStrategy):
+    """
+    This strategy colours each connected chain of strong links on a value with
+    two alternating colours, so exactly one colour of the chain holds the
+    value. If two cells of one colour see each other, that colour can't hold
+    the value and it is eliminated from all of them; otherwise the value is
+    eliminated from any other cell which sees cells of both colours.
+    """
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        return eliminate_by_colouring(puzzle)
+
+
+class XChainSolver(SolveStrategy):
+    """
+    This strategy follows X-chains: chains of links on one value which
+    alternate between strong and weak links, and start and end with a strong
+    link. If the first cell of such a chain doesn't hold the value then the last
+    one must, so the value can be eliminated from any cell which sees both
+    ends. X-Wings and simple colour traps are short X-chains.
+
+    Rather than walking each chain, the cells reachable from a starting cell
+    are expanded a link at a time as 81-bit sets, alternating strong and weak
+    links, until no new cells are reached.
+    """
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        return eliminate_x_chains(puzzle)
@@ -0,0 +1,209 @@
+import logging
+from io import StringIO
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, PuzzleStateBuilder, UnsolvablePuzzle
+from sudoku_solve.puzzle_read import read_puzzle
+from sudoku_solve.puzzle_index import ROW_OF, COLUMN_OF, BLOCK_OF
+from sudoku_solve.bitmask import option_bit
+
+logger = logging.getLogger(__name__)
+
+CONSTRAINT_COUNT = 4 * 81
+"""One column for each cell, and for each value in each row, column, and block."""
+
+CHOICE_COUNT = 9 * 81
+"""One row for each value of each cell."""
+
+
+class DancingLinks:
+    """
+    Solves puzzles as an exact cover problem using Knuth's Algorithm X with dancing links.
+
+    The links are held in flat lists of node indices: node `0` is the root, nodes `1` to `324` are the column headers,
+    and each of the 729 choices of a value for a cell is a row of four nodes, one in each of the columns it covers.
+    The structure is built once; solving a puzzle hides the rows ruled out by the puzzle's options, searches, and then
+    restores every link, leaving the structure ready for the next puzzle.
+    """
+
+    def __init__(self) -> None:
+        node_count = 1 + CONSTRAINT_COUNT + 4 * CHOICE_COUNT
+        self.left = [0] * node_count
+        self.right = [0] * node_count
+        self.up = list(range(node_count))
+        self.down = list(range(node_count))
+        self.column = [0] * node_count
+        self.choice = [-1] * node_count
+        self.size = [0] * (1 + CONSTRAINT_COUNT)
+        for c in range(1 + CONSTRAINT_COUNT):
+            self.left[c] = c - 1 if c > 0 else CONSTRAINT_COUNT
+            self.right[c] = c + 1 if c < CONSTRAINT_COUNT else 0
+        self.first_nodes: list[int] = []
+        node = 1 + CONSTRAINT_COUNT
+        for choice in range(CHOICE_COUNT):
+            self.first_nodes.append(node)
+            for offset, c in enumerate(self.__choice_columns(choice)):
+                self.__append_to_column(c, node + offset, choice)
+                self.left[node + offset] = node + (offset + 3) % 4
+                self.right[node + offset] = node + (offset + 1) % 4
+            node += 4
+
+    @staticmethod
+    def __choice_columns(choice: int) -> tuple[int, int, int, int]:
+        index, digit = divmod(choice, 9)
+        return (
+            1 + index,
+            1 + 81 + ROW_OF[index] * 9 + digit,
+            1 + 162 + COLUMN_OF[index] * 9 + digit,
+            1 + 243 + BLOCK_OF[index] * 9 + digit,
+        )
+
+    def __append_to_column(self, c: int, node: int, choice: int) -> None:
+        self.column[node] = c
+        self.choice[node] = choice
+        self.up[node] = self.up[c]
+        self.down[node] = c
+        self.down[self.up[c]] = node
+        self.up[c] = node
+        self.size[c] += 1
+
+    def solve_masks(self, masks: list[int], limit: int = 1) -> list[list[int]]:
+        """
+        Find solutions which are consistent with the options of each cell.
+
+        :param masks: The 81 option masks of a puzzle's grid
+        :param limit: The search stops after finding this many solutions
+        :return: Up to `limit` solutions, each a list of the 81 cell values
+        """
+        hidden = [choice for choice in range(CHOICE_COUNT) if not masks[choice // 9] & (1 << choice % 9)]
+        for choice in hidden:
+            self.__hide_choice(choice)
+        solutions: list[list[int]] = []
+        try:
+            self.__search([], solutions, limit)
+        finally:
+            for choice in reversed(hidden):
+                self.__unhide_choice(choice)
+        return solutions
+
+    def solve(self, puzzle: Puzzle | str, limit: int = 1) -> list[Puzzle]:
+        """
+        Find solutions of a puzzle, without changing it.
+
+        :param puzzle: The puzzle, or a puzzle in the text format read by :func:`read_puzzle`
+        :param limit: The search stops after finding this many solutions
+        :return: Up to `limit` solved puzzles
+        """
+        if isinstance(puzzle, str):
+            puzzle = read_puzzle(StringIO(puzzle))
+        return [self.__solved_puzzle(s) for s in self.solve_masks(puzzle.grid.masks, limit)]
+
+    @staticmethod
+    def __solved_puzzle(values: list[int]) -> Puzzle:
+        builder = PuzzleStateBuilder()
+        for v in values:
+            builder.cell(v)
+        return builder.build()
+
+    def __hide_choice(self, choice: int) -> None:
+        up, down, size, column = self.up, self.down, self.size, self.column
+        first = self.first_nodes[choice]
+        for node in range(first, first + 4):
+            down[up[node]] = down[node]
+            up[down[node]] = up[node]
+            size[column[node]] -= 1
+
+    def __unhide_choice(self, choice: int) -> None:
+        up, down, size, column = self.up, self.down, self.size, self.column
+        first = self.first_nodes[choice]
+        for node in range(first + 3, first - 1, -1):
+            down[up[node]] = node
+            up[down[node]] = node
+            size[column[node]] += 1
+
+    def __cover(self, c: int) -> None:
+        left, right, up, down, size, column = self.left, self.right, self.up, self.down, self.size, self.column
+        right[left[c]] = right[c]
+        left[right[c]] = left[c]
+        i = down[c]
+        while i != c:
+            j = right[i]
+            while j != i:
+                down[up[j]] = down[j]
+                up[down[j]] = up[j]
+                size[column[j]] -= 1
+                j = right[j]
+            i = down[i]
+
+    def __uncover(self, c: int) -> None:
+        left, right, up, down, size, column = self.left, self.right, self.up, self.down, self.size, self.column
+        i = up[c]
+        while i != c:
+            j = left[i]
+            while j != i:
+                size[column[j]] += 1
+                down[up[j]] = j
+                up[down[j]] = j
+                j = left[j]
+            i = up[i]
+        right[left[c]] = c
+        left[right[c]] = c
+
+    def __search(self, partial: list[int], solutions: list[list[int]], limit: int) -> None:
+        right, left, down, size, column = self.right, self.left, self.down, self.size, self.column
+        if right[0] == 0:
+            values = [0] * 81
+            for choice in partial:
+                values[choice // 9] = choice % 9 + 1
+            solutions.append(values)
+            return
+        best = c = right[0]
+        best_size = size[c]
+        while c != 0 and best_size > 1:
+            if size[c] < best_size:
+                best = c
+                best_size = size[c]
+            c = right[c]
+        if best_size == 0:
+            return
+        self.__cover(best)
+        r = down[best]
+        while r != best and len(solutions) < limit:
+            partial.append(self.choice[r])
+            j = right[r]
+            while j != r:
+                self.__cover(column[j])
+                j = right[j]
+            self.__search(partial, solutions, limit)
+            j = left[r]
+            while j != r:
+                self.__uncover(column[j])
+                j = left[j]
+            partial.pop()
+            r = down[r]
+        self.__uncover(best)
+
+
+class DancingLinksSolver(SolveStrategy):
+    """
+    This strategy does not attempt to reason about the puzzle the way a person
+    would; it solves the whole puzzle in one step as an exact cover problem
+    using :class:`DancingLinks`, and then sets every cell to its value. It is
+    intended for bulk solving where only the solution matters.
+    """
+
+    def __init__(self) -> None:
+        self.links = DancingLinks()
+
+    def is_last_resort(self) -> bool:
+        return True
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        if puzzle.is_solved():
+            return False
+        solutions = self.links.solve_masks(puzzle.grid.masks)
+        if not solutions:
+            raise UnsolvablePuzzle("Exact cover search found no solution")
+        for index, value in enumerate(solutions[0]):
+            puzzle.grid.must_be_mask(index, option_bit(value))
+        return True
@@ -0,0 +1,76 @@
+import logging
+from typing import Final
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS, ROW_GROUP_OFFSET, COLUMN_GROUP_OFFSET
+from sudoku_solve.bitmask import option_bit, small_union_subsets
+
+logger = logging.getLogger(__name__)
+
+FISH_NAMES: Final[dict[int, str]] = {2: "X-Wing", 3: "Swordfish", 4: "Jellyfish"}
+"""The usual names of fish of each size."""
+
+
+class FishSolver(SolveStrategy):
+    """
+    This strategy finds basic fish: X-Wings, Swordfish, and Jellyfish. When
+    the positions of a value in some number of rows all fall within the same
+    number of columns, each of those columns must have the value in one of
+    those rows, so the value can be eliminated from the rest of the columns.
+    The same holds with rows and columns exchanged.
+
+    The position masks of a value in each row are the columns where it can go,
+    and in each column the rows, so both directions are searched on the
+    puzzle's :class:`PositionIndex` without looking at any cells until there
+    is something to eliminate.
+    """
+
+    def __init__(self, max_size: int = 4) -> None:
+        """
+        :param max_size: The largest fish to look for, from 2 (X-Wing) to 4 (Jellyfish)
+        """
+        assert 2 <= max_size <= 4
+        self.max_size = max_size
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        made_progress = False
+        for value in range(1, 10):
+            for size in range(2, self.max_size + 1):
+                made_progress |= self.__solve_lines(puzzle, value, size, ROW_GROUP_OFFSET, COLUMN_GROUP_OFFSET)
+                made_progress |= self.__solve_lines(puzzle, value, size, COLUMN_GROUP_OFFSET, ROW_GROUP_OFFSET)
+        return made_progress
+
+    @staticmethod
+    def __solve_lines(puzzle: Puzzle, value: int, size: int, base_offset: int, cover_offset: int) -> bool:
+        index = puzzle.position_index()
+        positions = [index.of(base_offset + line, value) for line in range(9)]
+        candidates = [line for line in range(9) if 2 <= positions[line].bit_count() <= size]
+        made_progress = False
+        for fish in small_union_subsets(positions, candidates, size):
+            made_progress |= FishSolver.__eliminate(puzzle, value, fish, base_offset, cover_offset)
+        return made_progress
+
+    @staticmethod
+    def __eliminate(puzzle: Puzzle, value: int, fish: tuple[int, ...], base_offset: int, cover_offset: int) -> bool:
+        index = puzzle.position_index()
+        covers = 0
+        base_lines = 0
+        for line in fish:
+            covers |= index.of(base_offset + line, value)
+            base_lines |= 1 << line
+        if covers.bit_count() < len(fish):
+            raise UnsolvablePuzzle(f"Value {value} has {len(fish)} lines with only {covers.bit_count()} places")
+        grid = puzzle.grid
+        bit = option_bit(value)
+        made_progress = False
+        for cover in range(9):
+            if not covers & (1 << cover):
+                continue
+            outside = index.of(cover_offset + cover, value) & ~base_lines
+            if outside:
+                logger.debug("%s on %d in lines %s eliminates from line %d", FISH_NAMES[len(fish)], value, fish, cover)
+            for position in range(9):
+                if outside & (1 << position):
+                    made_progress |= grid.cant_be_mask(GROUP_CELLS[cover_offset + cover][position], bit)
+        return made_progress
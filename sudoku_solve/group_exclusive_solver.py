@@ -1,6 +1,9 @@
 import logging
 from sudoku_solve.solver import SolveStrategy
-from sudoku_solve.puzzle import Puzzle, CellRelatedGroups, Cell
+from sudoku_solve.puzzle import Puzzle, Cell
+from sudoku_solve.puzzle_index import PEERS
+from sudoku_solve.bitmask import options_of
+from sudoku_solve.trace import Lazy
 
 logger = logging.getLogger(__name__)
 
@@ -17,24 +20,23 @@ class GroupExclusiveSolver(SolveStrategy):
     def solve_puzzle(self, puzzle: Puzzle) -> bool:
         made_progress = False
         for cell in puzzle.unsolved_cells():
-            made_progress |= self.__solve_unsolved_cell(cell, puzzle)
-        logger.debug(f"GroupExclusiveSolver made progress: {made_progress}")
+            made_progress |= self.__solve_unsolved_cell(cell, puzzle.grid.masks)
+        logger.debug("GroupExclusiveSolver made progress: %s", made_progress)
         return made_progress
 
     @staticmethod
-    def __solve_unsolved_cell(c: Cell, puzzle: Puzzle) -> bool:
-        related_groups = puzzle.cell_groups(c)
-        impossible = GroupExclusiveSolver.__solved_values(related_groups)
-        logger.debug(f"Cell options were {c.options}, but can't be {impossible}")
-        if c.cant_be_any(impossible):
+    def __solve_unsolved_cell(c: Cell, masks: list[int]) -> bool:
+        impossible = GroupExclusiveSolver.__solved_values(c, masks)
+        if c.cant_be_mask(impossible):
+            logger.debug("Cell %d can't be %s", c.index, Lazy(options_of, impossible))
             return True
         return False
 
     @staticmethod
-    def __solved_values(related_groups: CellRelatedGroups) -> set[int]:
-        solved: set[int] = set()
-        for group in related_groups.groups:
-            known = group.known_group_values()
-            logger.debug(f"Group has known values {known}")
-            solved.update(group.known_group_values())
+    def __solved_values(c: Cell, masks: list[int]) -> int:
+        solved = 0
+        for peer in PEERS[c.index]:
+            mask = masks[peer]
+            if mask.bit_count() == 1:
+                solved |= mask
         return solved
@@ -0,0 +1,63 @@
+import logging
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS
+from sudoku_solve.bitmask import small_union_subsets, option_bit, options_of
+from sudoku_solve.trace import Lazy
+
+logger = logging.getLogger(__name__)
+
+
+class HiddenSubsetSolver(SolveStrategy):
+    """
+    This strategy finds hidden pairs, triples, and quads: some number of values
+    which, within a group, are only possible in that many cells. Those cells
+    must hold those values, so any other options can be eliminated from them.
+
+    The search works on the puzzle's :class:`PositionIndex`, combining the
+    position masks of values one at a time and abandoning a combination as soon
+    as its values are spread over more cells than the subset size.
+    """
+
+    def __init__(self, max_size: int = 4) -> None:
+        """
+        :param max_size: The largest subset to look for, from 2 to 4
+        """
+        assert 2 <= max_size <= 4
+        self.max_size = max_size
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        made_progress = False
+        index = puzzle.position_index()
+        for group in range(len(GROUP_CELLS)):
+            for size in range(2, self.max_size + 1):
+                positions = index.group_positions(group)
+                candidates = [d for d in range(9) if 2 <= positions[d].bit_count() <= size]
+                subsets = small_union_subsets(positions, candidates, size)
+                for subset in subsets:
+                    made_progress |= self.__restrict(puzzle, group, subset)
+        return made_progress
+
+    @staticmethod
+    def __restrict(puzzle: Puzzle, group: int, subset: tuple[int, ...]) -> bool:
+        positions = puzzle.position_index().group_positions(group)
+        union = 0
+        values = 0
+        for digit in subset:
+            union |= positions[digit]
+            values |= option_bit(digit + 1)
+        if union.bit_count() < len(subset):
+            raise UnsolvablePuzzle(f"Group {group} has {len(subset)} values for only {union.bit_count()} cells")
+        made_progress = False
+        cells = GROUP_CELLS[group]
+        grid = puzzle.grid
+        for position in range(9):
+            if union & (1 << position):
+                index = cells[position]
+                restricted = grid.masks[index] & values
+                if restricted != grid.masks[index]:
+                    logger.debug("Hidden subset %s in group %d restricts cell %d", Lazy(options_of, values), group,
+                                 index)
+                    made_progress |= grid.must_be_mask(index, restricted)
+        return made_progress
@@ -0,0 +1,95 @@
+import logging
+from typing import Final
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS, ROW_GROUP_OFFSET, COLUMN_GROUP_OFFSET, BLOCK_GROUP_OFFSET, \
+    ROW_OF, COLUMN_OF, BLOCK_OF
+from sudoku_solve.bitmask import option_bit
+
+logger = logging.getLogger(__name__)
+
+BLOCK_ROW_POSITIONS: Final[tuple[int, ...]] = (0b000000111, 0b000111000, 0b111000000)
+"""The positions in a block of each of the block's three rows."""
+
+BLOCK_COLUMN_POSITIONS: Final[tuple[int, ...]] = (0b001001001, 0b010010010, 0b100100100)
+"""The positions in a block of each of the block's three columns."""
+
+LINE_THIRD_POSITIONS: Final[tuple[int, ...]] = (0b000000111, 0b000111000, 0b111000000)
+"""The positions in a row or column of the cells in each of the three blocks it crosses."""
+
+
+def eliminate_pointing(puzzle: Puzzle) -> bool:
+    """
+    Where the only positions for a value within a block are in one row or column, eliminate the value from the rest
+    of that row or column.
+
+    :return: `true` if any options were eliminated
+    """
+    index = puzzle.position_index()
+    made_progress = False
+    for block in range(9):
+        group = BLOCK_GROUP_OFFSET + block
+        for value, positions in enumerate(index.group_positions(group), start=1):
+            if not positions:
+                continue
+            for third in range(3):
+                if not positions & ~BLOCK_ROW_POSITIONS[third]:
+                    row = (block // 3) * 3 + third
+                    made_progress |= __eliminate_outside(puzzle, value, ROW_GROUP_OFFSET + row, BLOCK_OF, block)
+                if not positions & ~BLOCK_COLUMN_POSITIONS[third]:
+                    column = (block % 3) * 3 + third
+                    made_progress |= __eliminate_outside(puzzle, value, COLUMN_GROUP_OFFSET + column, BLOCK_OF, block)
+    return made_progress
+
+
+def eliminate_claiming(puzzle: Puzzle) -> bool:
+    """
+    Where the only positions for a value within a row or column are in one block, eliminate the value from the rest of
+    that block. This is also known as box/line reduction.
+
+    :return: `true` if any options were eliminated
+    """
+    index = puzzle.position_index()
+    made_progress = False
+    for line in range(9):
+        for third in range(3):
+            row_positions = index.group_positions(ROW_GROUP_OFFSET + line)
+            column_positions = index.group_positions(COLUMN_GROUP_OFFSET + line)
+            for value in range(1, 10):
+                positions = row_positions[value - 1]
+                if positions and not positions & ~LINE_THIRD_POSITIONS[third]:
+                    block = (line // 3) * 3 + third
+                    made_progress |= __eliminate_outside(puzzle, value, BLOCK_GROUP_OFFSET + block, ROW_OF, line)
+                positions = column_positions[value - 1]
+                if positions and not positions & ~LINE_THIRD_POSITIONS[third]:
+                    block = third * 3 + line // 3
+                    made_progress |= __eliminate_outside(puzzle, value, BLOCK_GROUP_OFFSET + block, COLUMN_OF, line)
+    return made_progress
+
+
+def __eliminate_outside(puzzle: Puzzle, value: int, target_group: int, source_of: tuple[int, ...],
+                        source: int) -> bool:
+    grid = puzzle.grid
+    bit = option_bit(value)
+    made_progress = False
+    for i in GROUP_CELLS[target_group]:
+        if source_of[i] != source and grid.masks[i] & bit:
+            logger.debug("Eliminating %d from cell %d of group %d, confined to %d", value, i, target_group, source)
+            made_progress |= grid.cant_be_mask(i, bit)
+    return made_progress
+
+
+class IntersectionSolver(SolveStrategy):
+    """
+    This strategy covers both kinds of intersection between a block and a line
+    in one pass over the puzzle's shared :class:`PositionIndex`: values which
+    are confined to one line within a block are eliminated from the rest of the
+    line (pointing pairs), and values which are confined to one block within a
+    line are eliminated from the rest of the block (box/line reduction).
+    """
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        made_progress = eliminate_pointing(puzzle)
+        made_progress |= eliminate_claiming(puzzle)
+        return made_progress
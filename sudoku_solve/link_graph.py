@@ -0,0 +1,105 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING, Optional
+
+from sudoku_solve.position_index import PositionIndex
+from sudoku_solve.puzzle_index import GROUP_CELLS, CELL_GROUPS, PEER_BITS
+
+if TYPE_CHECKING:
+    from sudoku_solve.puzzle import CandidateGrid
+
+
+class LinkGraph:
+    """
+    The links between the options of a puzzle used by chain strategies. Two cells are strongly linked on a value when
+    they are the only two places for the value in some group, so one of them must hold it; two cells are weakly linked
+    on a value when they are peers which both have the value as an option, so at most one of them can hold it. A cell
+    with only two options links those two values in the same way.
+
+    Cells are represented as 81-bit sets, where bit `n` is the cell with index `n`. The graph listens to the puzzle's
+    grid: the cells with each value and the two-option cells are updated as options change, while strong links are
+    only marked stale for the groups and values a change touched and are looked up again from the
+    :class:`PositionIndex` the next time they are needed.
+    """
+
+    def __init__(self, grid: CandidateGrid, index: PositionIndex) -> None:
+        self.index = index
+        self.candidates = [0] * 9
+        self.bivalue = 0
+        for i, mask in enumerate(grid.masks):
+            for digit in range(9):
+                if mask & (1 << digit):
+                    self.candidates[digit] |= 1 << i
+            if mask.bit_count() == 2:
+                self.bivalue |= 1 << i
+        self.__conjugates: list[Optional[tuple[int, int]]] = [None] * (len(GROUP_CELLS) * 9)
+        self.__stale = set(range(len(GROUP_CELLS) * 9))
+        self.__strong: list[Optional[dict[int, list[int]]]] = [None] * 9
+        grid.add_listener(self.__cell_changed)
+
+    def cells_with(self, value: int) -> int:
+        """
+        Returns the set of cells which have a value as an option.
+        :param value: A value from 1 to 9
+        """
+        return self.candidates[value - 1]
+
+    def weak_links(self, index: int, value: int) -> int:
+        """
+        Returns the set of peers of a cell which also have a value as an option.
+        :param index: A cell index
+        :param value: A value from 1 to 9
+        """
+        return PEER_BITS[index] & self.candidates[value - 1]
+
+    def conjugate(self, group: int, value: int) -> Optional[tuple[int, int]]:
+        """
+        Returns the two cells which are the only places for a value in a group, or `None` if there are more or fewer.
+        :param group: A group index, as in :data:`GROUP_CELLS`
+        :param value: A value from 1 to 9
+        """
+        key = group * 9 + value - 1
+        if key in self.__stale:
+            self.__stale.discard(key)
+            positions = self.index.positions[key]
+            if positions.bit_count() == 2:
+                low = positions & -positions
+                cells = GROUP_CELLS[group]
+                self.__conjugates[key] = (cells[low.bit_length() - 1], cells[(positions ^ low).bit_length() - 1])
+            else:
+                self.__conjugates[key] = None
+        return self.__conjugates[key]
+
+    def strong_links(self, value: int) -> dict[int, list[int]]:
+        """
+        Returns the cells strongly linked to each cell on a value, for the cells which have any. The result is cached
+        until an option of the value changes, and must not be modified.
+        :param value: A value from 1 to 9
+        """
+        strong = self.__strong[value - 1]
+        if strong is None:
+            strong = {}
+            for group in range(len(GROUP_CELLS)):
+                pair = self.conjugate(group, value)
+                if pair is not None:
+                    a, b = pair
+                    if b not in strong.setdefault(a, []):
+                        strong[a].append(b)
+                        strong.setdefault(b, []).append(a)
+            self.__strong[value - 1] = strong
+        return strong
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        changed = old_mask ^ new_mask
+        cell_bit = 1 << index
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            digit = bit.bit_length() - 1
+            self.candidates[digit] ^= cell_bit
+            self.__strong[digit] = None
+            for group in CELL_GROUPS[index]:
+                self.__stale.add(group * 9 + digit)
+        if new_mask.bit_count() == 2:
+            self.bivalue |= cell_bit
+        else:
+            self.bivalue &= ~cell_bit
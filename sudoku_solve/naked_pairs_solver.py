@@ -4,6 +4,8 @@ from typing import Optional
 
 from sudoku_solve.solver import SolveStrategy
 from sudoku_solve.puzzle import Puzzle, Cell, UnsolvablePuzzle, CellGroup
+from sudoku_solve.bitmask import options_of
+from sudoku_solve.trace import Lazy
 
 logger = logging.getLogger(__name__)
 
@@ -14,7 +16,7 @@ class NakedPairsSolver(SolveStrategy):
     two options. Because one of each of the two cells must be one of each of the
     two options, we can eliminate both options from all other cells in the group.
 
-    TODO: This strategy should be improved to work with triples, quads, etc.
+    See :class:`NakedSubsetSolver` for triples and quads.
     """
 
     def solve_puzzle(self, puzzle: Puzzle) -> bool:
@@ -28,14 +30,14 @@ class NakedPairsSolver(SolveStrategy):
 
     @staticmethod
     def __cells_with_two_options(group: CellGroup) -> Optional[list[Cell]]:
-        has_two_options = [c for c in group.cells if len(c.options) == 2]
+        has_two_options = [c for c in group.cells if c.mask.bit_count() == 2]
         return has_two_options if len(has_two_options) >= 2 else None
 
     @staticmethod
     def __find_naked_pairs(cells: list[Cell]) -> list[list[Cell]]:
         naked_pairs: list[list[Cell]] = []
-        sorted_cells = sorted(cells, key=lambda c: c.options)
-        groups = groupby(sorted_cells, key=lambda c: c.options)
+        sorted_cells = sorted(cells, key=lambda c: c.mask)
+        groups = groupby(sorted_cells, key=lambda c: c.mask)
         for options, cell_group in groups:
             maybe_pair = list(cell_group)
             count = len(maybe_pair)
@@ -48,14 +50,13 @@ class NakedPairsSolver(SolveStrategy):
 
     @staticmethod
     def __update_other_cells(naked_pair: list[Cell], group: CellGroup) -> bool:
-        logger.debug(f"Found naked pair of cells {naked_pair}")
-        logger.debug(f" - Naked pair in group {group}")
+        logger.debug("Found naked pair of cells %s in group %s", naked_pair, Lazy(group.name))
         made_progress = False
+        pair_mask = naked_pair[0].mask
         for cell in group.cells:
             if cell not in naked_pair:
-                options_before = set(cell.options)
-                if cell.cant_be_any(naked_pair[0].options):
-                    logger.debug(
-                        f" - Naked pair eliminated options {naked_pair[0].options} at {cell.name()} from {options_before} to {cell.options}")
+                if cell.cant_be_mask(pair_mask):
+                    logger.debug(" - Naked pair eliminated options %s at %s", Lazy(options_of, pair_mask),
+                                 Lazy(cell.name))
                     made_progress = True
         return made_progress
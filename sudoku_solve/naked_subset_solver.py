@@ -0,0 +1,64 @@
+import logging
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, CandidateGrid, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS
+from sudoku_solve.bitmask import small_union_subsets, options_of
+from sudoku_solve.trace import Lazy
+
+logger = logging.getLogger(__name__)
+
+
+class NakedSubsetSolver(SolveStrategy):
+    """
+    This strategy generalises :class:`NakedPairsSolver` to naked triples and
+    quads: when the options of some number of cells in a group, taken together,
+    are only that many values, those cells must hold those values, and the
+    values can be eliminated from all other cells in the group.
+
+    Combinations of cells are built up one cell at a time while keeping the
+    union of their option masks, and a combination is abandoned as soon as its
+    union has more values than the subset size, which keeps the search cheap on
+    groups with many unsolved cells.
+    """
+
+    def __init__(self, max_size: int = 4) -> None:
+        """
+        :param max_size: The largest subset to look for, from 2 to 4
+        """
+        assert 2 <= max_size <= 4
+        self.max_size = max_size
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        made_progress = False
+        for group, cells in enumerate(GROUP_CELLS):
+            made_progress |= self.__solve_group(puzzle.grid, group, cells)
+        return made_progress
+
+    def __solve_group(self, grid: CandidateGrid, group: int, cells: tuple[int, ...]) -> bool:
+        made_progress = False
+        for size in range(2, self.max_size + 1):
+            masks = grid.masks
+            unsolved = [i for i in cells if masks[i].bit_count() > 1]
+            if len(unsolved) <= size:
+                break
+            candidates = [i for i in unsolved if masks[i].bit_count() <= size]
+            subsets = small_union_subsets(masks, candidates, size)
+            for subset in subsets:
+                made_progress |= self.__eliminate(grid, group, unsolved, subset)
+        return made_progress
+
+    @staticmethod
+    def __eliminate(grid: CandidateGrid, group: int, unsolved: list[int], subset: tuple[int, ...]) -> bool:
+        union = 0
+        for i in subset:
+            union |= grid.masks[i]
+        if union.bit_count() < len(subset):
+            raise UnsolvablePuzzle(f"Group {group} has {len(subset)} cells with only {union.bit_count()} options")
+        logger.debug("Found naked subset of cells %s for options %s in group %d", subset, Lazy(options_of, union),
+                     group)
+        made_progress = False
+        for i in unsolved:
+            if i not in subset:
+                made_progress |= grid.cant_be_mask(i, union)
+        return made_progress
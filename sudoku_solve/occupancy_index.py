@@ -0,0 +1,66 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from sudoku_solve.puzzle_index import GROUP_CELLS, CELL_GROUPS
+
+if TYPE_CHECKING:
+    from sudoku_solve.puzzle import CandidateGrid
+
+
+class OccupancyIndex:
+    """
+    Counts the known cells of a grid, and for each group and value the known cells in the group with that value. The
+    index listens to the grid and is kept up to date as options change, so whether the puzzle is valid or solved is
+    known without looking at any cells, and a conflict is counted as soon as the assignment which causes it is made.
+    """
+
+    def __init__(self, grid: CandidateGrid) -> None:
+        self.known = 0
+        """The number of cells with exactly one option."""
+        self.empty = 0
+        """The number of cells with no options left."""
+        self.conflicts = 0
+        """The number of groups and values with more than one known cell."""
+        self.occupancy = [0] * (len(GROUP_CELLS) * 9)
+        """The number of known cells with each value in each group, at `group * 9 + value - 1`."""
+        for index, mask in enumerate(grid.masks):
+            self.__add(index, mask)
+        grid.add_listener(self.__cell_changed)
+
+    def is_valid(self) -> bool:
+        """
+        Returns `true` if every cell has an option and no value is known in two cells of one group.
+        """
+        return not self.conflicts and not self.empty
+
+    def is_solved(self) -> bool:
+        """
+        Returns `true` if the grid is valid and every cell is known.
+        """
+        return self.known == 81 and not self.conflicts
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        self.__remove(index, old_mask)
+        self.__add(index, new_mask)
+
+    def __add(self, index: int, mask: int) -> None:
+        if mask.bit_count() == 1:
+            self.known += 1
+            for group in CELL_GROUPS[index]:
+                key = group * 9 + mask.bit_length() - 1
+                self.occupancy[key] += 1
+                if self.occupancy[key] == 2:
+                    self.conflicts += 1
+        elif not mask:
+            self.empty += 1
+
+    def __remove(self, index: int, mask: int) -> None:
+        if mask.bit_count() == 1:
+            self.known -= 1
+            for group in CELL_GROUPS[index]:
+                key = group * 9 + mask.bit_length() - 1
+                self.occupancy[key] -= 1
+                if self.occupancy[key] == 1:
+                    self.conflicts -= 1
+        elif not mask:
+            self.empty -= 1
@@ -1,11 +1,11 @@
 import logging
 
 from sudoku_solve.solver import SolveStrategy
-from sudoku_solve.puzzle import Puzzle
-from sudoku_solve.util import single
+from sudoku_solve.puzzle import Puzzle, CellGroup, UnsolvablePuzzle
+from sudoku_solve.bitmask import values_of, option_bit
+from sudoku_solve.trace import Lazy
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
 
 class OnlyOptionSolver(SolveStrategy):
@@ -18,11 +18,20 @@ class OnlyOptionSolver(SolveStrategy):
     def solve_puzzle(self, puzzle: Puzzle) -> bool:
         made_progress = False
         for group in puzzle.groups:
-            options_with_one_cell = {option: single(cells) for option, cells in group.cells_by_option(True).items()
-                                     if len(cells) == 1}
+            options_with_one_cell = {value: next(c for c in group.cells if c.mask & option_bit(value))
+                                     for value in values_of(self.__options_in_one_cell(group))}
             for value, cell in options_with_one_cell.items():
-                logger.debug(f"Only option for {value} in {group.name()} is {cell.name()}")
+                logger.debug("Only option for %d in %s is %s", value, Lazy(group.name), Lazy(cell.name))
                 made_progress |= cell.must_be(value)
                 if not puzzle.is_valid():
-                    raise RuntimeError("Invalid puzzle")
+                    raise UnsolvablePuzzle(f"Setting {cell.name()} to {value} made the puzzle invalid")
         return made_progress
+
+    @staticmethod
+    def __options_in_one_cell(group: CellGroup) -> int:
+        seen_once = 0
+        seen_more = 0
+        for mask in group.masks():
+            seen_more |= seen_once & mask
+            seen_once |= mask
+        return seen_once & ~seen_more
@@ -0,0 +1,50 @@
+from __future__ import annotations
+from typing import TYPE_CHECKING
+
+from sudoku_solve.puzzle_index import GROUP_CELLS, CELL_GROUP_POSITIONS
+
+if TYPE_CHECKING:
+    from sudoku_solve.puzzle import CandidateGrid
+
+
+class PositionIndex:
+    """
+    For each group and value, a 9-bit mask of the positions within the group of the cells which have the value as an
+    option; bit `n` is the cell at `GROUP_CELLS[group][n]`. The index listens to the puzzle's grid and is kept up to
+    date as options change, so strategies looking for where a value can go in a group don't need to scan the cells.
+    """
+
+    def __init__(self, grid: CandidateGrid) -> None:
+        self.positions = [0] * (len(GROUP_CELLS) * 9)
+        for group, cells in enumerate(GROUP_CELLS):
+            for position, index in enumerate(cells):
+                mask = grid.masks[index]
+                while mask:
+                    bit = mask & -mask
+                    self.positions[group * 9 + bit.bit_length() - 1] |= 1 << position
+                    mask ^= bit
+        grid.add_listener(self.__cell_changed)
+
+    def of(self, group: int, value: int) -> int:
+        """
+        Returns the mask of positions in a group which have a value as an option.
+        :param group: A group index, as in :data:`GROUP_CELLS`
+        :param value: A value from 1 to 9
+        """
+        return self.positions[group * 9 + value - 1]
+
+    def group_positions(self, group: int) -> list[int]:
+        """
+        Returns the position masks of each value in a group, indexed by `value - 1`.
+        """
+        return self.positions[group * 9:group * 9 + 9]
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        changed = old_mask ^ new_mask
+        positions = self.positions
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            digit = bit.bit_length() - 1
+            for group, position in CELL_GROUP_POSITIONS[index]:
+                positions[group * 9 + digit] ^= 1 << position
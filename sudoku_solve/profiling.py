@@ -0,0 +1,134 @@
+"""
+Built-in :class:`SolverHook` implementations for finding where the time goes in a solve: :class:`ProfileHook` keeps a
+separate cProfile profile for each strategy, and :class:`SpanHook` records a span for each strategy application which
+can be exported for flame graph and trace viewers.
+"""
+import cProfile
+import json
+import pstats
+import time
+from dataclasses import dataclass, field
+from typing import Optional, TextIO
+
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.solver import SolverHook, SolveStrategy
+
+
+class ProfileHook(SolverHook):
+    """
+    Profiles each strategy separately with :mod:`cProfile`, enabling the strategy's profiler only while the strategy
+    is being applied. One hook can be added to many solvers to build up profiles across a stream of puzzles.
+    """
+
+    def __init__(self) -> None:
+        self.profiles: dict[str, cProfile.Profile] = {}
+        self.__active: Optional[cProfile.Profile] = None
+
+    def before_strategy(self, puzzle: Puzzle, strategy: SolveStrategy) -> None:
+        name = strategy.strategy_name()
+        profile = self.profiles.get(name)
+        if profile is None:
+            profile = self.profiles[name] = cProfile.Profile()
+        self.__disable()
+        self.__active = profile
+        profile.enable()
+
+    def after_strategy(self, puzzle: Puzzle, strategy: SolveStrategy, made_progress: bool, nanoseconds: int) -> None:
+        self.__disable()
+
+    def on_contradiction(self, puzzle: Puzzle, strategy: SolveStrategy, error: Exception) -> None:
+        self.__disable()
+
+    def __disable(self) -> None:
+        if self.__active is not None:
+            self.__active.disable()
+            self.__active = None
+
+    def stats(self, strategy: str) -> pstats.Stats:
+        """
+        Returns the profile statistics collected for a strategy.
+        :param strategy: The strategy name
+        """
+        return pstats.Stats(self.profiles[strategy])
+
+    def dump(self, directory: str) -> list[str]:
+        """
+        Write the profile of each strategy to `<directory>/<strategy>.prof`, in the format read by :mod:`pstats` and
+        tools such as snakeviz.
+        :return: The paths written
+        """
+        paths = []
+        for name, profile in sorted(self.profiles.items()):
+            path = f"{directory}/{name}.prof"
+            profile.dump_stats(path)
+            paths.append(path)
+        return paths
+
+
+@dataclass
+class Span:
+    """
+    One application of a strategy.
+    """
+    strategy: str
+    start_ns: int
+    duration_ns: int
+    made_progress: bool
+    contradiction: bool = False
+
+
+@dataclass
+class SpanHook(SolverHook):
+    """
+    Records a :class:`Span` for each strategy application, keeping at most `max_spans` of them. Spans can be exported
+    as folded stacks for flame graph tools, or as Chrome trace events for trace viewers such as Perfetto.
+    """
+    root: str = "solve"
+    """The name of the frame all strategy frames are nested under in exported stacks."""
+    max_spans: int = 100_000
+    spans: list[Span] = field(default_factory=list)
+    dropped: int = 0
+    _start: int = field(default=0, init=False, repr=False)
+    _current: Optional[Span] = field(default=None, init=False, repr=False)
+    """The span of the latest application, `None` if it was dropped."""
+
+    def before_strategy(self, puzzle: Puzzle, strategy: SolveStrategy) -> None:
+        self._current = None
+        self._start = time.perf_counter_ns()
+
+    def after_strategy(self, puzzle: Puzzle, strategy: SolveStrategy, made_progress: bool, nanoseconds: int) -> None:
+        if len(self.spans) < self.max_spans:
+            self._current = Span(strategy.strategy_name(), self._start, nanoseconds, made_progress)
+            self.spans.append(self._current)
+        else:
+            self.dropped += 1
+
+    def on_contradiction(self, puzzle: Puzzle, strategy: SolveStrategy, error: Exception) -> None:
+        if self._current is not None:
+            self._current.contradiction = True
+
+    def folded(self) -> str:
+        """
+        Returns the time spent in each strategy as folded stacks, one `root;strategy microseconds` line per strategy,
+        the input format of flamegraph.pl, inferno, and speedscope.
+        """
+        totals: dict[str, int] = {}
+        for span in self.spans:
+            totals[span.strategy] = totals.get(span.strategy, 0) + span.duration_ns
+        return ''.join(f"{self.root};{name} {ns // 1000}\n" for name, ns in sorted(totals.items()))
+
+    def write_chrome_trace(self, out: TextIO) -> None:
+        """
+        Write the spans as a JSON array of Chrome trace "complete" events, with times in microseconds.
+        """
+        events = [{
+            "name": span.strategy,
+            "cat": self.root,
+            "ph": "X",
+            "ts": span.start_ns / 1000,
+            "dur": span.duration_ns / 1000,
+            "pid": 0,
+            "tid": 0,
+            "args": {"made_progress": span.made_progress, "contradiction": span.contradiction},
+        } for span in self.spans]
+        json.dump(events, out)
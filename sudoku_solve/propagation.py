@@ -0,0 +1,115 @@
+from __future__ import annotations
+import logging
+from typing import Optional
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import PEERS, GROUP_CELLS, CELL_GROUPS
+from sudoku_solve.bitmask import ALL_OPTIONS_MASK
+
+logger = logging.getLogger(__name__)
+
+
+class Propagator:
+    """
+    Incrementally propagates the basic constraints of a puzzle. The propagator listens for changes to the puzzle's
+    grid, and keeps a queue of cells which became known and a set of groups which contain changed cells. Propagating
+    only examines that dirty work: a newly known value is removed from the cell's peers, and a dirty group is checked
+    for values which are only possible in one of its cells. Any change made along the way queues more work, until no
+    work is left.
+    """
+
+    def __init__(self, puzzle: Puzzle) -> None:
+        self.puzzle = puzzle
+        masks = puzzle.grid.masks
+        self.known_cells: list[int] = [i for i, m in enumerate(masks) if m.bit_count() == 1]
+        self.dirty_groups: set[int] = set(range(len(GROUP_CELLS)))
+        puzzle.grid.add_listener(self.__cell_changed)
+
+    def detach(self) -> None:
+        """
+        Stop listening for changes to the puzzle.
+        """
+        self.puzzle.grid.remove_listener(self.__cell_changed)
+
+    def propagate(self) -> bool:
+        """
+        Process the queued work until no more is left.
+
+        :return: `true` if any options were eliminated
+        """
+        made_progress = False
+        while self.known_cells or self.dirty_groups:
+            while self.known_cells:
+                made_progress |= self.__eliminate_from_peers(self.known_cells.pop())
+            if self.dirty_groups:
+                made_progress |= self.__find_only_options(self.dirty_groups.pop())
+        return made_progress
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        if new_mask.bit_count() == 1:
+            self.known_cells.append(index)
+        self.dirty_groups.update(CELL_GROUPS[index])
+
+    def __eliminate_from_peers(self, index: int) -> bool:
+        grid = self.puzzle.grid
+        value_mask = grid.masks[index]
+        if value_mask.bit_count() != 1:
+            # The cell's options were restored after it was queued
+            return False
+        made_progress = False
+        for peer in PEERS[index]:
+            made_progress |= grid.cant_be_mask(peer, value_mask)
+        return made_progress
+
+    def __find_only_options(self, group: int) -> bool:
+        grid = self.puzzle.grid
+        masks = grid.masks
+        cells = GROUP_CELLS[group]
+        seen_once = 0
+        seen_more = 0
+        known = 0
+        for i in cells:
+            mask = masks[i]
+            seen_more |= seen_once & mask
+            seen_once |= mask
+            if mask.bit_count() == 1:
+                known |= mask
+        if seen_once != ALL_OPTIONS_MASK:
+            raise UnsolvablePuzzle(f"Group {group} has no place for some value")
+        only_options = seen_once & ~seen_more & ~known
+        targets = [(i, masks[i] & only_options) for i in cells if masks[i] & only_options]
+        made_progress = False
+        for index, bits in targets:
+            if bits.bit_count() > 1:
+                raise UnsolvablePuzzle(f"Cell {index} is the only place for more than one value")
+            made_progress |= grid.must_be_mask(index, bits)
+        return made_progress
+
+
+class PropagationSolver(SolveStrategy):
+    """
+    This strategy combines the eliminations of :class:`GroupExclusiveSolver` and
+    :class:`OnlyOptionSolver`, but rather than sweeping every cell and group
+    each time it is applied, it uses a :class:`Propagator` to examine only the
+    cells and groups which changed since it last ran, continuing until no
+    further progress can be made.
+    """
+
+    def __init__(self) -> None:
+        self.__propagator: Optional[Propagator] = None
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        propagator = self.__propagator
+        if propagator is None or propagator.puzzle is not puzzle:
+            if propagator is not None:
+                propagator.detach()
+            propagator = self.__propagator = Propagator(puzzle)
+        made_progress = propagator.propagate()
+        logger.debug("PropagationSolver made progress: %s", made_progress)
+        return made_progress
+
+    def detach(self) -> None:
+        if self.__propagator is not None:
+            self.__propagator.detach()
+            self.__propagator = None
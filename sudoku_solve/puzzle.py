@@ -2,11 +2,16 @@ from __future__ import annotations
 import logging
 
 from dataclasses import dataclass, field
+from typing import Callable, Iterable, Optional
 
-from sudoku_solve.util import single
+from sudoku_solve.bitmask import ALL_OPTIONS_MASK, mask_of, options_of, option_bit, single_value
+from sudoku_solve.position_index import PositionIndex
+from sudoku_solve.link_graph import LinkGraph
+from sudoku_solve.occupancy_index import OccupancyIndex
+from sudoku_solve.puzzle_index import ROW_OF, COLUMN_OF, BLOCK_OF, GROUP_CELLS, BLOCK_GROUP_OFFSET, PEERS
+from sudoku_solve.trace import Lazy
 
 logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
 
 
 class UnsolvablePuzzle(Exception):
@@ -17,58 +22,189 @@ class MalformedPuzzle(Exception):
     pass
 
 
+class AmbiguousPuzzle(Exception):
+    pass
+
+
+GridListener = Callable[[int, int, int], None]
+
+
 def set_of_all_options() -> set[int]:
     return {1, 2, 3, 4, 5, 6, 7, 8, 9}
 
 
 @dataclass
+class CandidateGrid:
+    """
+    The options of a set of cells, stored as 9-bit masks in one flat list. A puzzle's grid holds all 81 cells, indexed
+    by `y_pos * 9 + x_pos`.
+    """
+    masks: list[int] = field(default_factory=lambda: [ALL_OPTIONS_MASK] * 81)
+    listeners: list[GridListener] = field(default_factory=list, repr=False, compare=False)
+
+    def add_listener(self, listener: GridListener) -> None:
+        """
+        Register a function to be called with the cell index, the old mask, and the new mask each time the options of
+        a cell change.
+        """
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: GridListener) -> None:
+        self.listeners.remove(listener)
+
+    def is_known(self, index: int) -> bool:
+        return self.masks[index].bit_count() == 1
+
+    def must_be_mask(self, index: int, mask: int) -> bool:
+        current = self.masks[index]
+        if mask & ~current:
+            raise UnsolvablePuzzle("Forcing value set includes non-option")
+        if mask == current:
+            return False
+        self.masks[index] = mask
+        for listener in self.listeners:
+            listener(index, current, mask)
+        return True
+
+    def cant_be_mask(self, index: int, mask: int) -> bool:
+        current = self.masks[index]
+        if not current & mask:
+            return False
+        remaining = current & ~mask
+        if not remaining:
+            raise UnsolvablePuzzle("Removed last option for cell")
+        self.masks[index] = remaining
+        for listener in self.listeners:
+            listener(index, current, remaining)
+        return True
+
+    def score(self) -> int:
+        return sum(m.bit_count() for m in self.masks) - len(self.masks)
+
+    def snapshot(self) -> list[int]:
+        """
+        Returns a copy of the masks of every cell, which can later be passed to :meth:`restore`.
+        """
+        return self.masks.copy()
+
+    def reset_mask(self, index: int, mask: int) -> bool:
+        """
+        Replace the options of one cell, notifying listeners if they change. Unlike :meth:`must_be_mask` and
+        :meth:`cant_be_mask`, this may add options back to the cell.
+        :return: `true` if the options of the cell changed
+        """
+        current = self.masks[index]
+        if current == mask:
+            return False
+        self.masks[index] = mask
+        for listener in self.listeners:
+            listener(index, current, mask)
+        return True
+
+    def restore(self, masks: list[int]) -> None:
+        """
+        Replace the options of every cell with previously copied masks. Listeners are called for each cell which
+        changes; unlike other changes, restoring may add options back to a cell.
+        :param masks: Masks copied from this grid
+        """
+        assert len(masks) == len(self.masks)
+        for index, (current, mask) in enumerate(zip(self.masks, masks)):
+            if current != mask:
+                self.masks[index] = mask
+                for listener in self.listeners:
+                    listener(index, current, mask)
+
+    def load(self, masks: list[int]) -> None:
+        """
+        Replace the options of every cell with a new state that need not be related to the current one. Unlike
+        :meth:`restore`, listeners are called for every cell, including those which don't change, so that listeners
+        which queue work for changed cells see the whole grid as new.
+        :param masks: The new masks
+        """
+        assert len(masks) == len(self.masks)
+        for index, mask in enumerate(masks):
+            current = self.masks[index]
+            self.masks[index] = mask
+            for listener in self.listeners:
+                listener(index, current, mask)
+
+
 class Cell:
     """
-    A Cell in a sudoku puzzle
+    A Cell in a sudoku puzzle.
+
+    The options of a cell are held as a bit mask in a :class:`CandidateGrid`. A cell created on its own has a grid of
+    its own, once the cell is part of a :class:`Puzzle` its options live in the puzzle's grid.
     """
-    x_pos: int
-    y_pos: int
-    options: set[int] = field(default_factory=set_of_all_options)
+    __slots__ = ("x_pos", "y_pos", "grid", "slot")
+
+    def __init__(self, x_pos: int, y_pos: int, options: set[int] | None = None) -> None:
+        self.x_pos = x_pos
+        self.y_pos = y_pos
+        self.grid = CandidateGrid([ALL_OPTIONS_MASK if options is None else mask_of(options)])
+        self.slot = 0
+
+    def __repr__(self) -> str:
+        return f"Cell(x_pos={self.x_pos}, y_pos={self.y_pos}, options={self.options})"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Cell):
+            return NotImplemented
+        return self.x_pos == other.x_pos and self.y_pos == other.y_pos and self.mask == other.mask
+
+    __hash__ = None  # type: ignore[assignment]
+
+    @property
+    def index(self) -> int:
+        return self.y_pos * 9 + self.x_pos
+
+    @property
+    def mask(self) -> int:
+        return self.grid.masks[self.slot]
+
+    @property
+    def options(self) -> set[int]:
+        return options_of(self.grid.masks[self.slot])
+
+    def bind(self, grid: CandidateGrid, slot: int) -> None:
+        """
+        Move the options of this cell into a slot of another grid.
+        :param grid: The grid which will hold the options of this cell
+        :param slot: The index of this cell in `grid`
+        """
+        grid.masks[slot] = self.grid.masks[self.slot]
+        self.grid = grid
+        self.slot = slot
 
     def name(self) -> str:
         return f"Cell({self.x_pos, self.y_pos})"
 
     def is_known(self) -> bool:
-        return len(self.options) == 1
+        return self.grid.masks[self.slot].bit_count() == 1
 
     def value(self) -> int:
         assert self.is_known()
-        return single(list(self.options))
+        return single_value(self.grid.masks[self.slot])
 
     def must_be(self, value: int) -> bool:
-        if value not in self.options:
+        if not self.grid.masks[self.slot] & option_bit(value):
             raise UnsolvablePuzzle("Forcing value that is not an option")
-        if self.options == {value}:
-            return False
-        self.options.clear()
-        self.options.add(value)
-        return True
+        return self.grid.must_be_mask(self.slot, option_bit(value))
 
     def must_be_any(self, values: set[int]) -> bool:
-        if not values.issubset(self.options):
-            raise UnsolvablePuzzle("Forcing value set includes non-option")
-        assert values.issubset(self.options)
-        if values != self.options:
-            self.options.clear()
-            self.options.update(values)
-            return True
-        return False
+        return self.grid.must_be_mask(self.slot, mask_of(values))
+
+    def must_be_mask(self, mask: int) -> bool:
+        return self.grid.must_be_mask(self.slot, mask)
 
     def cant_be(self, value: int) -> bool:
-        if value in self.options:
-            self.options.remove(value)
-            if not self.options:
-                raise UnsolvablePuzzle("Removed last option for cell")
-            return True
-        return False
+        return self.grid.cant_be_mask(self.slot, option_bit(value))
 
     def cant_be_any(self, values: set[int]) -> bool:
-        return any([self.cant_be(v) for v in values])
+        return self.grid.cant_be_mask(self.slot, mask_of(values))
+
+    def cant_be_mask(self, mask: int) -> bool:
+        return self.grid.cant_be_mask(self.slot, mask)
 
 
 @dataclass
@@ -85,24 +221,38 @@ class CellGroup:
     def known_cells(self) -> list[Cell]:
         return [c for c in self.cells if c.is_known()]
 
+    def masks(self) -> list[int]:
+        return [c.mask for c in self.cells]
+
+    def known_mask(self) -> int:
+        """
+        Returns the mask of the values of all known cells in the group.
+        """
+        known = 0
+        for m in self.masks():
+            if m.bit_count() == 1:
+                known |= m
+        return known
+
     def is_valid(self) -> bool:
-        options = set_of_all_options()
-        for c in self.known_cells():
-            if c.value() in options:
-                options.remove(c.value())
-            else:
-                return False
+        known = 0
+        for m in self.masks():
+            if m.bit_count() == 1:
+                if known & m:
+                    return False
+                known |= m
         return True
 
     def known_group_values(self) -> set[int]:
-        return set(c.value() for c in self.cells if c.is_known())
+        return options_of(self.known_mask())
 
     def unknown_group_values(self) -> set[int]:
-        return set_of_all_options().difference(self.known_group_values())
+        return options_of(ALL_OPTIONS_MASK & ~self.known_mask())
 
     def cells_with_option(self, option: int, include_known: bool = False) -> list[Cell]:
-        result = [c for c in self.cells if option in c.options and (include_known or not c.is_known())]
-        logger.debug(f"Group {self.name()} cells with {option} (include_know: {include_known}): {result}")
+        bit = option_bit(option)
+        result = [c for c in self.cells if c.mask & bit and (include_known or c.mask != bit)]
+        logger.debug("Group %s cells with %d (include_known: %s): %s", Lazy(self.name), option, include_known, result)
         return result
 
     def cells_by_option(self, include_known: bool = False) -> dict[int, list[Cell]]:
@@ -162,12 +312,20 @@ class Puzzle:
     blocks: list[CellBlock] = field(init=False)
     cells: list[Cell] = field(init=False)
     groups: list[CellRow | CellColumn | CellBlock] = field(init=False)
+    grid: CandidateGrid = field(init=False, repr=False, compare=False)
+    occupancy: OccupancyIndex = field(init=False, repr=False, compare=False)
+    _position_index: Optional[PositionIndex] = field(init=False, default=None, repr=False, compare=False)
+    _link_graph: Optional[LinkGraph] = field(init=False, default=None, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self.columns = [self.__column(i) for i in range(9)]
         self.blocks = [self.__block(i) for i in range(9)]
         self.groups = self.rows + self.columns + self.blocks
         self.cells = [c for row in self.rows for c in row.cells]
+        self.grid = CandidateGrid()
+        for c in self.cells:
+            c.bind(self.grid, c.index)
+        self.occupancy = OccupancyIndex(self.grid)
         return
 
     def __column(self, index: int) -> CellColumn:
@@ -175,30 +333,79 @@ class Puzzle:
 
     def __block(self, index: int) -> CellBlock:
         assert 0 <= index < 9
-        x = (index // 3) * 3
-        y = (index % 3) * 3
-        group = self.rows[x].cells[y:y + 3] + self.rows[x + 1].cells[y:y + 3] + self.rows[x + 2].cells[y:y + 3]
-        return CellBlock(group, index)
+        return CellBlock([self.rows[i // 9].cells[i % 9] for i in GROUP_CELLS[BLOCK_GROUP_OFFSET + index]], index)
 
     def is_valid(self) -> bool:
-        return all(g.is_valid() for g in self.groups) and all(c.options for c in self.cells)
+        return self.occupancy.is_valid()
 
     def is_solved(self) -> bool:
-        return self.is_valid() and all(c.is_known() for c in self.cells)
+        return self.occupancy.is_solved()
 
     def unsolved_cells(self) -> list[Cell]:
         return [c for c in self.cells if not c.is_known()]
 
     def cell_groups(self, cell: Cell) -> CellRelatedGroups:
-        return CellRelatedGroups(
-            cell,
-            single([r for r in self.rows if cell in r.cells]),
-            single([c for c in self.columns if cell in c.cells]),
-            single([b for b in self.blocks if cell in b.cells]),
-        )
+        index = cell.index
+        return CellRelatedGroups(cell, self.rows[ROW_OF[index]], self.columns[COLUMN_OF[index]],
+                                 self.blocks[BLOCK_OF[index]])
+
+    def peers(self, cell: Cell) -> list[Cell]:
+        """
+        Returns the 20 other cells which share a row, column, or block with a cell.
+        """
+        return [self.cells[p] for p in PEERS[cell.index]]
 
     def score(self) -> int:
-        return sum(len(c.options) for c in self.cells) - 81
+        return self.grid.score()
+
+    def position_index(self) -> PositionIndex:
+        """
+        Returns the index of where each value can go in each group, creating it the first time it is needed. Once
+        created, the index is kept up to date as the puzzle changes and shared by all strategies.
+        """
+        if self._position_index is None:
+            self._position_index = PositionIndex(self.grid)
+        return self._position_index
+
+    def link_graph(self) -> LinkGraph:
+        """
+        Returns the graph of links between options used by chain strategies, creating it the first time it is needed.
+        Like the position index, the graph is kept up to date as the puzzle changes and shared by all strategies.
+        """
+        if self._link_graph is None:
+            self._link_graph = LinkGraph(self.grid, self.position_index())
+        return self._link_graph
+
+    def snapshot(self) -> list[int]:
+        """
+        Returns a copy of the options of every cell as a flat list of 81 masks. Taking a snapshot copies the list and
+        nothing else; the cells and groups of the puzzle are views onto its grid and need no copying.
+        """
+        return self.grid.snapshot()
+
+    def restore(self, snapshot: list[int]) -> None:
+        """
+        Return every cell to the options it had when a snapshot was taken. The position index, link graph, and any
+        other listeners on the grid are told about each cell which changes.
+        :param snapshot: A snapshot taken from this puzzle, or from another puzzle
+        """
+        self.grid.restore(snapshot)
+
+    def copy(self) -> Puzzle:
+        """
+        Returns a new puzzle with the same options as this one, sharing no state with it.
+        """
+        return Puzzle.from_masks(self.grid.masks)
+
+    @staticmethod
+    def from_masks(masks: list[int]) -> Puzzle:
+        """
+        Create a puzzle from the option masks of its 81 cells, as returned by :meth:`snapshot`.
+        """
+        assert len(masks) == 81
+        puzzle = Puzzle([CellRow([Cell(x, y) for x in range(9)], y) for y in range(9)])
+        puzzle.grid.restore(masks)
+        return puzzle
 
 
 @dataclass
@@ -221,3 +428,33 @@ class PuzzleStateBuilder:
                 row.append(Cell(x, y, self.cells.pop(0)))
             rows.append(CellRow(row, y))
         return Puzzle(rows)
+
+    @staticmethod
+    def first_row(*options: set[int]) -> Puzzle:
+        """
+        Build a puzzle state where the first cells of row 0 have the given options and every other cell has every
+        option.
+        """
+        assert len(options) <= 9
+        return PuzzleStateBuilder.at_positions({(x, 0): cell_options for x, cell_options in enumerate(options)})
+
+    @staticmethod
+    def at_positions(options: dict[tuple[int, int], set[int]]) -> Puzzle:
+        """
+        Build a puzzle state where the cells at the given (x, y) positions have the given options and every other cell
+        has every option.
+        """
+        builder = PuzzleStateBuilder()
+        for y in range(9):
+            for x in range(9):
+                builder.cell(*options.get((x, y), range(1, 10)))
+        return builder.build()
+
+    @staticmethod
+    def without_value(value: int, positions: Iterable[tuple[int, int]]) -> Puzzle:
+        """
+        Build a puzzle state where `value` has been eliminated from the cells at the given (x, y) positions and every
+        other option is still possible.
+        """
+        others = set(range(1, 10)) - {value}
+        return PuzzleStateBuilder.at_positions({position: others for position in positions})
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import mmap
+import os
+from enum import Enum
+from types import TracebackType
+from typing import BinaryIO, Callable, Final, Iterable, Iterator, Optional
+
+from sudoku_solve.puzzle import Puzzle, MalformedPuzzle
+from sudoku_solve.puzzle_read import read_puzzle_digits, read_puzzle_masks
+from sudoku_solve.puzzle_render import render_puzzle_digits, render_puzzle_masks
+
+CORPUS_MAGIC: Final[bytes] = b"SDKC"
+CORPUS_VERSION: Final[int] = 1
+HEADER_SIZE: Final[int] = 8
+"""The header is the magic bytes, a version byte, a record format byte, and two reserved bytes."""
+
+
+class RecordFormat(Enum):
+    """
+    The encoding of the puzzles in a corpus file.
+    """
+    DIGITS = 0
+    """The known value of each cell, packed as 4-bit digits into 41 bytes."""
+    MASKS = 1
+    """The options of each cell, as 16-bit masks in 162 bytes."""
+
+    @property
+    def record_size(self) -> int:
+        return 41 if self is RecordFormat.DIGITS else 162
+
+    def render(self, puzzle: Puzzle) -> bytes:
+        return render_puzzle_digits(puzzle) if self is RecordFormat.DIGITS else render_puzzle_masks(puzzle)
+
+    def reader(self) -> Callable[[bytes], Puzzle]:
+        return read_puzzle_digits if self is RecordFormat.DIGITS else read_puzzle_masks
+
+
+def write_corpus(out_stream: BinaryIO, puzzles: Iterable[Puzzle],
+                 record_format: RecordFormat = RecordFormat.DIGITS) -> int:
+    """
+    Write puzzles to a binary corpus file: a short header followed by fixed size records.
+
+    :param out_stream: The binary output, positioned at the start of the file
+    :param puzzles: The puzzles to write
+    :param record_format: How each puzzle is encoded
+    :return: The number of puzzles written
+    """
+    out_stream.write(CORPUS_MAGIC + bytes([CORPUS_VERSION, record_format.value, 0, 0]))
+    count = 0
+    for puzzle in puzzles:
+        out_stream.write(record_format.render(puzzle))
+        count += 1
+    return count
+
+
+class PuzzleCorpus:
+    """
+    Random access to the puzzles of a binary corpus file written by :func:`write_corpus`. The file is memory mapped, so
+    only the records which are read are loaded, and each worker of a batch can read its own shard of a large corpus.
+    """
+
+    def __init__(self, path: str) -> None:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < HEADER_SIZE:
+                raise MalformedPuzzle(f"{path} is not a puzzle corpus")
+            self.__map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = self.__map[:HEADER_SIZE]
+        if header[:4] != CORPUS_MAGIC:
+            self.close()
+            raise MalformedPuzzle(f"{path} is not a puzzle corpus")
+        if header[4] != CORPUS_VERSION or header[5] not in {f.value for f in RecordFormat}:
+            self.close()
+            raise MalformedPuzzle(f"Unsupported corpus version {header[4]} or record format {header[5]}")
+        self.record_format = RecordFormat(header[5])
+        self.__read = self.record_format.reader()
+        size = self.record_format.record_size
+        if (len(self.__map) - HEADER_SIZE) % size != 0:
+            self.close()
+            raise MalformedPuzzle(f"{path} ends with a partial record")
+        self.__count = (len(self.__map) - HEADER_SIZE) // size
+
+    def __len__(self) -> int:
+        return self.__count
+
+    def __getitem__(self, index: int) -> Puzzle:
+        return self.__read(self.record(index))
+
+    def __iter__(self) -> Iterator[Puzzle]:
+        return (self[i] for i in range(self.__count))
+
+    def __enter__(self) -> PuzzleCorpus:
+        return self
+
+    def __exit__(self, exc_type: Optional[type[BaseException]], exc: Optional[BaseException],
+                 traceback: Optional[TracebackType]) -> None:
+        self.close()
+
+    def record(self, index: int) -> bytes:
+        """
+        Returns the encoded bytes of one puzzle, without decoding them.
+        """
+        if index < 0:
+            index += self.__count
+        if not 0 <= index < self.__count:
+            raise IndexError(f"Puzzle index {index} out of range")
+        size = self.record_format.record_size
+        start = HEADER_SIZE + index * size
+        return self.__map[start:start + size]
+
+    def shard(self, shard_index: int, shard_count: int) -> range:
+        """
+        Divide the corpus into `shard_count` contiguous ranges of nearly equal size.
+        :return: The range of puzzle indices in shard `shard_index`
+        """
+        assert 0 <= shard_index < shard_count
+        return range(self.__count * shard_index // shard_count, self.__count * (shard_index + 1) // shard_count)
+
+    def close(self) -> None:
+        self.__map.close()
@@ -0,0 +1,59 @@
+"""
+Immutable lookup tables describing the layout of a sudoku grid. Cells are indexed by `y_pos * 9 + x_pos`; groups are
+indexed in the same order as :attr:`~sudoku_solve.puzzle.Puzzle.groups`: rows 0 to 8, then columns 9 to 17, then
+blocks 18 to 26.
+"""
+
+from typing import Final
+
+ROW_GROUP_OFFSET: Final[int] = 0
+COLUMN_GROUP_OFFSET: Final[int] = 9
+BLOCK_GROUP_OFFSET: Final[int] = 18
+
+ROW_OF: Final[tuple[int, ...]] = tuple(i // 9 for i in range(81))
+"""The row index of each cell."""
+
+COLUMN_OF: Final[tuple[int, ...]] = tuple(i % 9 for i in range(81))
+"""The column index of each cell."""
+
+BLOCK_OF: Final[tuple[int, ...]] = tuple((i // 27) * 3 + (i % 9) // 3 for i in range(81))
+"""The block index of each cell."""
+
+GROUP_CELLS: Final[tuple[tuple[int, ...], ...]] = (
+    tuple(tuple(i for i in range(81) if ROW_OF[i] == r) for r in range(9))
+    + tuple(tuple(i for i in range(81) if COLUMN_OF[i] == c) for c in range(9))
+    + tuple(tuple(i for i in range(81) if BLOCK_OF[i] == b) for b in range(9))
+)
+"""The nine cell indices of each of the 27 groups."""
+
+CELL_GROUPS: Final[tuple[tuple[int, int, int], ...]] = tuple(
+    (ROW_GROUP_OFFSET + ROW_OF[i], COLUMN_GROUP_OFFSET + COLUMN_OF[i], BLOCK_GROUP_OFFSET + BLOCK_OF[i])
+    for i in range(81)
+)
+"""The group indices of the row, column, and block of each cell."""
+
+PEERS: Final[tuple[tuple[int, ...], ...]] = tuple(
+    tuple(sorted({p for g in CELL_GROUPS[i] for p in GROUP_CELLS[g]} - {i})) for i in range(81)
+)
+"""The indices of the 20 other cells sharing a row, column, or block with each cell."""
+
+CELL_GROUP_POSITIONS: Final[tuple[tuple[tuple[int, int], ...], ...]] = tuple(
+    tuple((g, GROUP_CELLS[g].index(i)) for g in CELL_GROUPS[i]) for i in range(81)
+)
+"""The group index and the position of the cell within that group, for each of the three groups of each cell."""
+
+PEER_BITS: Final[tuple[int, ...]] = tuple(sum(1 << p for p in PEERS[i]) for i in range(81))
+"""The peers of each cell as an 81-bit set, where bit `n` is the cell with index `n`."""
+
+
+def cells_of(bits: int) -> list[int]:
+    """
+    Returns the indices of the cells in an 81-bit set of cells, in ascending order.
+    :param bits: A set of cells where bit `n` is the cell with index `n`
+    """
+    cells = []
+    while bits:
+        bit = bits & -bits
+        cells.append(bit.bit_length() - 1)
+        bits ^= bit
+    return cells
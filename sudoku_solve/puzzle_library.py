@@ -88,6 +88,16 @@ EVIL_PUZZLE_STR: Final[str] = """
 2---6-3--
 """
 
+PUZZLE_STRS_BY_DIFFICULTY: Final[dict[str, str]] = {
+    "easy": EASY_PUZZLE_STR,
+    "medium": MEDIUM_PUZZLE_STR,
+    "hard": HARD_PUZZLE_STR,
+    "expert": EXPERT_PUZZLE_STR,
+    "master": MASTER_PUZZLE_STR,
+    "extreme": EXTREME_PUZZLE_STR,
+    "evil": EVIL_PUZZLE_STR,
+}
+
 
 class PuzzleLibrary:
     """
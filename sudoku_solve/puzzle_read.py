@@ -1,21 +1,166 @@
-from typing import TextIO
-from sudoku_solve.puzzle import Puzzle, Cell, CellRow, MalformedPuzzle, UnsolvablePuzzle, set_of_all_options
+import logging
+from typing import TextIO, Final, Iterator
 
-def read_puzzle(in_stream: TextIO) -> Puzzle:
+from sudoku_solve.puzzle import Puzzle, Cell, CellRow, MalformedPuzzle, UnsolvablePuzzle, AmbiguousPuzzle, \
+    set_of_all_options
+from sudoku_solve.search_solver import count_solutions
+from sudoku_solve.bitmask import ALL_OPTIONS_MASK, options_of, option_bit
+
+logger = logging.getLogger(__name__)
+
+UNKNOWN_CELL_CHARS: Final[str] = "-.0"
+
+__CHAR_MASKS: Final[dict[str, int]] = {**{ch: ALL_OPTIONS_MASK for ch in UNKNOWN_CELL_CHARS},
+                                       **{str(v): option_bit(v) for v in range(1, 10)}}
+
+
+def read_puzzle(in_stream: TextIO, check_solutions: bool = False) -> Puzzle:
     """
     Read a puzzle from a text input. The puzzle should be formated as a 9x9 grid of characters
     :param in_stream:
+    :param check_solutions: When `true`, the puzzle is searched to make sure it has exactly one solution
     :return:
+    :raises UnsolvablePuzzle: If the puzzle breaks the rules, or has no solution when checked
+    :raises AmbiguousPuzzle: If the puzzle is checked and has more than one solution
     """
     cell_rows = __read_rows(in_stream)
     if len(cell_rows) != 9:
         raise MalformedPuzzle(f"Invalid number of lines, expected 9, found {len(cell_rows)}")
+    return __puzzle_from_rows(cell_rows, check_solutions)
+
+
+def read_puzzle_line(line: str, check_solutions: bool = False) -> Puzzle:
+    """
+    Read a puzzle from a single line of 81 characters, listing the cells row by row. Unknown cells may be written as
+    '-', '.', or '0'.
+    :param line: The puzzle line, surrounding whitespace is ignored
+    :param check_solutions: When `true`, the puzzle is searched to make sure it has exactly one solution
+    :return: The puzzle
+    """
+    stripped = line.strip()
+    if len(stripped) != 81:
+        raise MalformedPuzzle(f"Invalid number of characters, expected 81, found {len(stripped)}")
+    cell_rows = [__read_row(y, stripped[y * 9:y * 9 + 9]) for y in range(9)]
+    return __puzzle_from_rows(cell_rows, check_solutions)
+
+
+def read_line_masks(line: str) -> list[int]:
+    """
+    Read the option masks of a puzzle from a single line of 81 characters, in the format read by
+    :func:`read_puzzle_line`, without creating a :class:`Puzzle`.
+    :param line: The puzzle line, surrounding whitespace is ignored
+    :return: The 81 masks, with all options set for unknown cells
+    """
+    stripped = line.strip()
+    if len(stripped) != 81:
+        raise MalformedPuzzle(f"Invalid number of characters, expected 81, found {len(stripped)}")
+    try:
+        return [__CHAR_MASKS[ch] for ch in stripped]
+    except KeyError as e:
+        raise MalformedPuzzle(f"Invalid char {e.args[0]}") from None
+
+
+def read_puzzles(in_stream: TextIO, skip_invalid: bool = False, check_solutions: bool = False) -> Iterator[Puzzle]:
+    """
+    Lazily read any number of puzzles from a text input. Each puzzle may either be a 9x9 grid of characters as read by
+    :func:`read_puzzle`, or a single line of 81 characters as read by :func:`read_puzzle_line`. Blank lines, and lines
+    starting with '#', separate puzzles and are otherwise ignored. Only one puzzle is held in memory at a time.
+
+    :param in_stream: The text input
+    :param skip_invalid: When `true`, puzzles which cannot be read are logged and skipped rather than raising an error
+    :param check_solutions: When `true`, each puzzle is searched to make sure it has exactly one solution
+    :return: An iterator over the puzzles
+    :raises MalformedPuzzle: If a puzzle is malformed, the message includes the line number where the puzzle starts
+    """
+    for first_line, record in __read_records(in_stream):
+        try:
+            puzzle = __read_record(record, check_solutions)
+        except (MalformedPuzzle, UnsolvablePuzzle, AmbiguousPuzzle) as e:
+            if not skip_invalid:
+                raise type(e)(f"Line {first_line}: {e}") from e
+            logger.warning("Skipping puzzle at line %d: %s", first_line, e)
+            continue
+        yield puzzle
+
+
+def __read_records(in_stream: TextIO) -> Iterator[tuple[int, list[str]]]:
+    record: list[str] = []
+    first_line = 0
+    for line_num, line in enumerate(in_stream, start=1):
+        stripped = line.strip()
+        if len(stripped) == 0 or stripped.startswith('#'):
+            if record:
+                yield first_line, record
+                record = []
+        elif not record and len(stripped) == 81:
+            yield line_num, [stripped]
+        else:
+            if not record:
+                first_line = line_num
+            record.append(stripped)
+            if len(record) == 9:
+                yield first_line, record
+                record = []
+    if record:
+        yield first_line, record
+
+
+def __read_record(record: list[str], check_solutions: bool) -> Puzzle:
+    if len(record) == 1 and len(record[0]) == 81:
+        return read_puzzle_line(record[0], check_solutions)
+    if len(record) != 9:
+        raise MalformedPuzzle(f"Invalid number of lines, expected 9, found {len(record)}")
+    return __puzzle_from_rows([__read_row(y, line) for y, line in enumerate(record)], check_solutions)
+
+
+def read_puzzle_digits(data: bytes) -> Puzzle:
+    """
+    Read a puzzle from the 41 byte packed digit format written by `render_puzzle_digits`.
+    :param data: The packed digits, a 4-bit digit for each cell with `0` for an unknown cell
+    :return: The puzzle
+    """
+    if len(data) != 41:
+        raise MalformedPuzzle(f"Invalid number of bytes, expected 41, found {len(data)}")
+    digits = [d for b in data for d in (b >> 4, b & 0xF)]
+    if any(d > 9 for d in digits) or digits[81] != 0:
+        raise MalformedPuzzle("Invalid packed digit")
+    cell_rows = [CellRow([Cell(x, y, {digits[y * 9 + x]} if digits[y * 9 + x] else None) for x in range(9)], y)
+                 for y in range(9)]
+    return __puzzle_from_rows(cell_rows, False)
+
+
+def read_puzzle_masks(data: bytes) -> Puzzle:
+    """
+    Read a puzzle, including the options of every cell, from the 162 byte format written by `render_puzzle_masks`.
+    :param data: A little endian 16-bit option mask for each cell
+    :return: The puzzle
+    """
+    if len(data) != 162:
+        raise MalformedPuzzle(f"Invalid number of bytes, expected 162, found {len(data)}")
+    masks = [int.from_bytes(data[i:i + 2], 'little') for i in range(0, 162, 2)]
+    if any(m == 0 or m & ~ALL_OPTIONS_MASK for m in masks):
+        raise MalformedPuzzle("Invalid option mask")
+    cell_rows = [CellRow([Cell(x, y, options_of(masks[y * 9 + x])) for x in range(9)], y) for y in range(9)]
+    return __puzzle_from_rows(cell_rows, False)
+
+
+def __puzzle_from_rows(cell_rows: list[CellRow], check_solutions: bool) -> Puzzle:
     puzzle = Puzzle(cell_rows)
     if not puzzle.is_valid():
         raise UnsolvablePuzzle("Read a puzzle which cannot be solved")
+    if check_solutions:
+        __check_solutions(puzzle)
     return puzzle
 
 
+def __check_solutions(puzzle: Puzzle) -> None:
+    solution_count = count_solutions(puzzle, 2)
+    if solution_count == 0:
+        raise UnsolvablePuzzle("Read a puzzle which has no solution")
+    if solution_count > 1:
+        raise AmbiguousPuzzle("Read a puzzle which has more than one solution")
+
+
 def __read_rows(in_stream: TextIO) -> list[CellRow]:
     cell_rows: list[CellRow] = []
     line_num = 0
@@ -37,7 +182,7 @@ def __read_row(row_num: int, line: str)->CellRow:
 
 def __char_to_cell(char: str, x_index: int, y_index: int) -> Cell:
     all_options = __set_of_all_options_chars()
-    if char == '-':
+    if char in UNKNOWN_CELL_CHARS:
         return Cell(x_index, y_index)
     elif char in all_options:
         return Cell(x_index, y_index, {int(char)})
@@ -19,6 +19,40 @@ def render_puzzle(puzzle: Puzzle) -> str:
     return '\n'.join(__render_row(r) for r in puzzle.rows) + '\n'
 
 
+def render_puzzle_line(puzzle: Puzzle) -> str:
+    """
+    Render the puzzle as a single line of 81 characters, listing the cells row by row.
+
+    Known cells are rendered as their known value; cells with more than one option are rendered with a dash ('-').
+    This format is compatible with the `read_puzzle_line` function.
+
+    :return: A one line string representation of the current puzzle state
+    """
+    return ''.join(__render_row(r) for r in puzzle.rows)
+
+
+def render_puzzle_digits(puzzle: Puzzle) -> bytes:
+    """
+    Render the known values of the puzzle as 41 bytes. Each cell is a 4-bit digit, `0` for cells with more than one
+    option, packed two to a byte with the first cell in the high nibble. This format is compatible with the
+    `read_puzzle_digits` function.
+
+    :return: The packed digits of the puzzle
+    """
+    digits = [c.value() if c.is_known() else 0 for c in puzzle.cells] + [0]
+    return bytes((digits[i] << 4) | digits[i + 1] for i in range(0, 82, 2))
+
+
+def render_puzzle_masks(puzzle: Puzzle) -> bytes:
+    """
+    Render the full state of the puzzle as 162 bytes: the options of each cell as a little endian 16-bit mask, with
+    bit `n - 1` set when `n` is an option. This format is compatible with the `read_puzzle_masks` function.
+
+    :return: The packed option masks of the puzzle
+    """
+    return b''.join(m.to_bytes(2, 'little') for m in puzzle.grid.masks)
+
+
 def __render_row(row: CellRow) -> str:
     return ''.join([__render_cell(c) for c in row.cells])
 
@@ -59,6 +93,13 @@ def render_puzzle_with_options(puzzle: Puzzle) -> str:
     return '\n'.join(rows_with_head) + '\n'
 
 
+def render_masks_with_options(masks: list[int]) -> str:
+    """
+    Render the state of a puzzle from a snapshot of its masks, in the same way as `render_puzzle_with_options`.
+    """
+    return render_puzzle_with_options(Puzzle.from_masks(masks))
+
+
 def __row_head(i: int) -> str:
     match i:
         case 0 | 4 | 8:
@@ -0,0 +1,121 @@
+import logging
+from typing import Optional
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.propagation import PropagationSolver
+from sudoku_solve.bitmask import values_of, option_bit
+from sudoku_solve.undo_trail import UndoTrail
+
+logger = logging.getLogger(__name__)
+
+
+class SearchSolver(SolveStrategy):
+    """
+    This strategy is a last resort for when no logical strategy can make
+    progress. It picks the unsolved cell with the fewest options, guesses each
+    of them in turn, and applies its own list of strategies to the result. When
+    a guess leads to a contradiction, the changes made since the guess are
+    rolled back with an :class:`UndoTrail` and the next option is tried. Any valid puzzle
+    is solved by this strategy; if no guess works, the puzzle is unsolvable.
+    """
+
+    def __init__(self, strategies: Optional[list[SolveStrategy]] = None) -> None:
+        """
+        :param strategies: The strategies applied after each guess, defaults to a :class:`PropagationSolver`
+        """
+        self.strategies = strategies if strategies is not None else [PropagationSolver()]
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        if puzzle.is_solved():
+            return False
+        solutions: list[list[int]] = []
+        trail = UndoTrail(puzzle.grid)
+        try:
+            self.__search(puzzle, trail, 1, solutions)
+        finally:
+            trail.detach()
+            self.detach()
+        if not solutions:
+            raise UnsolvablePuzzle("Search found no solution")
+        puzzle.restore(solutions[0])
+        return True
+
+    def is_last_resort(self) -> bool:
+        return True
+
+    def count_solutions(self, puzzle: Puzzle, limit: int = 2) -> int:
+        """
+        Count the solutions of a puzzle, stopping as soon as `limit` solutions are found. The puzzle is left unchanged.
+
+        :param puzzle: The puzzle to examine
+        :param limit: The most solutions to look for
+        :return: The number of solutions found, no more than `limit`
+        """
+        solutions: list[list[int]] = []
+        trail = UndoTrail(puzzle.grid)
+        try:
+            self.__search(puzzle, trail, limit, solutions)
+        finally:
+            trail.rollback(0)
+            trail.detach()
+            self.detach()
+        return len(solutions)
+
+    def detach(self) -> None:
+        for strategy in self.strategies:
+            strategy.detach()
+
+    def __search(self, puzzle: Puzzle, trail: UndoTrail, limit: int, solutions: list[list[int]]) -> None:
+        try:
+            self.__apply_strategies(puzzle)
+        except UnsolvablePuzzle:
+            return
+        grid = puzzle.grid
+        index = self.__fewest_options(grid.masks)
+        if index is None:
+            solutions.append(puzzle.snapshot())
+            return
+        mark = trail.mark()
+        for value in values_of(grid.masks[index]):
+            logger.debug("Guessing %d for cell %d", value, index)
+            try:
+                grid.must_be_mask(index, option_bit(value))
+                self.__search(puzzle, trail, limit, solutions)
+            except UnsolvablePuzzle:
+                pass
+            trail.rollback(mark)
+            if len(solutions) >= limit:
+                return
+
+    def __apply_strategies(self, puzzle: Puzzle) -> None:
+        while any(strategy.solve_puzzle(puzzle) for strategy in self.strategies):
+            pass
+        if not puzzle.is_valid():
+            raise UnsolvablePuzzle("Strategies produced an invalid puzzle")
+
+    @staticmethod
+    def __fewest_options(masks: list[int]) -> Optional[int]:
+        best_index: Optional[int] = None
+        best_count = 10
+        for index, mask in enumerate(masks):
+            count = mask.bit_count()
+            if 1 < count < best_count:
+                best_index = index
+                best_count = count
+                if count == 2:
+                    break
+        return best_index
+
+
+def count_solutions(puzzle: Puzzle, limit: int = 2) -> int:
+    """
+    Count the solutions of a puzzle using constraint propagation and search, stopping as soon as `limit` solutions are
+    found. With the default limit of two, the result tells whether the puzzle has no solution, exactly one, or many.
+    The puzzle is left unchanged.
+
+    :param puzzle: The puzzle to examine
+    :param limit: The most solutions to look for
+    :return: The number of solutions found, no more than `limit`
+    """
+    return SearchSolver().count_solutions(puzzle, limit)
@@ -0,0 +1,61 @@
+from typing import Optional
+
+from sudoku_solve.solver import Solver, SolveStrategy, SolveStatistics, StrategyScheduler, FixedScheduler
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_read import read_line_masks
+from sudoku_solve.puzzle_render import render_puzzle_line
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.bitmask import ALL_OPTIONS_MASK
+
+
+class SolverSession:
+    """
+    Solves one puzzle after another with the same puzzle, solver, and strategies. The cells, groups, and indexes of
+    the puzzle are created once, and each new puzzle is loaded into the existing grid, which updates the indexes
+    incrementally. This avoids the cost of building a :class:`Puzzle` and a list of strategies for every puzzle, which
+    is most of the work for easy puzzles.
+
+    A session is not thread safe; use one session per thread or process.
+    """
+
+    def __init__(self, strategies: Optional[list[SolveStrategy]] = None,
+                 scheduler: Optional[StrategyScheduler] = None) -> None:
+        """
+        :param strategies: The strategies to solve with, defaults to :func:`default_strategies`
+        :param scheduler: The scheduler to order the strategies with, defaults to a :class:`FixedScheduler`
+        """
+        self.puzzle = Puzzle.from_masks([ALL_OPTIONS_MASK] * 81)
+        self.strategies = strategies if strategies is not None else default_strategies()
+        self.solver = Solver(self.puzzle, self.strategies, scheduler=scheduler or FixedScheduler())
+
+    def load(self, line: str) -> Puzzle:
+        """
+        Replace the session's puzzle with a new one, in place.
+        :param line: The puzzle, in the format read by `read_puzzle_line`
+        :return: The session's puzzle
+        :raises MalformedPuzzle: If the line is not a puzzle
+        :raises UnsolvablePuzzle: If the puzzle breaks the rules
+        """
+        self.puzzle.grid.load(read_line_masks(line))
+        if not self.puzzle.is_valid():
+            raise UnsolvablePuzzle("Read a puzzle which cannot be solved")
+        return self.puzzle
+
+    def solve(self, line: str) -> SolveStatistics:
+        """
+        Load a puzzle and attempt to solve it. The statistics of each solve are collected separately.
+        :param line: The puzzle, in the format read by `read_puzzle_line`
+        :return: The statistics of this solve
+        """
+        self.load(line)
+        self.solver.statistics = SolveStatistics()
+        return self.solver.solve()
+
+    def is_solved(self) -> bool:
+        return self.puzzle.is_solved()
+
+    def solution(self) -> str:
+        """
+        Returns the current state of the session's puzzle as a line of 81 characters, with '-' for unknown cells.
+        """
+        return render_puzzle_line(self.puzzle)
@@ -1,11 +1,15 @@
 from __future__ import annotations
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from itertools import groupby
+from typing import Iterable, Optional
 
-from sudoku_solve.puzzle import Puzzle
-from sudoku_solve.puzzle_render import render_puzzle_with_options
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_render import render_masks_with_options
+from sudoku_solve.undo_trail import UndoTrail
+from sudoku_solve.trace import Lazy
 
 logger = logging.getLogger(__name__)
 
@@ -28,61 +32,291 @@ class SolveStrategy(ABC):
     def strategy_name(self) -> str:
         return self.__class__.__name__
 
+    def is_last_resort(self) -> bool:
+        """
+        Returns `true` for strategies which solve any puzzle by searching, which should only be tried once the logical
+        strategies can make no progress.
+        """
+        return False
+
+    def detach(self) -> None:
+        """
+        Stop listening for changes to the last puzzle the strategy was applied to. Strategies which keep state about a
+        puzzle between calls override this; it does nothing by default.
+        """
+        pass
+
+
+class StatisticsHook(ABC):
+    """
+    Receives the results of each strategy application as they are recorded, for example to export them to a
+    monitoring system.
+    """
+
+    @abstractmethod
+    def strategy_applied(self, strategy: str, score: int, cells_touched: int, nanoseconds: int) -> None:
+        """
+        Called each time the results of applying a strategy are recorded.
+
+        :param strategy: The name of the strategy
+        :param score: The number of options eliminated
+        :param cells_touched: The number of cells which lost at least one option
+        :param nanoseconds: The time spent applying the strategy
+        """
+        pass
+
 
 @dataclass
 class SolveStatistics:
     """
-    Tracks statistics for each strategy used to solve a puzzle.
+    Tracks statistics for each strategy used to solve a puzzle. Repeated applications of a strategy are added to the
+    same :class:`StrategyStatistics`, so the memory used depends only on the number of strategies.
+
+    Each :class:`Solver` has statistics of its own unless it is given some; the statistics of many solves can be
+    combined with :meth:`merge` or :meth:`rollup`, or collected from many threads with a :class:`StatisticsAggregator`.
     """
-    strategy_scores: list[StrategyStatistics] = field(default_factory=list)
+    strategies: dict[str, StrategyStatistics] = field(default_factory=dict)
+    hooks: list[StatisticsHook] = field(default_factory=list, repr=False, compare=False)
+    solves: int = 0
+    """The number of solves these statistics cover."""
 
-    def record(self, strategy: str, score: int) -> None:
+    def record(self, strategy: str, score: int, cells_touched: int = 0, nanoseconds: int = 0) -> None:
         """
         Record the results of applying a strategy to a puzzle.
 
         :param strategy: The strategy which was applied to the puzzle.
         :param score: The change in score achieved by calling the :func:`~SolveStrategy.solve_puzzle` function.
+        :param cells_touched: The number of cells which lost at least one option
+        :param nanoseconds: The time spent in the :func:`~SolveStrategy.solve_puzzle` function
+        """
+        stats = self.strategies.get(strategy)
+        if stats is None:
+            stats = self.strategies[strategy] = StrategyStatistics(strategy)
+        stats.invocations += 1
+        if score:
+            stats.successes += 1
+        stats.score += score
+        stats.cells_touched += cells_touched
+        stats.nanoseconds += nanoseconds
+        for hook in self.hooks:
+            hook.strategy_applied(strategy, score, cells_touched, nanoseconds)
+
+    def merge(self, other: SolveStatistics) -> None:
+        """
+        Add the statistics of other solves to these. Hooks are not called for merged statistics.
+        """
+        self.solves += other.solves
+        for name, stats in other.strategies.items():
+            mine = self.strategies.get(name)
+            if mine is None:
+                mine = self.strategies[name] = StrategyStatistics(name)
+            mine.merge(stats)
+
+    @staticmethod
+    def rollup(statistics: Iterable[SolveStatistics]) -> SolveStatistics:
+        """
+        Returns new statistics covering every solve of the given statistics.
         """
-        self.strategy_scores.append(StrategyStatistics(strategy, score))
+        total = SolveStatistics()
+        for stats in statistics:
+            total.merge(stats)
+        return total
 
     def render(self) -> str:
         """
         Render a multiline string showing the score achieved by each strategy.
         :return: A string representation of the collected statistics
         """
-        sorted_by_strategy = sorted(self.strategy_scores, key=self.__grouping_key)
-        grouped_by_strategy = groupby(sorted_by_strategy, self.__grouping_key)
-        score_by_name = {name: sum(s.score for s in stats) for name, stats in grouped_by_strategy}
-        return '\n'.join([f"{name}: {score}" for name, score in score_by_name.items()])
-
-    @staticmethod
-    def __grouping_key(stats: StrategyStatistics) -> str:
-        return stats.strategy
+        return '\n'.join(self.strategies[name].render() for name in sorted(self.strategies))
 
 
 @dataclass
 class StrategyStatistics:
     """
-    The statistics for a single execution of a solve strategy.
+    The statistics of every execution of one solve strategy.
     """
     strategy: str
-    score: int
+    invocations: int = 0
+    successes: int = 0
+    score: int = 0
+    """The number of options eliminated."""
+    cells_touched: int = 0
+    nanoseconds: int = 0
+
+    def merge(self, other: StrategyStatistics) -> None:
+        """
+        Add the statistics of another execution of the same strategy to these.
+        """
+        self.invocations += other.invocations
+        self.successes += other.successes
+        self.score += other.score
+        self.cells_touched += other.cells_touched
+        self.nanoseconds += other.nanoseconds
+
+    def render(self) -> str:
+        return f"{self.strategy}: {self.score} ({self.successes}/{self.invocations} successful, " \
+               f"{self.cells_touched} cells, {self.nanoseconds / 1_000_000:.3f}ms)"
+
+
+class StatisticsAggregator:
+    """
+    Rolls up the statistics of many solves, which may be added from many threads at once. Statistics from other
+    processes can be added once they have been sent back, as the batch solver does with the results of its workers.
+    """
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__total = SolveStatistics()
+
+    def add(self, statistics: SolveStatistics) -> None:
+        """
+        Add the statistics of one or more solves to the total.
+        """
+        with self.__lock:
+            self.__total.merge(statistics)
+
+    def total(self) -> SolveStatistics:
+        """
+        Returns a copy of the statistics added so far.
+        """
+        with self.__lock:
+            return SolveStatistics.rollup([self.__total])
+
+
+class StrategyScheduler(ABC):
+    """
+    Decides the order in which a :class:`Solver` tries its strategies.
+    """
+
+    @abstractmethod
+    def schedule(self, strategies: list[SolveStrategy]) -> list[SolveStrategy]:
+        """
+        Choose the strategies to try, in order, at the start of a solve step. When none of them make progress, the
+        solver tries any strategies which were left out, in their original order, before giving up.
+
+        :param strategies: The solver's strategies
+        :return: Some or all of `strategies`
+        """
+        pass
+
+    def record(self, strategy: SolveStrategy, score: int, nanoseconds: int) -> None:
+        """
+        Called after each application of a strategy.
+
+        :param strategy: The strategy which was applied
+        :param score: The number of options it eliminated
+        :param nanoseconds: The time it took
+        """
+        pass
+
+
+class SolverHook:
+    """
+    Observes a :class:`Solver` as it works, for tracing and profiling. Each method does nothing by default, so a hook
+    only overrides the events it is interested in. A solver with no hooks doesn't listen for eliminations or
+    assignments at all.
+    """
+
+    def before_strategy(self, puzzle: Puzzle, strategy: SolveStrategy) -> None:
+        """
+        Called just before a strategy is applied to the puzzle.
+        """
+        pass
+
+    def after_strategy(self, puzzle: Puzzle, strategy: SolveStrategy, made_progress: bool, nanoseconds: int) -> None:
+        """
+        Called after a strategy has been applied to the puzzle, including when it fails with a contradiction.
+
+        :param made_progress: Whether the strategy made progress
+        :param nanoseconds: The time spent applying the strategy
+        """
+        pass
+
+    def on_elimination(self, index: int, value: int) -> None:
+        """
+        Called each time a value is eliminated from the options of a cell.
+
+        :param index: The cell index
+        :param value: The value which was eliminated
+        """
+        pass
+
+    def on_assignment(self, index: int, value: int) -> None:
+        """
+        Called each time a cell is left with one option.
+
+        :param index: The cell index
+        :param value: The value of the cell
+        """
+        pass
+
+    def on_contradiction(self, puzzle: Puzzle, strategy: SolveStrategy, error: Exception) -> None:
+        """
+        Called when a strategy finds that the puzzle can't be solved, or leaves it invalid, before the error is raised.
+        """
+        pass
+
+
+class FixedScheduler(StrategyScheduler):
+    """
+    Always tries the strategies in the order they were given.
+    """
+
+    def schedule(self, strategies: list[SolveStrategy]) -> list[SolveStrategy]:
+        return strategies
 
 
 @dataclass
 class Solver:
     """
     Applies the provided strategies to the provided puzzle.
+
+    A solver with hooks listens for changes to the puzzle's grid; call :meth:`close` when done with it so that the
+    listener is removed.
     """
     puzzle: Puzzle
     strategies: list[SolveStrategy]
-    statistics: SolveStatistics = SolveStatistics()
+    statistics: SolveStatistics = field(default_factory=SolveStatistics)
+    scheduler: StrategyScheduler = field(default_factory=FixedScheduler)
+    trail: Optional[UndoTrail] = None
+    """If set, each option eliminated is recorded on this trail along with the strategy which eliminated it."""
+    hooks: list[SolverHook] = field(default_factory=list, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.hooks:
+            self.puzzle.grid.add_listener(self.__cell_changed)
+
+    def add_hook(self, hook: SolverHook) -> None:
+        """
+        Start notifying a hook of the solver's progress.
+        """
+        if not self.hooks:
+            self.puzzle.grid.add_listener(self.__cell_changed)
+        self.hooks.append(hook)
+
+    def remove_hook(self, hook: SolverHook) -> None:
+        """
+        Stop notifying a hook of the solver's progress. Removing the last hook removes the solver's listener from the
+        puzzle's grid.
+        """
+        self.hooks.remove(hook)
+        if not self.hooks:
+            self.puzzle.grid.remove_listener(self.__cell_changed)
+
+    def close(self) -> None:
+        """
+        Stop notifying every hook and remove the solver's listener from the puzzle's grid.
+        """
+        if self.hooks:
+            self.puzzle.grid.remove_listener(self.__cell_changed)
+            self.hooks = []
 
     def solve(self) -> SolveStatistics:
         """
         Attempt to solve the puzzle using the known strategies.
         :return: The statistics generated while applying the strategies to the puzzle
         """
+        self.statistics.solves += 1
         while not self.puzzle.is_solved():
             made_progress = self.one_solve_step()
             if not made_progress:
@@ -97,27 +331,78 @@ class Solver:
 
         :return: `true` if progress was made, `false` otherwise
         """
-        logger.debug(f"Starting a solve step:\n{render_puzzle_with_options(self.puzzle)}")
-        for strategy in self.strategies:
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Starting a solve step:\n%s", Lazy(render_masks_with_options, self.puzzle.snapshot()))
+        scheduled = self.scheduler.schedule(self.strategies)
+        for strategy in scheduled:
             if self.__apply_one_strategy(strategy):
                 return True
+        if len(scheduled) < len(self.strategies):
+            for strategy in self.strategies:
+                if not any(strategy is s for s in scheduled) and self.__apply_one_strategy(strategy):
+                    return True
         return False
 
     def __apply_one_strategy(self, strategy: SolveStrategy) -> bool:
         name = strategy.strategy_name()
-        logger.info(f"Applying strategy: {name}")
-        score_before = self.puzzle.score()
-        if strategy.solve_puzzle(self.puzzle):
-            self.__solve_made_progress(name, score_before)
+        logger.info("Applying strategy: %s", name)
+        masks_before = list(self.puzzle.grid.masks)
+        if self.trail is not None:
+            self.trail.attribute_to(name)
+        hooks = self.hooks
+        for hook in hooks:
+            hook.before_strategy(self.puzzle, strategy)
+        start = time.perf_counter_ns()
+        made_progress = False
+        contradiction: Optional[UnsolvablePuzzle] = None
+        try:
+            made_progress = strategy.solve_puzzle(self.puzzle)
+        except UnsolvablePuzzle as e:
+            contradiction = e
+            raise
+        finally:
+            nanoseconds = time.perf_counter_ns() - start
+            if self.trail is not None:
+                self.trail.attribute_to(None)
+            for hook in hooks:
+                hook.after_strategy(self.puzzle, strategy, made_progress, nanoseconds)
+            if contradiction is not None:
+                self.__contradiction(strategy, contradiction)
+        if made_progress:
+            try:
+                score = self.__solve_made_progress(name, masks_before, nanoseconds)
+            except RuntimeError as e:
+                self.__contradiction(strategy, e)
+                raise
+            self.scheduler.record(strategy, score, nanoseconds)
             return True
-        self.statistics.record(name, 0)
+        self.statistics.record(name, 0, 0, nanoseconds)
+        self.scheduler.record(strategy, 0, nanoseconds)
         return False
 
-    def __solve_made_progress(self, strategy_name: str, score_before: int) -> None:
+    def __contradiction(self, strategy: SolveStrategy, error: Exception) -> None:
+        for hook in self.hooks:
+            hook.on_contradiction(self.puzzle, strategy, error)
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        eliminated = old_mask & ~new_mask
+        while eliminated:
+            bit = eliminated & -eliminated
+            eliminated ^= bit
+            for hook in self.hooks:
+                hook.on_elimination(index, bit.bit_length())
+        if new_mask.bit_count() == 1:
+            for hook in self.hooks:
+                hook.on_assignment(index, new_mask.bit_length())
+
+    def __solve_made_progress(self, strategy_name: str, masks_before: list[int], nanoseconds: int) -> int:
         if not self.puzzle.is_valid():
             raise RuntimeError(f"Solver {strategy_name} produced an invalid puzzle")
+        score_before = sum(m.bit_count() for m in masks_before) - len(masks_before)
         score_after = self.puzzle.score()
         difference = score_before - score_after
-        self.statistics.record(strategy_name, difference)
-        logger.info(
-            f"The {strategy_name} strategy reduced the score by {difference} from {score_before} to {score_after}")
+        cells_touched = sum(1 for before, after in zip(masks_before, self.puzzle.grid.masks) if before != after)
+        self.statistics.record(strategy_name, difference, cells_touched, nanoseconds)
+        logger.info("The %s strategy reduced the score by %d from %d to %d", strategy_name, difference, score_before,
+                    score_after)
+        return difference
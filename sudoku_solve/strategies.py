@@ -0,0 +1,66 @@
+from typing import Callable, Final
+
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.group_exclusive_solver import GroupExclusiveSolver
+from sudoku_solve.only_option_solver import OnlyOptionSolver
+from sudoku_solve.propagation import PropagationSolver
+from sudoku_solve.naked_pairs_solver import NakedPairsSolver
+from sudoku_solve.naked_subset_solver import NakedSubsetSolver
+from sudoku_solve.hidden_pairs_solver import HiddenPairsSolver
+from sudoku_solve.hidden_subset_solver import HiddenSubsetSolver
+from sudoku_solve.pointing_pairs_solver import PointingPairsSolver
+from sudoku_solve.box_line_reduction_solver import BoxLineReductionSolver
+from sudoku_solve.intersection_solver import IntersectionSolver
+from sudoku_solve.fish_solver import FishSolver
+from sudoku_solve.chain_solver import XYWingSolver, SimpleColoringSolver, XChainSolver
+from sudoku_solve.search_solver import SearchSolver
+from sudoku_solve.dlx_solver import DancingLinksSolver
+
+STRATEGY_TYPES: Final[dict[str, Callable[[], SolveStrategy]]] = {
+    "GroupExclusiveSolver": GroupExclusiveSolver,
+    "OnlyOptionSolver": OnlyOptionSolver,
+    "PropagationSolver": PropagationSolver,
+    "NakedPairsSolver": NakedPairsSolver,
+    "NakedSubsetSolver": NakedSubsetSolver,
+    "HiddenPairsSolver": HiddenPairsSolver,
+    "HiddenSubsetSolver": HiddenSubsetSolver,
+    "PointingPairsSolver": PointingPairsSolver,
+    "BoxLineReductionSolver": BoxLineReductionSolver,
+    "IntersectionSolver": IntersectionSolver,
+    "FishSolver": FishSolver,
+    "XYWingSolver": XYWingSolver,
+    "SimpleColoringSolver": SimpleColoringSolver,
+    "XChainSolver": XChainSolver,
+    "SearchSolver": SearchSolver,
+    "DancingLinksSolver": DancingLinksSolver,
+}
+"""Constructors for each of the available strategies, by strategy name."""
+
+
+def default_strategies() -> list[SolveStrategy]:
+    """
+    Returns new instances of the standard list of strategies: the logical strategies from cheapest to most expensive,
+    followed by a :class:`SearchSolver` so that every valid puzzle is solved.
+    """
+    return [
+        PropagationSolver(),
+        NakedSubsetSolver(),
+        HiddenSubsetSolver(),
+        IntersectionSolver(),
+        FishSolver(),
+        XYWingSolver(),
+        SimpleColoringSolver(),
+        XChainSolver(),
+        SearchSolver(),
+    ]
+
+
+def strategies_by_name(names: list[str]) -> list[SolveStrategy]:
+    """
+    Returns new instances of the named strategies, in the order given.
+    :param names: Names from :data:`STRATEGY_TYPES`
+    """
+    unknown = [n for n in names if n not in STRATEGY_TYPES]
+    if unknown:
+        raise ValueError(f"Unknown strategies: {', '.join(unknown)}")
+    return [STRATEGY_TYPES[n]() for n in names]
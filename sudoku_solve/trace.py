@@ -0,0 +1,99 @@
+"""
+Support for logging from the solver's hot paths without paying for messages nobody reads. Messages are logged with
+`%`-style arguments, so they are only formatted once a handler needs the text, and anything expensive to compute is
+either guarded by `logger.isEnabledFor` or wrapped in :class:`Lazy`.
+
+For a running service, :func:`start_trace` turns on a trace mode which keeps the most recent debug events from the
+package in a :class:`TraceBuffer`, as the unformatted message and arguments, instead of writing strings anywhere.
+"""
+import logging
+from collections import deque
+from typing import Any, Callable, NamedTuple
+
+PACKAGE_LOGGER = "sudoku_solve"
+"""The name of the logger which all loggers in this package are children of."""
+
+
+class Lazy:
+    """
+    A logging argument which computes its text only when it is formatted.
+    """
+    __slots__ = ("function", "args")
+
+    def __init__(self, function: Callable[..., Any], *args: Any) -> None:
+        self.function = function
+        self.args = args
+
+    def __str__(self) -> str:
+        return str(self.function(*self.args))
+
+
+class TraceEvent(NamedTuple):
+    """
+    One logged event, kept as it was passed to the logger.
+    """
+    created: float
+    logger: str
+    level: int
+    msg: str
+    args: Any
+
+    def message(self) -> str:
+        """
+        Returns the formatted message of the event.
+        """
+        return self.msg % self.args if self.args else self.msg
+
+
+class TraceBuffer(logging.Handler):
+    """
+    A logging handler which keeps the most recent events in a ring buffer without formatting them.
+    """
+
+    def __init__(self, capacity: int = 4096, level: int = logging.DEBUG) -> None:
+        """
+        :param capacity: The number of events to keep; older events are dropped
+        :param level: The lowest level of event to keep
+        """
+        super().__init__(level)
+        self.events: deque[TraceEvent] = deque(maxlen=capacity)
+        self.previous_level = logging.NOTSET
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.events.append(TraceEvent(record.created, record.name, record.levelno, record.msg, record.args))
+
+    def messages(self) -> list[str]:
+        """
+        Returns the formatted messages of the events in the buffer, oldest first.
+        """
+        return [e.message() for e in self.events]
+
+    def clear(self) -> None:
+        self.events.clear()
+
+
+def start_trace(capacity: int = 4096, logger_name: str = PACKAGE_LOGGER) -> TraceBuffer:
+    """
+    Start keeping debug events from a logger and its children in a new ring buffer. The logger's level is lowered to
+    `DEBUG` until :func:`stop_trace` is called; events still propagate to the handlers of parent loggers, which filter
+    them by their own level.
+
+    :param capacity: The number of events to keep
+    :param logger_name: The logger to trace, the whole package by default
+    :return: The buffer which receives the events
+    """
+    logger = logging.getLogger(logger_name)
+    buffer = TraceBuffer(capacity)
+    buffer.previous_level = logger.level
+    logger.addHandler(buffer)
+    logger.setLevel(logging.DEBUG)
+    return buffer
+
+
+def stop_trace(buffer: TraceBuffer, logger_name: str = PACKAGE_LOGGER) -> None:
+    """
+    Stop a trace started by :func:`start_trace`, restoring the logger's previous level. The buffer keeps its events.
+    """
+    logger = logging.getLogger(logger_name)
+    logger.removeHandler(buffer)
+    logger.setLevel(buffer.previous_level)
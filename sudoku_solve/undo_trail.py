@@ -0,0 +1,119 @@
+from __future__ import annotations
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from sudoku_solve.puzzle import CandidateGrid
+
+_CELL_MASK = 0x7F
+_VALUE_SHIFT = 7
+_RESTORED_BIT = 1 << 11
+_STRATEGY_SHIFT = 12
+
+
+@dataclass(frozen=True)
+class TrailEntry:
+    """
+    One change recorded on an :class:`UndoTrail`: a value eliminated from a cell, or put back when `restored` is set.
+    """
+    index: int
+    value: int
+    strategy: Optional[str]
+    restored: bool = False
+
+
+class UndoTrail:
+    """
+    An append-only record of every option eliminated from a grid, with the strategy which eliminated it. The grid can
+    be rolled back to the state it was in at any earlier mark, and the recorded changes can be replayed onto another
+    grid or read back to explain how a puzzle was solved.
+
+    Each change is packed into one integer of a flat array: the cell index, the value, whether the value was
+    eliminated or put back by a restore, and the id of the strategy it is attributed to. Rolling back only touches the
+    options which changed since the mark, which is much less work than restoring a full snapshot when a guess changes
+    few cells. The trail records changes until :meth:`detach` is called.
+    """
+
+    def __init__(self, grid: CandidateGrid) -> None:
+        self.grid = grid
+        self.entries = array('I')
+        self.strategies: list[Optional[str]] = [None]
+        self.strategy_id = 0
+        self.__rolling_back = False
+        grid.add_listener(self.__cell_changed)
+
+    def attribute_to(self, strategy: Optional[str]) -> None:
+        """
+        Attribute the changes recorded from now on to a strategy.
+        :param strategy: The strategy name, or `None` for changes made outside of any strategy
+        """
+        if strategy not in self.strategies:
+            self.strategies.append(strategy)
+        self.strategy_id = self.strategies.index(strategy)
+
+    def mark(self) -> int:
+        """
+        Returns a mark for the current state of the grid, which can be passed to :meth:`rollback` and :meth:`replay`.
+        """
+        return len(self.entries)
+
+    def rollback(self, mark: int) -> None:
+        """
+        Undo every change made to the grid since a mark was taken, most recent first, and drop them from the trail.
+        :param mark: A mark returned by :meth:`mark` which has not been rolled back past
+        """
+        assert 0 <= mark <= len(self.entries)
+        grid = self.grid
+        entries = self.entries
+        self.__rolling_back = True
+        try:
+            while len(entries) > mark:
+                entry = entries.pop()
+                index = entry & _CELL_MASK
+                bit = 1 << ((entry >> _VALUE_SHIFT) & 0xF)
+                mask = grid.masks[index]
+                grid.reset_mask(index, mask & ~bit if entry & _RESTORED_BIT else mask | bit)
+        finally:
+            self.__rolling_back = False
+
+    def replay(self, grid: CandidateGrid, start: int = 0, end: Optional[int] = None) -> None:
+        """
+        Apply the changes recorded between two marks to another grid, in the order they were made. Replaying from `0`
+        onto a copy of the grid taken when the trail was created brings the copy to the current state of this grid.
+        :param grid: The grid to change, which is not recorded by this trail
+        :param start: The mark to start from
+        :param end: The mark to stop at, defaults to the end of the trail
+        """
+        for entry in self.entries[start:end]:
+            index = entry & _CELL_MASK
+            bit = 1 << ((entry >> _VALUE_SHIFT) & 0xF)
+            mask = grid.masks[index]
+            grid.reset_mask(index, mask | bit if entry & _RESTORED_BIT else mask & ~bit)
+
+    def changes(self, start: int = 0, end: Optional[int] = None) -> Iterator[TrailEntry]:
+        """
+        Returns the changes recorded between two marks, in the order they were made.
+        :param start: The mark to start from
+        :param end: The mark to stop at, defaults to the end of the trail
+        """
+        for entry in self.entries[start:end]:
+            yield TrailEntry(entry & _CELL_MASK, ((entry >> _VALUE_SHIFT) & 0xF) + 1,
+                             self.strategies[entry >> _STRATEGY_SHIFT], bool(entry & _RESTORED_BIT))
+
+    def detach(self) -> None:
+        """
+        Stop recording changes to the grid.
+        """
+        self.grid.remove_listener(self.__cell_changed)
+
+    def __cell_changed(self, index: int, old_mask: int, new_mask: int) -> None:
+        if self.__rolling_back:
+            return
+        tag = index | (self.strategy_id << _STRATEGY_SHIFT)
+        changed = old_mask ^ new_mask
+        while changed:
+            bit = changed & -changed
+            changed ^= bit
+            entry = tag | ((bit.bit_length() - 1) << _VALUE_SHIFT)
+            self.entries.append(entry if old_mask & bit else entry | _RESTORED_BIT)
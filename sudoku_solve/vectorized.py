@@ -0,0 +1,239 @@
+"""
+A batch propagation engine which holds many puzzles as one `(N, 81)` array of option masks and applies naked singles,
+hidden singles, and pointing pairs to all of them at once with NumPy. Puzzles which are solved or found to be invalid
+are dropped from the working set as they finish; puzzles which stall are handed to the scalar :class:`Solver` with the
+:func:`default_strategies`.
+
+NumPy is an optional dependency, installed with the `numpy` extra; it is only imported when the engine is used.
+"""
+from __future__ import annotations
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Final, Iterable, Optional, cast
+
+from sudoku_solve.solver import Solver, SolveStrategy
+from sudoku_solve.puzzle import Puzzle, MalformedPuzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS, CELL_GROUP_POSITIONS, PEERS, ROW_OF, COLUMN_OF, BLOCK_OF, \
+    BLOCK_GROUP_OFFSET
+from sudoku_solve.puzzle_read import UNKNOWN_CELL_CHARS
+from sudoku_solve.puzzle_render import render_puzzle_line
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.bitmask import ALL_OPTIONS_MASK
+
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy import ndarray
+
+STALLED: Final[int] = 0
+"""The status of a puzzle which propagation could not finish."""
+SOLVED: Final[int] = 1
+"""The status of a puzzle which propagation solved."""
+INVALID: Final[int] = -1
+"""The status of a puzzle which propagation found to have no solution."""
+
+
+def _numpy() -> Any:
+    try:
+        import numpy
+    except ImportError as e:
+        raise ImportError("The vectorized engine requires numpy, install sudoku_solve[numpy]") from e
+    return numpy
+
+
+@dataclass(frozen=True)
+class _Tables:
+    """
+    Index arrays describing the grid layout, for gathering the masks of related cells with fancy indexing.
+    """
+    popcount: np.ndarray
+    """The number of options in each of the 512 masks."""
+    char_masks: np.ndarray
+    """The mask for each byte of a puzzle line, `0` for bytes which aren't valid."""
+    mask_chars: np.ndarray
+    """The byte rendering each mask in a puzzle line: the digit for a single option, '-' otherwise."""
+    peers: np.ndarray
+    """The 20 peers of each cell, `(81, 20)`."""
+    group_cells: np.ndarray
+    """The 9 cells of each group, `(27, 9)`."""
+    cell_slots: np.ndarray
+    """The index of each cell in a flattened `(27, 9)` group array, for each of its 3 groups, `(81, 3)`."""
+    segments: np.ndarray
+    """The 3 cells where each block crosses each row and column, `(54, 3)`."""
+    block_rest: np.ndarray
+    """The 6 other cells of the block of each segment, `(54, 6)`."""
+    line_rest_of_cell: np.ndarray
+    """The 4 segments each cell is on the line of without being in, `(81, 4)`."""
+
+
+@lru_cache(maxsize=None)
+def _tables() -> _Tables:
+    np = _numpy()
+    popcount = np.array([m.bit_count() for m in range(ALL_OPTIONS_MASK + 1)], dtype=np.uint8)
+    char_masks = np.zeros(256, dtype=np.uint16)
+    for ch in UNKNOWN_CELL_CHARS:
+        char_masks[ord(ch)] = ALL_OPTIONS_MASK
+    for value in range(1, 10):
+        char_masks[ord(str(value))] = 1 << (value - 1)
+    mask_chars = np.full(ALL_OPTIONS_MASK + 1, ord('-'), dtype=np.uint8)
+    for value in range(1, 10):
+        mask_chars[1 << (value - 1)] = ord(str(value))
+    segments: list[tuple[int, ...]] = []
+    block_rest: list[tuple[int, ...]] = []
+    line_rest: list[list[int]] = [[] for _ in range(81)]
+    for block in range(9):
+        block_cells = GROUP_CELLS[BLOCK_GROUP_OFFSET + block]
+        for line_of in (ROW_OF, COLUMN_OF):
+            for line in sorted({line_of[i] for i in block_cells}):
+                segment = tuple(i for i in block_cells if line_of[i] == line)
+                for i in range(81):
+                    if line_of[i] == line and BLOCK_OF[i] != block:
+                        line_rest[i].append(len(segments))
+                segments.append(segment)
+                block_rest.append(tuple(i for i in block_cells if i not in segment))
+    return _Tables(
+        popcount,
+        char_masks,
+        mask_chars,
+        np.array(PEERS, dtype=np.intp),
+        np.array(GROUP_CELLS, dtype=np.intp),
+        np.array([[g * 9 + p for g, p in CELL_GROUP_POSITIONS[i]] for i in range(81)], dtype=np.intp),
+        np.array(segments, dtype=np.intp),
+        np.array(block_rest, dtype=np.intp),
+        np.array(line_rest, dtype=np.intp),
+    )
+
+
+def masks_from_lines(lines: Iterable[str]) -> np.ndarray:
+    """
+    Read puzzles in the format read by `read_puzzle_line` into an `(N, 81)` array of option masks.
+    :raises MalformedPuzzle: If a line is not a puzzle, the message includes its position
+    """
+    np = _numpy()
+    stripped = [line.strip() for line in lines]
+    for n, line in enumerate(stripped):
+        if len(line) != 81:
+            raise MalformedPuzzle(f"Puzzle {n}: Invalid number of characters, expected 81, found {len(line)}")
+    if not stripped:
+        return cast('ndarray', np.zeros((0, 81), dtype=np.uint16))
+    data = np.frombuffer(''.join(stripped).encode('ascii', errors='replace'), dtype=np.uint8).reshape(-1, 81)
+    masks = _tables().char_masks[data]
+    invalid = np.flatnonzero((masks == 0).any(axis=1))
+    if invalid.size:
+        raise MalformedPuzzle(f"Puzzle {invalid[0]}: Invalid char")
+    return cast('ndarray', masks)
+
+
+def lines_from_masks(masks: np.ndarray) -> list[str]:
+    """
+    Render each row of an `(N, 81)` array of option masks as a line of 81 characters, with '-' for unknown cells.
+    """
+    data = _tables().mask_chars[masks]
+    return [row.tobytes().decode('ascii') for row in data]
+
+
+def propagate_batch(masks: np.ndarray, max_rounds: int = 81) -> np.ndarray:
+    """
+    Apply naked singles, hidden singles, and pointing pairs to every puzzle of a batch until each is solved, found
+    invalid, or stops changing. The masks are updated in place; invalid puzzles are left as they were when the problem
+    was found.
+
+    :param masks: An `(N, 81)` array of `uint16` option masks
+    :param max_rounds: The most rounds of the three rules to apply
+    :return: The status of each puzzle: :data:`SOLVED`, :data:`INVALID`, or :data:`STALLED`
+    """
+    np = _numpy()
+    tables = _tables()
+    status = np.full(len(masks), STALLED, dtype=np.int8)
+    active = np.arange(len(masks))
+    for _ in range(max_rounds):
+        if not active.size:
+            break
+        current = masks[active]
+        updated = _round(np, tables, current)
+        counts = tables.popcount[updated]
+        invalid = (counts == 0).any(axis=1) | _has_conflict(np, tables, updated, counts)
+        solved = ~invalid & (counts == 1).all(axis=1)
+        changed = (updated != current).any(axis=1)
+        keep = ~invalid
+        masks[active[keep]] = updated[keep]
+        status[active[invalid]] = INVALID
+        status[active[solved]] = SOLVED
+        active = active[~invalid & ~solved & changed]
+    return cast('ndarray', status)
+
+
+def _round(np: Any, tables: _Tables, masks: np.ndarray) -> np.ndarray:
+    # Naked singles: remove the value of each known cell from its peers
+    known = tables.popcount[masks] == 1
+    known_values = np.where(known, masks, 0).astype(np.uint16)
+    taken = np.bitwise_or.reduce(known_values[:, tables.peers], axis=2)
+    masks = np.where(known, masks, masks & ~taken).astype(np.uint16)
+
+    # Hidden singles: a value possible in only one cell of a group must go in that cell
+    group_masks = masks[:, tables.group_cells]
+    once = np.zeros(group_masks.shape[:2], dtype=np.uint16)
+    more = np.zeros_like(once)
+    for position in range(9):
+        more |= once & group_masks[:, :, position]
+        once |= group_masks[:, :, position]
+    hidden = group_masks & (once & ~more)[:, :, np.newaxis]
+    forced = np.bitwise_or.reduce(hidden.reshape(len(masks), -1)[:, tables.cell_slots], axis=2)
+    masks = np.where(forced != 0, masks & forced, masks).astype(np.uint16)
+    masks = np.where(tables.popcount[forced] > 1, 0, masks).astype(np.uint16)
+
+    # Pointing pairs: a value confined to one row or column of a block is removed from the rest of that line
+    in_segment = np.bitwise_or.reduce(masks[:, tables.segments], axis=2)
+    in_block_rest = np.bitwise_or.reduce(masks[:, tables.block_rest], axis=2)
+    pointing = in_segment & ~in_block_rest
+    eliminated = np.bitwise_or.reduce(pointing[:, tables.line_rest_of_cell], axis=2)
+    return cast('ndarray', (masks & ~eliminated).astype(np.uint16))
+
+
+def _has_conflict(np: Any, tables: _Tables, masks: np.ndarray, counts: np.ndarray) -> np.ndarray:
+    group_masks = masks[:, tables.group_cells]
+    known_values = np.where(counts[:, tables.group_cells] == 1, group_masks, 0).astype(np.uint16)
+    known_count = (counts[:, tables.group_cells] == 1).sum(axis=2)
+    distinct = tables.popcount[np.bitwise_or.reduce(known_values, axis=2)]
+    missing = np.bitwise_or.reduce(group_masks, axis=2) != ALL_OPTIONS_MASK
+    return cast('ndarray', ((distinct != known_count) | missing).any(axis=1))
+
+
+@dataclass
+class VectorizedResult:
+    """
+    The outcome of solving a batch of puzzles with :func:`solve_vectorized`.
+    """
+    solutions: list[str]
+    """The final state of each puzzle as a line of 81 characters, unknown cells are rendered as '-'."""
+    solved: list[bool]
+    vectorized: int
+    """The number of puzzles solved by the vectorized engine alone."""
+    scalar: int
+    """The number of puzzles handed to the scalar solver."""
+
+
+def solve_vectorized(puzzles: Iterable[Puzzle | str], strategies: Optional[list[SolveStrategy]] = None,
+                     max_rounds: int = 81) -> VectorizedResult:
+    """
+    Solve a batch of puzzles, first with :func:`propagate_batch` and then, for the puzzles it doesn't finish, with a
+    :class:`Solver`. Puzzles found to be invalid are not passed to the scalar solver.
+
+    :param puzzles: The puzzles, either as :class:`Puzzle` objects or in the format read by `read_puzzle_line`
+    :param strategies: The strategies for the scalar solver, defaults to :func:`default_strategies`
+    :param max_rounds: The most rounds of vectorized propagation
+    """
+    np = _numpy()
+    masks = masks_from_lines(render_puzzle_line(p) if isinstance(p, Puzzle) else p for p in puzzles)
+    status = propagate_batch(masks, max_rounds)
+    solved = status == SOLVED
+    stalled = np.flatnonzero(status == STALLED)
+    scalar_strategies = strategies if strategies is not None else default_strategies()
+    for n in stalled:
+        puzzle = Puzzle.from_masks(masks[n].tolist())
+        try:
+            Solver(puzzle, scalar_strategies).solve()
+        except UnsolvablePuzzle:
+            continue
+        masks[n] = puzzle.grid.masks
+        solved[n] = puzzle.is_solved()
+    return VectorizedResult(lines_from_masks(masks), solved.tolist(), int((status == SOLVED).sum()), int(stalled.size))
@@ -0,0 +1,72 @@
+import unittest
+
+from sudoku_solve.solver import Solver, SolveStrategy
+from sudoku_solve.puzzle import Puzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary, PUZZLE_STRS_BY_DIFFICULTY
+from sudoku_solve.adaptive_scheduler import AdaptiveScheduler
+from sudoku_solve.strategies import default_strategies, strategies_by_name
+
+
+class NoProgressSolver(SolveStrategy):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        self.calls += 1
+        return False
+
+
+class TestAdaptiveScheduler(unittest.TestCase):
+    def test_solves_library_puzzles(self):
+        scheduler = AdaptiveScheduler()
+        strategies = default_strategies()
+        for puzzle in [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.master_puzzle(), PuzzleLibrary.extreme_puzzle(),
+                       PuzzleLibrary.evil_puzzle()]:
+            Solver(puzzle, strategies, scheduler=scheduler).solve()
+            self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+    def test_search_stays_last_resort(self):
+        scheduler = AdaptiveScheduler()
+        strategies = default_strategies()
+        for difficulty in PUZZLE_STRS_BY_DIFFICULTY:
+            puzzle = getattr(PuzzleLibrary, f"{difficulty}_puzzle")()
+            statistics = Solver(puzzle, strategies, scheduler=scheduler).solve()
+            self.assertTrue(puzzle.is_solved(), difficulty)
+            self.assertIn("PropagationSolver", statistics.strategies, difficulty)
+            self.assertEqual(difficulty == "evil", "SearchSolver" in statistics.strategies, difficulty)
+
+    def test_unmeasured_and_last_resort_strategies_go_last(self):
+        scheduler = AdaptiveScheduler()
+        strategies = default_strategies()
+        by_name = {s.strategy_name(): s for s in strategies}
+        scheduler.record(by_name["SearchSolver"], 500, 1000)
+        scheduler.record(by_name["FishSolver"], 5, 1000)
+        scheduler.record(by_name["PropagationSolver"], 50, 1000)
+        names = [s.strategy_name() for s in scheduler.schedule(strategies)]
+        self.assertEqual(["PropagationSolver", "FishSolver", "NakedSubsetSolver"], names[:3])
+        self.assertEqual("SearchSolver", names[-1])
+
+    def test_failing_strategy_backs_off(self):
+        useless = NoProgressSolver()
+        strategies = [useless] + strategies_by_name(["GroupExclusiveSolver", "OnlyOptionSolver"])
+        puzzle = PuzzleLibrary.medium_puzzle()
+        Solver(puzzle, strategies, scheduler=AdaptiveScheduler()).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+        fixed_useless = NoProgressSolver()
+        puzzle = PuzzleLibrary.medium_puzzle()
+        Solver(puzzle, [fixed_useless] + strategies_by_name(["GroupExclusiveSolver", "OnlyOptionSolver"])).solve()
+        self.assertLess(useless.calls, fixed_useless.calls)
+
+    def test_falls_back_to_skipped_strategies(self):
+        scheduler = AdaptiveScheduler()
+        strategies = strategies_by_name(["GroupExclusiveSolver", "OnlyOptionSolver"])
+        for strategy in strategies:
+            scheduler.record(strategy, 0, 1000)
+        self.assertEqual([], scheduler.schedule(strategies))
+        puzzle = PuzzleLibrary.easy_puzzle()
+        Solver(puzzle, strategies, scheduler=scheduler).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+
+if __name__ == '__main__':
+    unittest.main()
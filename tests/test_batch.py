@@ -0,0 +1,63 @@
+import unittest
+from unittest import mock
+
+from sudoku_solve.batch import solve_many
+from sudoku_solve.solver import StatisticsAggregator
+from sudoku_solve.puzzle_library import PuzzleLibrary, EXTREME_PUZZLE_STR
+from sudoku_solve.puzzle_read import read_puzzle_line
+from sudoku_solve.puzzle_render import render_puzzle_line
+from sudoku_solve.session import SolverSession
+
+
+class TestBatch(unittest.TestCase):
+    @staticmethod
+    def __puzzles() -> list:
+        return [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.master_puzzle(), EXTREME_PUZZLE_STR,
+                PuzzleLibrary.evil_puzzle()]
+
+    def test_solve_many_in_process(self):
+        results = list(solve_many(self.__puzzles(), workers=1))
+        self.assertEqual([0, 1, 2, 3], [r.index for r in results])
+        for r in results:
+            self.assertTrue(r.solved, f"Puzzle {r.index} should have been solved")
+            self.assertTrue(read_puzzle_line(r.solution).is_solved())
+
+    def test_solve_many_with_workers(self):
+        results = list(solve_many(self.__puzzles() * 3, workers=2, chunksize=2))
+        self.assertEqual(list(range(12)), [r.index for r in results])
+        self.assertTrue(all(r.solved for r in results))
+
+    def test_solve_many_aggregates_statistics(self):
+        aggregate = StatisticsAggregator()
+        results = list(solve_many(self.__puzzles() * 2, workers=2, chunksize=1, aggregate=aggregate))
+        total = aggregate.total()
+        self.assertEqual(8, total.solves)
+        self.assertEqual(sum(r.statistics.strategies["PropagationSolver"].score for r in results),
+                         total.strategies["PropagationSolver"].score)
+
+    def test_solve_many_unordered(self):
+        results = list(solve_many(self.__puzzles(), workers=2, chunksize=1, ordered=False))
+        self.assertEqual([0, 1, 2, 3], sorted(r.index for r in results))
+
+    def test_solve_many_reports_errors(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        results = list(solve_many([line[:80] + 'x'], workers=1))
+        self.assertFalse(results[0].solved)
+        self.assertIsNotNone(results[0].error)
+
+    def test_solve_many_reports_unexpected_errors(self):
+        with mock.patch.object(SolverSession, "solve", side_effect=RuntimeError("Broken")):
+            results = list(solve_many(self.__puzzles(), workers=1))
+        self.assertEqual(4, len(results))
+        self.assertFalse(any(r.solved for r in results))
+        self.assertEqual("RuntimeError: Broken", results[0].error)
+
+    def test_line_round_trip(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        line = render_puzzle_line(puzzle)
+        self.assertEqual(81, len(line))
+        self.assertEqual(line, render_puzzle_line(read_puzzle_line(line.replace('-', '.'))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import tracemalloc
+import unittest
+from contextlib import redirect_stdout
+from io import StringIO
+
+from sudoku_solve.benchmark import benchmark, load_puzzles, main
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary, EASY_PUZZLE_STR, HARD_PUZZLE_STR
+from sudoku_solve.puzzle_render import render_puzzle
+from sudoku_solve.solver import SolveStrategy
+from sudoku_solve.strategies import default_strategies
+
+
+class ContradictionSolver(SolveStrategy):
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        raise UnsolvablePuzzle("Always")
+
+
+class TestBenchmark(unittest.TestCase):
+    def test_benchmark(self):
+        puzzles = [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.extreme_puzzle()]
+        before = [render_puzzle(p) for p in puzzles]
+        result = benchmark("sample", puzzles, default_strategies(), repeat=2)
+        self.assertEqual(4, result.puzzles)
+        self.assertEqual(4, result.solved)
+        self.assertEqual(0, result.failed)
+        self.assertLessEqual(result.p50_ms, result.p95_ms)
+        self.assertLessEqual(result.p95_ms, result.p99_ms)
+        self.assertIn("PropagationSolver", result.strategy_seconds)
+        self.assertEqual(before, [render_puzzle(p) for p in puzzles], "Benchmark should not change the puzzles")
+
+    def test_benchmark_counts_failures(self):
+        result = benchmark("failing", [PuzzleLibrary.easy_puzzle()] * 2, [ContradictionSolver()])
+        self.assertEqual(2, result.puzzles)
+        self.assertEqual(0, result.solved)
+        self.assertEqual(2, result.failed)
+        self.assertIn("2 failed", result.render())
+
+    def test_peak_memory_is_per_set(self):
+        large = benchmark("large", [PuzzleLibrary.evil_puzzle()] * 8, default_strategies())
+        small = benchmark("small", [PuzzleLibrary.easy_puzzle()], default_strategies())
+        self.assertIsNotNone(large.peak_memory_kb)
+        self.assertIsNotNone(small.peak_memory_kb)
+        self.assertLess(small.peak_memory_kb, large.peak_memory_kb)
+        self.assertFalse(tracemalloc.is_tracing())
+        self.assertIsNone(benchmark("untraced", [PuzzleLibrary.easy_puzzle()], default_strategies(),
+                                    measure_memory=False).peak_memory_kb)
+
+    def test_load_text_corpus(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "puzzles.txt")
+            with open(path, "w") as f:
+                f.write(EASY_PUZZLE_STR + "\n" + HARD_PUZZLE_STR)
+            self.assertEqual(2, len(load_puzzles(path)))
+            self.assertEqual(1, len(load_puzzles(path, limit=1)))
+
+    def test_main_json(self):
+        out = StringIO()
+        with redirect_stdout(out):
+            main(["--library", "easy,medium", "--strategies", "GroupExclusiveSolver,OnlyOptionSolver", "--json"])
+        results = json.loads(out.getvalue())
+        self.assertEqual(["easy", "medium"], [r["name"] for r in results])
+        self.assertEqual(0, results[0]["failed"])
+        self.assertEqual({"GroupExclusiveSolver", "OnlyOptionSolver"}, set(results[0]["strategy_seconds"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
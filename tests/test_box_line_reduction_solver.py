@@ -0,0 +1,55 @@
+import unittest
+
+from sudoku_solve.puzzle import PuzzleStateBuilder, Puzzle
+from sudoku_solve.box_line_reduction_solver import BoxLineReductionSolver
+from sudoku_solve.intersection_solver import IntersectionSolver
+from sudoku_solve.pointing_pairs_solver import PointingPairsSolver
+from sudoku_solve.solver import Solver
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.strategies import strategies_by_name
+
+
+def row_claiming_state() -> Puzzle:
+    # In row 0, 1 is only possible in the first block
+    return PuzzleStateBuilder.without_value(1, [(x, 0) for x in range(3, 9)])
+
+
+def column_claiming_state() -> Puzzle:
+    # In column 8, 1 is only possible in the last block
+    return PuzzleStateBuilder.without_value(1, [(8, y) for y in range(6)])
+
+
+class TestBoxLineReductionSolver(unittest.TestCase):
+    def test_row_claiming(self):
+        puzzle = row_claiming_state()
+        self.assertFalse(PointingPairsSolver().solve_puzzle(puzzle))
+        self.assertTrue(BoxLineReductionSolver().solve_puzzle(puzzle))
+        for cell in puzzle.blocks[0].cells:
+            self.assertEqual(cell.y_pos == 0, 1 in cell.options, cell.name())
+        self.assertEqual(81 * 8 - 6 - 6, puzzle.score())
+
+    def test_column_claiming(self):
+        puzzle = column_claiming_state()
+        self.assertTrue(BoxLineReductionSolver().solve_puzzle(puzzle))
+        for cell in puzzle.blocks[8].cells:
+            self.assertEqual(cell.x_pos == 8, 1 in cell.options, cell.name())
+
+    def test_intersection_solver_does_both(self):
+        # In row 0, 1 is only possible in the first block, and in the centre block it is only possible in row 4
+        puzzle = PuzzleStateBuilder.without_value(1, [*[(x, 0) for x in range(3, 9)],
+                                                      *[(x, y) for x in range(3, 6) for y in (3, 5)]])
+        self.assertTrue(IntersectionSolver().solve_puzzle(puzzle))
+        for cell in puzzle.blocks[0].cells:
+            self.assertEqual(cell.y_pos == 0, 1 in cell.options, cell.name())
+        for cell in puzzle.rows[4].cells:
+            self.assertEqual(3 <= cell.x_pos < 6, 1 in cell.options, cell.name())
+        self.assertEqual(81 * 8 - 12 - 6 - 6, puzzle.score())
+
+    def test_solve_master_puzzle(self):
+        puzzle = PuzzleLibrary.master_puzzle()
+        Solver(puzzle, strategies_by_name(["PropagationSolver", "IntersectionSolver"])).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+
+if __name__ == '__main__':
+    unittest.main()
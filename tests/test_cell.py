@@ -1,5 +1,6 @@
 import unittest
-from sudoku_solve.puzzle import Cell
+from sudoku_solve.puzzle import Cell, UnsolvablePuzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary
 
 
 class TestCell(unittest.TestCase):
@@ -33,6 +34,33 @@ class TestCell(unittest.TestCase):
         self.assertEqual(True, result)
         self.assertEqual({1, 2}, cell.options)
 
+    def test_must_be_is_option(self):
+        cell = Cell(0, 0, {1, 2, 3})
+        result = cell.must_be(2)
+        self.assertEqual(True, result)
+        self.assertEqual({2}, cell.options)
+        self.assertTrue(cell.is_known())
+        self.assertEqual(2, cell.value())
+
+    def test_must_be_is_not_option(self):
+        cell = Cell(0, 0, {1, 2, 3})
+        with self.assertRaises(UnsolvablePuzzle):
+            cell.must_be(4)
+
+    def test_cant_be_last_option(self):
+        cell = Cell(0, 0, {3})
+        with self.assertRaises(UnsolvablePuzzle):
+            cell.cant_be(3)
+
+    def test_cell_options_stored_in_puzzle_grid(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        cell = puzzle.rows[0].cells[0]
+        score_before = puzzle.score()
+        cell.cant_be_any({1, 2})
+        self.assertEqual(puzzle.grid.masks[0], cell.mask)
+        self.assertIs(cell, puzzle.columns[0].cells[0])
+        self.assertEqual(score_before - 2, puzzle.score())
+
 
 if __name__ == '__main__':
     unittest.main()
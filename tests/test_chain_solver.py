@@ -0,0 +1,94 @@
+import unittest
+
+from sudoku_solve.puzzle import PuzzleStateBuilder
+from sudoku_solve.chain_solver import XYWingSolver, SimpleColoringSolver, XChainSolver
+from sudoku_solve.puzzle_index import GROUP_CELLS, cells_of
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import Propagator
+from sudoku_solve.solver import Solver
+from sudoku_solve.strategies import default_strategies
+
+ALL = {1, 2, 3, 4, 5, 6, 7, 8, 9}
+
+
+# Value 1 is confined to (0, 0) and (4, 0) in row 0, to (4, 0) and (4, 6) in column 4, and to (4, 6) and (3, 8) in
+# block 7, which makes a chain of three strong links from (0, 0) to (3, 8).
+CHAIN_WITHOUT_ONE = [
+    *[(x, 0) for x in range(9) if x not in (0, 4)],
+    *[(4, y) for y in range(9) if y not in (0, 6)],
+    *[(x, y) for x in range(3, 6) for y in range(6, 9) if (x, y) not in ((4, 6), (3, 8))],
+]
+
+
+class TestChainSolver(unittest.TestCase):
+    def test_xy_wing(self):
+        puzzle = PuzzleStateBuilder.at_positions({(0, 0): {1, 2}, (4, 0): {1, 3}, (0, 4): {2, 3}})
+        self.assertTrue(XYWingSolver().solve_puzzle(puzzle))
+        self.assertEqual(ALL - {3}, puzzle.rows[4].cells[4].options)
+        self.assertEqual(ALL, puzzle.rows[4].cells[5].options)
+
+    def test_xy_wing_needs_distinct_pincers(self):
+        puzzle = PuzzleStateBuilder.at_positions({(0, 0): {1, 2}, (4, 0): {1, 3}, (0, 4): {1, 3}})
+        self.assertFalse(XYWingSolver().solve_puzzle(puzzle))
+        self.assertEqual(ALL, puzzle.rows[4].cells[4].options)
+
+    def test_simple_colour_trap(self):
+        puzzle = PuzzleStateBuilder.without_value(1, CHAIN_WITHOUT_ONE)
+        self.assertTrue(SimpleColoringSolver().solve_puzzle(puzzle))
+        self.assertNotIn(1, puzzle.rows[8].cells[0].options)
+        self.assertIn(1, puzzle.rows[8].cells[3].options)
+        self.assertIn(1, puzzle.rows[7].cells[0].options)
+
+    def test_simple_colour_wrap(self):
+        # Value 1 is confined to two cells in each of rows 0 and 4 and columns 1 and 5, which colours (0, 0) and
+        # (1, 2) alike although they share a block.
+        puzzle = PuzzleStateBuilder.without_value(1, [*[(x, 0) for x in range(9) if x not in (0, 5)],
+                                                      *[(5, y) for y in range(9) if y not in (0, 4)],
+                                                      *[(x, 4) for x in range(9) if x not in (1, 5)],
+                                                      *[(1, y) for y in range(9) if y not in (2, 4)]])
+        self.assertTrue(SimpleColoringSolver().solve_puzzle(puzzle))
+        self.assertNotIn(1, puzzle.rows[0].cells[0].options)
+        self.assertNotIn(1, puzzle.rows[4].cells[5].options)
+        self.assertNotIn(1, puzzle.rows[2].cells[1].options)
+        self.assertIn(1, puzzle.rows[0].cells[5].options)
+        self.assertIn(1, puzzle.rows[4].cells[1].options)
+
+    def test_x_chain(self):
+        puzzle = PuzzleStateBuilder.without_value(1, CHAIN_WITHOUT_ONE)
+        self.assertTrue(XChainSolver().solve_puzzle(puzzle))
+        self.assertNotIn(1, puzzle.rows[8].cells[0].options)
+        self.assertIn(1, puzzle.rows[0].cells[0].options)
+        self.assertIn(1, puzzle.rows[8].cells[3].options)
+
+    def test_link_graph_follows_changes(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        graph = puzzle.link_graph()
+        graph.strong_links(5)
+        Propagator(puzzle).propagate()
+        XChainSolver().solve_puzzle(puzzle)
+        for value in range(1, 10):
+            expected = sum(1 << i for i in range(81) if value in puzzle.cells[i].options)
+            self.assertEqual(expected, graph.cells_with(value))
+            for group, cells in enumerate(GROUP_CELLS):
+                places = tuple(i for i in cells if value in puzzle.cells[i].options)
+                self.assertEqual(places if len(places) == 2 else None, graph.conjugate(group, value))
+        self.assertEqual([i for i in range(81) if len(puzzle.cells[i].options) == 2], cells_of(graph.bivalue))
+
+    def test_solves_with_default_strategies(self):
+        # Value 1 is confined to (0, 0) and (4, 0) in row 0 and to (1, 3) and (4, 3) in row 3, two strong links joined
+        # by a weak link in column 4, which only an X-chain can use.
+        states = {
+            "XYWingSolver": PuzzleStateBuilder.at_positions({(0, 0): {1, 2}, (4, 0): {1, 3}, (0, 4): {2, 3}}),
+            "SimpleColoringSolver": PuzzleStateBuilder.without_value(1, CHAIN_WITHOUT_ONE),
+            "XChainSolver": PuzzleStateBuilder.without_value(1, [*[(x, 0) for x in range(9) if x not in (0, 4)],
+                                                                 *[(x, 3) for x in range(9) if x not in (1, 4)]]),
+        }
+        for strategy, puzzle in states.items():
+            with self.subTest(strategy):
+                statistics = Solver(puzzle, default_strategies()).solve()
+                self.assertTrue(puzzle.is_solved())
+                self.assertGreater(statistics.strategies[strategy].score, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
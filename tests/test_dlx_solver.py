@@ -0,0 +1,44 @@
+import unittest
+
+from sudoku_solve.solver import Solver
+from sudoku_solve.puzzle_library import PuzzleLibrary, EXTREME_PUZZLE_STR
+from sudoku_solve.puzzle_render import render_puzzle
+from sudoku_solve.dlx_solver import DancingLinks, DancingLinksSolver
+
+
+class TestDancingLinks(unittest.TestCase):
+    def test_solve_library_puzzles(self):
+        links = DancingLinks()
+        for puzzle in [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.medium_puzzle(), PuzzleLibrary.hard_puzzle(),
+                       PuzzleLibrary.expert_puzzle(), PuzzleLibrary.master_puzzle(),
+                       PuzzleLibrary.extreme_puzzle(), PuzzleLibrary.evil_puzzle()]:
+            before = render_puzzle(puzzle)
+            solutions = links.solve(puzzle)
+            self.assertTrue(solutions, "Puzzle should have a solution")
+            self.assertTrue(solutions[0].is_solved(), "Puzzle should have been solved")
+            self.assertEqual(before, render_puzzle(puzzle), "Input puzzle should not change")
+
+    def test_solve_string(self):
+        solutions = DancingLinks().solve(EXTREME_PUZZLE_STR, limit=2)
+        self.assertEqual(1, len(solutions))
+        self.assertTrue(solutions[0].is_solved(), "Puzzle should have been solved")
+
+    def test_links_restored_between_solves(self):
+        links = DancingLinks()
+        left, right, up, down, size = (list(links.left), list(links.right), list(links.up), list(links.down),
+                                       list(links.size))
+        links.solve(PuzzleLibrary.extreme_puzzle())
+        self.assertEqual((left, right, up, down, size), (links.left, links.right, links.up, links.down, links.size))
+
+    def test_multiple_solutions(self):
+        empty = "\n".join(["---------"] * 9)
+        self.assertEqual(3, len(DancingLinks().solve(empty, limit=3)))
+
+    def test_solver_strategy(self):
+        puzzle = PuzzleLibrary.evil_puzzle()
+        Solver(puzzle, [DancingLinksSolver()]).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+
+if __name__ == '__main__':
+    unittest.main()
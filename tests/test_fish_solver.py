@@ -0,0 +1,46 @@
+import unittest
+
+from sudoku_solve.puzzle import PuzzleStateBuilder, Puzzle, UnsolvablePuzzle
+from sudoku_solve.fish_solver import FishSolver
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.solver import Solver
+
+
+def puzzle_with_ones(places: dict[int, set[int]]) -> Puzzle:
+    """Build a puzzle state where each row in `places` only has value 1 in the given columns."""
+    return PuzzleStateBuilder.without_value(1, [(x, y) for y, columns in places.items()
+                                                for x in range(9) if x not in columns])
+
+
+class TestFishSolver(unittest.TestCase):
+    def test_x_wing(self):
+        puzzle = puzzle_with_ones({0: {2, 6}, 4: {2, 6}})
+        self.assertTrue(FishSolver(2).solve_puzzle(puzzle))
+        for y in range(9):
+            for x in (2, 6):
+                self.assertEqual(y in (0, 4), 1 in puzzle.rows[y].cells[x].options, f"{x}, {y}")
+        self.assertIn(1, puzzle.rows[1].cells[0].options)
+
+    def test_swordfish(self):
+        puzzle = puzzle_with_ones({1: {0, 3}, 5: {3, 8}, 7: {0, 8}})
+        self.assertFalse(FishSolver(2).solve_puzzle(puzzle))
+        self.assertTrue(FishSolver(3).solve_puzzle(puzzle))
+        places = {1: {0, 3}, 5: {3, 8}, 7: {0, 8}}
+        for y in range(9):
+            for x in (0, 3, 8):
+                self.assertEqual(x in places.get(y, ()), 1 in puzzle.rows[y].cells[x].options, f"{x}, {y}")
+
+    def test_too_few_columns(self):
+        puzzle = puzzle_with_ones({0: {2, 6}, 4: {2, 6}, 8: {2, 6}})
+        with self.assertRaises(UnsolvablePuzzle):
+            FishSolver(3).solve_puzzle(puzzle)
+
+    def test_solves_with_default_strategies(self):
+        puzzle = puzzle_with_ones({0: {2, 6}, 4: {2, 6}})
+        statistics = Solver(puzzle, default_strategies()).solve()
+        self.assertTrue(puzzle.is_solved())
+        self.assertGreater(statistics.strategies["FishSolver"].score, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
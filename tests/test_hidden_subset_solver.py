@@ -0,0 +1,41 @@
+import unittest
+
+from sudoku_solve.puzzle import PuzzleStateBuilder
+from sudoku_solve.hidden_subset_solver import HiddenSubsetSolver
+from sudoku_solve.hidden_pairs_solver import HiddenPairsSolver
+from sudoku_solve.puzzle_index import GROUP_CELLS
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import Propagator
+
+
+WITHOUT_123 = {4, 5, 6, 7, 8, 9}
+
+
+class TestHiddenSubsetSolver(unittest.TestCase):
+    def test_hidden_pair(self):
+        puzzle = PuzzleStateBuilder.first_row({1, 2, 5}, {1, 2, 6}, *[{3, 4, 5, 6, 7, 8, 9}] * 7)
+        self.assertTrue(HiddenPairsSolver().solve_puzzle(puzzle))
+        self.assertEqual({1, 2}, puzzle.rows[0].cells[0].options)
+        self.assertEqual({1, 2}, puzzle.rows[0].cells[1].options)
+
+    def test_hidden_triple(self):
+        puzzle = PuzzleStateBuilder.first_row({1, 2, 5}, {2, 3, 6}, {1, 3, 7}, *[WITHOUT_123] * 6)
+        self.assertFalse(HiddenPairsSolver().solve_puzzle(puzzle))
+        self.assertTrue(HiddenSubsetSolver(3).solve_puzzle(puzzle))
+        self.assertEqual({1, 2}, puzzle.rows[0].cells[0].options)
+        self.assertEqual({2, 3}, puzzle.rows[0].cells[1].options)
+        self.assertEqual({1, 3}, puzzle.rows[0].cells[2].options)
+
+    def test_position_index_follows_changes(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        index = puzzle.position_index()
+        Propagator(puzzle).propagate()
+        HiddenSubsetSolver().solve_puzzle(puzzle)
+        for group, cells in enumerate(GROUP_CELLS):
+            for value in range(1, 10):
+                expected = sum(1 << p for p, i in enumerate(cells) if value in puzzle.cells[i].options)
+                self.assertEqual(expected, index.of(group, value))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,36 @@
+import unittest
+
+from sudoku_solve.puzzle import PuzzleStateBuilder, UnsolvablePuzzle
+from sudoku_solve.naked_subset_solver import NakedSubsetSolver
+from sudoku_solve.solver import Solver
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.strategies import default_strategies
+
+
+class TestNakedSubsetSolver(unittest.TestCase):
+    def test_naked_triple(self):
+        puzzle = PuzzleStateBuilder.first_row({1, 2}, {2, 3}, {1, 3})
+        self.assertTrue(NakedSubsetSolver(3).solve_puzzle(puzzle))
+        self.assertEqual({4, 5, 6, 7, 8, 9}, puzzle.rows[0].cells[5].options)
+        self.assertEqual({4, 5, 6, 7, 8, 9}, puzzle.blocks[0].cells[4].options)
+        self.assertEqual({1, 2}, puzzle.rows[0].cells[0].options)
+
+    def test_naked_quad(self):
+        puzzle = PuzzleStateBuilder.first_row({1, 2}, {2, 3}, {3, 4}, {1, 4, 9}, {1, 4})
+        self.assertFalse(NakedSubsetSolver(3).solve_puzzle(puzzle))
+        self.assertTrue(NakedSubsetSolver(4).solve_puzzle(puzzle))
+        self.assertEqual({9}, puzzle.rows[0].cells[3].options)
+
+    def test_too_few_options(self):
+        puzzle = PuzzleStateBuilder.first_row({1, 2}, {1, 2}, {1, 2})
+        with self.assertRaises(UnsolvablePuzzle):
+            NakedSubsetSolver(3).solve_puzzle(puzzle)
+
+    def test_solve_extreme_puzzle(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        Solver(puzzle, default_strategies()).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,45 @@
+import unittest
+
+from sudoku_solve.puzzle import UnsolvablePuzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import Propagator
+from sudoku_solve.search_solver import SearchSolver
+
+
+class TestOccupancyIndex(unittest.TestCase):
+    def test_conflict_detected_on_assignment(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        self.assertTrue(puzzle.is_valid())
+        known = next(c for c in puzzle.rows[0].cells if c.is_known()).value()
+        peer = next(c for c in puzzle.rows[0].cells if not c.is_known())
+        peer.must_be(known)
+        self.assertFalse(puzzle.is_valid())
+        self.assertFalse(all(g.is_valid() for g in puzzle.groups))
+
+    def test_counts_follow_restore(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        snapshot = puzzle.snapshot()
+        SearchSolver().solve_puzzle(puzzle)
+        self.assertTrue(puzzle.is_solved())
+        self.assertEqual(81, puzzle.occupancy.known)
+        puzzle.restore(snapshot)
+        self.assertFalse(puzzle.is_solved())
+        self.assertEqual(sum(1 for m in snapshot if m.bit_count() == 1), puzzle.occupancy.known)
+        self.assertTrue(puzzle.is_valid())
+
+    def test_empty_cell_is_invalid(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        masks = puzzle.snapshot()
+        masks[1] = 0
+        puzzle.restore(masks)
+        self.assertFalse(puzzle.is_valid())
+
+    def test_propagation_of_invalid_puzzle_fails(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        puzzle.cells[0].must_be(puzzle.cells[4].value())
+        with self.assertRaises(UnsolvablePuzzle):
+            Propagator(puzzle).propagate()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+
+from sudoku_solve.solver import Solver, SolveStrategy
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import Propagator, PropagationSolver
+from sudoku_solve.naked_pairs_solver import NakedPairsSolver
+from sudoku_solve.hidden_pairs_solver import HiddenPairsSolver
+from sudoku_solve.pointing_pairs_solver import PointingPairsSolver
+
+
+class TestPropagation(unittest.TestCase):
+    @staticmethod
+    def __strategies() -> list[SolveStrategy]:
+        return [
+            PropagationSolver(),
+            NakedPairsSolver(),
+            HiddenPairsSolver(),
+            PointingPairsSolver(),
+        ]
+
+    def test_propagate_easy_puzzle(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        self.assertTrue(Propagator(puzzle).propagate())
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+    def test_propagation_reaches_fixpoint(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        propagator = Propagator(puzzle)
+        propagator.propagate()
+        self.assertFalse(propagator.propagate())
+
+    def test_propagation_picks_up_other_changes(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        propagator = Propagator(puzzle)
+        propagator.propagate()
+        solution = puzzle.copy()
+        Solver(solution, self.__strategies()).solve()
+        self.assertTrue(solution.is_solved())
+        cell = puzzle.unsolved_cells()[0]
+        value = solution.cells[cell.index].value()
+        cell.must_be(value)
+        self.assertTrue(propagator.propagate())
+        self.assertTrue(all(value not in p.options for p in puzzle.peers(cell)))
+
+    def test_solve_with_propagation(self):
+        for puzzle in [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.medium_puzzle(), PuzzleLibrary.hard_puzzle(),
+                       PuzzleLibrary.expert_puzzle(), PuzzleLibrary.master_puzzle(),
+                       PuzzleLibrary.extreme_puzzle()]:
+            Solver(puzzle, self.__strategies()).solve()
+            self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import os
+import tempfile
+import unittest
+
+from sudoku_solve.puzzle import MalformedPuzzle
+from sudoku_solve.puzzle_corpus import PuzzleCorpus, RecordFormat, write_corpus
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.puzzle_read import read_puzzle_digits, read_puzzle_masks
+from sudoku_solve.puzzle_render import render_puzzle, render_puzzle_digits, render_puzzle_masks
+from sudoku_solve.propagation import Propagator
+
+
+class TestPuzzleCorpus(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "puzzles.bin")
+        self.puzzles = [PuzzleLibrary.easy_puzzle(), PuzzleLibrary.medium_puzzle(), PuzzleLibrary.hard_puzzle(),
+                        PuzzleLibrary.expert_puzzle(), PuzzleLibrary.master_puzzle()]
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_digits_round_trip(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        data = render_puzzle_digits(puzzle)
+        self.assertEqual(41, len(data))
+        self.assertEqual(render_puzzle(puzzle), render_puzzle(read_puzzle_digits(data)))
+
+    def test_masks_round_trip(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        Propagator(puzzle).propagate()
+        data = render_puzzle_masks(puzzle)
+        self.assertEqual(162, len(data))
+        self.assertEqual(puzzle.grid.masks, read_puzzle_masks(data).grid.masks)
+
+    def test_corpus_random_access(self):
+        for record_format in RecordFormat:
+            with open(self.path, "wb") as f:
+                self.assertEqual(5, write_corpus(f, self.puzzles, record_format))
+            with PuzzleCorpus(self.path) as corpus:
+                self.assertEqual(record_format, corpus.record_format)
+                self.assertEqual(5, len(corpus))
+                self.assertEqual(render_puzzle(self.puzzles[3]), render_puzzle(corpus[3]))
+                self.assertEqual(render_puzzle(self.puzzles[4]), render_puzzle(corpus[-1]))
+                self.assertEqual([render_puzzle(p) for p in self.puzzles], [render_puzzle(p) for p in corpus])
+                with self.assertRaises(IndexError):
+                    corpus.record(5)
+
+    def test_shards(self):
+        with open(self.path, "wb") as f:
+            write_corpus(f, self.puzzles)
+        with PuzzleCorpus(self.path) as corpus:
+            shards = [corpus.shard(i, 3) for i in range(3)]
+            self.assertEqual(list(range(5)), [i for s in shards for i in s])
+
+    def test_not_a_corpus(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a corpus file")
+        with self.assertRaises(MalformedPuzzle):
+            PuzzleCorpus(self.path)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,28 @@
+import unittest
+
+from sudoku_solve.puzzle_index import PEERS, GROUP_CELLS, CELL_GROUPS
+from sudoku_solve.puzzle_library import PuzzleLibrary
+
+
+class TestPuzzleIndex(unittest.TestCase):
+    def test_group_cells_match_puzzle_groups(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        for group, indices in zip(puzzle.groups, GROUP_CELLS):
+            self.assertEqual(list(indices), [c.index for c in group.cells], group.name())
+
+    def test_peers(self):
+        for index, peers in enumerate(PEERS):
+            self.assertEqual(20, len(peers))
+            self.assertNotIn(index, peers)
+
+    def test_cell_groups(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        for cell in puzzle.cells:
+            related = puzzle.cell_groups(cell)
+            self.assertEqual([puzzle.groups[g] for g in CELL_GROUPS[cell.index]], related.groups)
+            for group in related.groups:
+                self.assertIn(cell, group.cells)
+
+
+if __name__ == '__main__':
+    unittest.main()
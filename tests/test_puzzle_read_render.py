@@ -1,7 +1,7 @@
 import unittest
 from io import StringIO
 
-from sudoku_solve.puzzle import UnsolvablePuzzle, MalformedPuzzle
+from sudoku_solve.puzzle import UnsolvablePuzzle, MalformedPuzzle, AmbiguousPuzzle
 from sudoku_solve.puzzle_read import read_puzzle
 from sudoku_solve.puzzle_render import render_puzzle
 from sudoku_solve.puzzle_library import EASY_PUZZLE_STR, MEDIUM_PUZZLE_STR, HARD_PUZZLE_STR, EXPERT_PUZZLE_STR, \
@@ -147,6 +147,14 @@ class TestPuzzleRead(unittest.TestCase):
         except MalformedPuzzle:
             pass
 
+    def test_check_unique_solution(self) -> None:
+        p = read_puzzle(StringIO(EXTREME_PUZZLE_STR), check_solutions=True)
+        self.assertEqualStripped(EXTREME_PUZZLE_STR, render_puzzle(p))
+
+    def test_check_ambiguous_puzzle(self) -> None:
+        with self.assertRaises(AmbiguousPuzzle):
+            read_puzzle(StringIO(EVIL_PUZZLE_STR), check_solutions=True)
+
     def assertEqualStripped(self, first: str, second: str, msg: str | None = None) -> None:
         self.assertEqual(first.strip(), second.strip(), msg)
 
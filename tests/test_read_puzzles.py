@@ -0,0 +1,50 @@
+import unittest
+from io import StringIO
+
+from sudoku_solve.puzzle import MalformedPuzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_read import read_puzzles
+from sudoku_solve.puzzle_render import render_puzzle, render_puzzle_line
+from sudoku_solve.puzzle_library import PuzzleLibrary, EASY_PUZZLE_STR, HARD_PUZZLE_STR, EXTREME_PUZZLE_STR
+
+
+class TestReadPuzzles(unittest.TestCase):
+    def test_mixed_formats(self):
+        extreme_line = render_puzzle_line(PuzzleLibrary.extreme_puzzle()).replace('-', '0')
+        text = f"# A comment\n{EASY_PUZZLE_STR}\n{extreme_line}\n{HARD_PUZZLE_STR}{extreme_line.replace('0', '.')}\n"
+        puzzles = list(read_puzzles(StringIO(text)))
+        self.assertEqual(4, len(puzzles))
+        self.assertEqual(EASY_PUZZLE_STR.strip(), render_puzzle(puzzles[0]).strip())
+        self.assertEqual(EXTREME_PUZZLE_STR.strip(), render_puzzle(puzzles[1]).strip())
+        self.assertEqual(HARD_PUZZLE_STR.strip(), render_puzzle(puzzles[2]).strip())
+        self.assertEqual(EXTREME_PUZZLE_STR.strip(), render_puzzle(puzzles[3]).strip())
+
+    def test_consecutive_grids(self):
+        text = EASY_PUZZLE_STR.strip() + "\n" + HARD_PUZZLE_STR.strip()
+        self.assertEqual(2, len(list(read_puzzles(StringIO(text)))))
+
+    def test_reads_lazily(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        puzzles = read_puzzles(StringIO(f"{line}\nnot a puzzle\n"))
+        self.assertIsNotNone(next(puzzles))
+        with self.assertRaises(MalformedPuzzle):
+            next(puzzles)
+
+    def test_error_has_line_number(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        text = f"{line}\n\n{EASY_PUZZLE_STR.strip()[:-1]}x\n"
+        with self.assertRaisesRegex(MalformedPuzzle, "^Line 3: "):
+            list(read_puzzles(StringIO(text)))
+
+    def test_invalid_puzzle_error(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        with self.assertRaisesRegex(UnsolvablePuzzle, "^Line 1: "):
+            list(read_puzzles(StringIO("11" + line[2:])))
+
+    def test_skip_invalid(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        text = f"{line}\n{line[:40]}\n{EASY_PUZZLE_STR}\n---\n\n{'11' + line[2:]}\n{line}\n"
+        self.assertEqual(3, len(list(read_puzzles(StringIO(text), skip_invalid=True))))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from io import StringIO
+
+from sudoku_solve.solver import Solver, SolveStrategy
+from sudoku_solve.puzzle import UnsolvablePuzzle
+from sudoku_solve.puzzle_read import read_puzzle, read_puzzle_line
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import PropagationSolver
+from sudoku_solve.naked_pairs_solver import NakedPairsSolver
+from sudoku_solve.hidden_pairs_solver import HiddenPairsSolver
+from sudoku_solve.pointing_pairs_solver import PointingPairsSolver
+from sudoku_solve.puzzle_render import render_puzzle, render_puzzle_line
+from sudoku_solve.search_solver import SearchSolver, count_solutions
+
+
+class TestSearchSolver(unittest.TestCase):
+    @staticmethod
+    def __strategies() -> list[SolveStrategy]:
+        return [
+            PropagationSolver(),
+            NakedPairsSolver(),
+            HiddenPairsSolver(),
+            PointingPairsSolver(),
+            SearchSolver(),
+        ]
+
+    def test_solve_evil_puzzle(self):
+        puzzle = PuzzleLibrary.evil_puzzle()
+        Solver(puzzle, self.__strategies()).solve()
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+    def test_search_alone(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        self.assertTrue(SearchSolver().solve_puzzle(puzzle))
+        self.assertTrue(puzzle.is_solved(), "Puzzle should have been solved")
+
+    def test_search_solved_puzzle(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        SearchSolver().solve_puzzle(puzzle)
+        self.assertFalse(SearchSolver().solve_puzzle(puzzle))
+
+    def test_search_unsolvable_puzzle(self):
+        puzzle = read_puzzle(StringIO(
+            """
+            12345678-
+            --------9
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            """
+        ))
+        with self.assertRaises(UnsolvablePuzzle):
+            SearchSolver().solve_puzzle(puzzle)
+
+    def test_count_unique_solution(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        before = render_puzzle(puzzle)
+        self.assertEqual(1, count_solutions(puzzle))
+        self.assertEqual(before, render_puzzle(puzzle), "Counting should not change the puzzle")
+
+    def test_count_stops_at_limit(self):
+        puzzle = PuzzleLibrary.evil_puzzle()
+        self.assertEqual(2, count_solutions(puzzle))
+        self.assertEqual(5, count_solutions(puzzle, limit=5))
+
+    def test_count_no_solution(self):
+        puzzle = read_puzzle(StringIO(
+            """
+            12345678-
+            --------9
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            ---------
+            """
+        ))
+        self.assertEqual(0, count_solutions(puzzle))
+
+    def test_search_leaves_no_listeners(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        listeners = len(puzzle.grid.listeners)
+        count_solutions(puzzle)
+        self.assertEqual(listeners, len(puzzle.grid.listeners))
+        SearchSolver().solve_puzzle(puzzle)
+        self.assertEqual(listeners, len(puzzle.grid.listeners))
+        puzzle = read_puzzle_line(render_puzzle_line(PuzzleLibrary.extreme_puzzle()), check_solutions=True)
+        self.assertEqual(listeners, len(puzzle.grid.listeners))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from sudoku_solve.puzzle import MalformedPuzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_index import GROUP_CELLS
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.puzzle_render import render_puzzle_line
+from sudoku_solve.session import SolverSession
+from sudoku_solve.solver import Solver
+from sudoku_solve.strategies import default_strategies
+
+
+class TestSolverSession(unittest.TestCase):
+    def test_solves_puzzles_in_turn(self):
+        session = SolverSession()
+        puzzle = session.puzzle
+        for factory in (PuzzleLibrary.extreme_puzzle, PuzzleLibrary.easy_puzzle, PuzzleLibrary.master_puzzle,
+                        PuzzleLibrary.medium_puzzle):
+            expected = factory()
+            Solver(expected, default_strategies()).solve()
+            statistics = session.solve(render_puzzle_line(factory()))
+            self.assertTrue(session.is_solved())
+            self.assertEqual(render_puzzle_line(expected), session.solution())
+            self.assertTrue(statistics.strategies)
+            self.assertIs(puzzle, session.puzzle)
+
+    def test_indexes_follow_load(self):
+        session = SolverSession()
+        session.solve(render_puzzle_line(PuzzleLibrary.extreme_puzzle()))
+        puzzle = session.load(render_puzzle_line(PuzzleLibrary.hard_puzzle()))
+        self.assertEqual(PuzzleLibrary.hard_puzzle().grid.masks, puzzle.grid.masks)
+        index = puzzle.position_index()
+        for group, cells in enumerate(GROUP_CELLS):
+            for value in range(1, 10):
+                expected = sum(1 << p for p, i in enumerate(cells) if value in puzzle.cells[i].options)
+                self.assertEqual(expected, index.of(group, value))
+        self.assertEqual(sum(1 for c in puzzle.cells if c.is_known()), puzzle.occupancy.known)
+
+    def test_invalid_puzzles(self):
+        session = SolverSession()
+        with self.assertRaises(MalformedPuzzle):
+            session.load("12")
+        with self.assertRaises(MalformedPuzzle):
+            session.load("x" * 81)
+        with self.assertRaises(UnsolvablePuzzle):
+            session.load("11" + "-" * 79)
+        session.solve(render_puzzle_line(PuzzleLibrary.easy_puzzle()))
+        self.assertTrue(session.is_solved())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+import unittest
+
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.propagation import Propagator
+from sudoku_solve.puzzle_index import GROUP_CELLS
+from sudoku_solve.search_solver import count_solutions
+from sudoku_solve.undo_trail import UndoTrail
+from sudoku_solve.solver import Solver
+from sudoku_solve.strategies import default_strategies
+
+
+class TestSnapshot(unittest.TestCase):
+    def test_restore_snapshot(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        index = puzzle.position_index()
+        snapshot = puzzle.snapshot()
+        Propagator(puzzle).propagate()
+        self.assertNotEqual(snapshot, puzzle.grid.masks)
+        puzzle.restore(snapshot)
+        self.assertEqual(snapshot, puzzle.grid.masks)
+        self.assertEqual(PuzzleLibrary.extreme_puzzle().position_index().positions, index.positions)
+
+    def test_copy_is_independent(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        copy = puzzle.copy()
+        self.assertEqual(puzzle, copy)
+        Propagator(copy).propagate()
+        self.assertEqual(PuzzleLibrary.extreme_puzzle(), puzzle)
+        self.assertTrue(copy.cells[0].grid is copy.grid)
+
+    def test_undo_to_mark(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        index = puzzle.position_index()
+        trail = UndoTrail(puzzle.grid)
+        puzzle.cells[1].cant_be(2)
+        mark = trail.mark()
+        before = puzzle.snapshot()
+        Propagator(puzzle).propagate()
+        trail.rollback(mark)
+        self.assertEqual(before, puzzle.grid.masks)
+        trail.rollback(0)
+        self.assertEqual(PuzzleLibrary.extreme_puzzle().grid.masks, puzzle.grid.masks)
+        self.assertEqual(0, len(trail.entries))
+        for group, cells in enumerate(GROUP_CELLS):
+            for value in range(1, 10):
+                expected = sum(1 << p for p, i in enumerate(cells) if value in puzzle.cells[i].options)
+                self.assertEqual(expected, index.of(group, value))
+        trail.detach()
+        puzzle.cells[1].cant_be(2)
+        self.assertEqual(0, len(trail.entries))
+
+    def test_count_solutions_leaves_puzzle_unchanged(self):
+        puzzle = PuzzleLibrary.evil_puzzle()
+        before = puzzle.snapshot()
+        self.assertEqual(2, count_solutions(puzzle))
+        self.assertEqual(before, puzzle.grid.masks)
+
+    def test_trail_records_strategies(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        trail = UndoTrail(puzzle.grid)
+        Solver(puzzle, default_strategies(), trail=trail).solve()
+        self.assertTrue(puzzle.is_solved())
+        changes = list(trail.changes())
+        self.assertEqual(len(trail.entries), len(changes))
+        self.assertIn("PropagationSolver", {c.strategy for c in changes})
+        self.assertNotIn(None, {c.strategy for c in changes})
+        first = changes[0]
+        self.assertFalse(first.restored)
+        self.assertIn(first.value, PuzzleLibrary.extreme_puzzle().cells[first.index].options)
+
+        replayed = PuzzleLibrary.extreme_puzzle()
+        trail.replay(replayed.grid)
+        self.assertEqual(puzzle.grid.masks, replayed.grid.masks)
+
+        halfway = len(trail.entries) // 2
+        partial = PuzzleLibrary.extreme_puzzle()
+        trail.replay(partial.grid, 0, halfway)
+        trail.rollback(halfway)
+        self.assertEqual(partial.grid.masks, puzzle.grid.masks)
+        trail.rollback(0)
+        self.assertEqual(PuzzleLibrary.extreme_puzzle().grid.masks, puzzle.grid.masks)
+
+
+if __name__ == '__main__':
+    unittest.main()
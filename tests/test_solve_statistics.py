@@ -0,0 +1,84 @@
+import unittest
+
+import threading
+
+from sudoku_solve.solver import Solver, SolveStatistics, StatisticsHook, StatisticsAggregator
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.strategies import default_strategies
+
+
+class RecordingHook(StatisticsHook):
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, int, int, int]] = []
+
+    def strategy_applied(self, strategy: str, score: int, cells_touched: int, nanoseconds: int) -> None:
+        self.calls.append((strategy, score, cells_touched, nanoseconds))
+
+
+class TestSolveStatistics(unittest.TestCase):
+    def test_record_aggregates(self):
+        statistics = SolveStatistics()
+        for _ in range(100):
+            statistics.record("A", 0, 0, 10)
+        statistics.record("A", 5, 2, 20)
+        statistics.record("B", 3, 1, 30)
+        self.assertEqual(2, len(statistics.strategies))
+        a = statistics.strategies["A"]
+        self.assertEqual((101, 1, 5, 2, 1020), (a.invocations, a.successes, a.score, a.cells_touched, a.nanoseconds))
+
+    def test_solver_records_statistics(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        score_before = puzzle.score()
+        hook = RecordingHook()
+        statistics = SolveStatistics(hooks=[hook])
+        Solver(puzzle, default_strategies(), statistics).solve()
+        self.assertEqual(score_before, sum(s.score for s in statistics.strategies.values()))
+        self.assertEqual(sum(s.invocations for s in statistics.strategies.values()), len(hook.calls))
+        propagation = statistics.strategies["PropagationSolver"]
+        self.assertGreater(propagation.cells_touched, 0)
+        self.assertGreater(propagation.nanoseconds, 0)
+        self.assertIn("PropagationSolver: ", statistics.render())
+
+    def test_solvers_do_not_share_statistics(self):
+        first = Solver(PuzzleLibrary.easy_puzzle(), default_strategies())
+        second = Solver(PuzzleLibrary.easy_puzzle(), default_strategies())
+        self.assertIsNot(first.statistics, second.statistics)
+        first.solve()
+        self.assertEqual(1, first.statistics.solves)
+        self.assertEqual({}, second.statistics.strategies)
+
+    def test_rollup(self):
+        solves = [Solver(f(), default_strategies()).solve()
+                  for f in (PuzzleLibrary.easy_puzzle, PuzzleLibrary.extreme_puzzle, PuzzleLibrary.extreme_puzzle)]
+        total = SolveStatistics.rollup(solves)
+        self.assertEqual(3, total.solves)
+        for name, stats in total.strategies.items():
+            parts = [s.strategies[name] for s in solves if name in s.strategies]
+            self.assertEqual(sum(p.invocations for p in parts), stats.invocations)
+            self.assertEqual(sum(p.score for p in parts), stats.score)
+            self.assertEqual(sum(p.nanoseconds for p in parts), stats.nanoseconds)
+        self.assertEqual(1, solves[0].solves)
+
+    def test_aggregator_from_threads(self):
+        aggregate = StatisticsAggregator()
+        one = SolveStatistics(solves=1)
+        one.record("A", 1, 1, 1)
+
+        def add_many() -> None:
+            for _ in range(500):
+                aggregate.add(one)
+
+        threads = [threading.Thread(target=add_many) for _ in range(4)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        total = aggregate.total()
+        self.assertEqual(2000, total.solves)
+        self.assertEqual(2000, total.strategies["A"].score)
+        total.record("A", 1)
+        self.assertEqual(2000, aggregate.total().strategies["A"].score)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import io
+import json
+import sys
+import unittest
+
+from sudoku_solve.puzzle import Puzzle, UnsolvablePuzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.solver import Solver, SolverHook, SolveStrategy
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.profiling import ProfileHook, SpanHook
+
+
+class RecordingHook(SolverHook):
+    def __init__(self):
+        self.events = []
+
+    def before_strategy(self, puzzle, strategy):
+        self.events.append(("before", strategy.strategy_name()))
+
+    def after_strategy(self, puzzle, strategy, made_progress, nanoseconds):
+        self.events.append(("after", strategy.strategy_name(), made_progress))
+
+    def on_elimination(self, index, value):
+        self.events.append(("eliminate", index, value))
+
+    def on_assignment(self, index, value):
+        self.events.append(("assign", index, value))
+
+    def on_contradiction(self, puzzle, strategy, error):
+        self.events.append(("contradiction", strategy.strategy_name()))
+
+
+class ContradictionSolver(SolveStrategy):
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        raise UnsolvablePuzzle("Always")
+
+
+class FailingSolver(SolveStrategy):
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        raise ValueError("Broken")
+
+
+class FailsSecondTimeSolver(SolveStrategy):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def solve_puzzle(self, puzzle: Puzzle) -> bool:
+        self.calls += 1
+        if self.calls > 1:
+            raise UnsolvablePuzzle("Second time")
+        return False
+
+
+class TestSolverHooks(unittest.TestCase):
+    def test_hook_sees_every_change(self):
+        puzzle = PuzzleLibrary.extreme_puzzle()
+        unknown = len(puzzle.unsolved_cells())
+        score = puzzle.score()
+        hook = RecordingHook()
+        Solver(puzzle, default_strategies(), hooks=[hook]).solve()
+        self.assertTrue(puzzle.is_solved())
+        self.assertEqual(score, sum(1 for e in hook.events if e[0] == "eliminate"))
+        assigned = {e[1]: e[2] for e in hook.events if e[0] == "assign"}
+        self.assertEqual(unknown, len(assigned))
+        self.assertTrue(all(puzzle.cells[i].value() == v for i, v in assigned.items()))
+        befores = [e[1] for e in hook.events if e[0] == "before"]
+        afters = [e[1] for e in hook.events if e[0] == "after"]
+        self.assertEqual(befores, afters)
+
+    def test_contradiction(self):
+        hook = RecordingHook()
+        solver = Solver(PuzzleLibrary.easy_puzzle(), [ContradictionSolver()])
+        solver.add_hook(hook)
+        with self.assertRaises(UnsolvablePuzzle):
+            solver.solve()
+        self.assertEqual([("before", "ContradictionSolver"), ("after", "ContradictionSolver", False),
+                          ("contradiction", "ContradictionSolver")], hook.events)
+
+    def test_after_strategy_on_error(self):
+        hook = RecordingHook()
+        profile = ProfileHook()
+        solver = Solver(PuzzleLibrary.easy_puzzle(), [FailingSolver()], hooks=[hook, profile])
+        with self.assertRaises(ValueError):
+            solver.solve()
+        self.assertEqual([("before", "FailingSolver"), ("after", "FailingSolver", False)], hook.events)
+        self.assertIsNone(sys.getprofile())
+
+    def test_close_stops_listening(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        listeners = len(puzzle.grid.listeners)
+        solver = Solver(puzzle, default_strategies(), hooks=[RecordingHook()])
+        solver.close()
+        self.assertEqual(listeners, len(puzzle.grid.listeners))
+        self.assertEqual([], solver.hooks)
+
+    def test_remove_hook_stops_listening(self):
+        puzzle = PuzzleLibrary.easy_puzzle()
+        listeners = len(puzzle.grid.listeners)
+        solver = Solver(puzzle, default_strategies())
+        hook = RecordingHook()
+        solver.add_hook(hook)
+        solver.remove_hook(hook)
+        self.assertEqual(listeners, len(puzzle.grid.listeners))
+
+    def test_profile_and_spans(self):
+        profile = ProfileHook()
+        spans = SpanHook()
+        Solver(PuzzleLibrary.extreme_puzzle(), default_strategies(), hooks=[profile, spans]).solve()
+        self.assertIn("PropagationSolver", profile.profiles)
+        self.assertGreater(profile.stats("PropagationSolver").total_calls, 0)
+        self.assertTrue(spans.spans)
+        folded = spans.folded().splitlines()
+        self.assertIn("solve;PropagationSolver", [line.split(" ")[0] for line in folded])
+        out = io.StringIO()
+        spans.write_chrome_trace(out)
+        events = json.loads(out.getvalue())
+        self.assertEqual(len(spans.spans), len(events))
+        self.assertEqual("X", events[0]["ph"])
+
+    def test_dropped_span_contradiction(self):
+        spans = SpanHook(max_spans=1)
+        solver = Solver(PuzzleLibrary.easy_puzzle(), [FailsSecondTimeSolver()], hooks=[spans])
+        solver.solve()
+        with self.assertRaises(UnsolvablePuzzle):
+            solver.solve()
+        self.assertEqual(1, spans.dropped)
+        self.assertEqual(1, len(spans.spans))
+        self.assertFalse(spans.spans[0].contradiction)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import logging
+import unittest
+
+from sudoku_solve.puzzle_library import PuzzleLibrary
+from sudoku_solve.solver import Solver
+from sudoku_solve.strategies import default_strategies
+from sudoku_solve.group_exclusive_solver import GroupExclusiveSolver
+from sudoku_solve.only_option_solver import OnlyOptionSolver
+from sudoku_solve.trace import Lazy, start_trace, stop_trace, PACKAGE_LOGGER
+
+
+class TestTrace(unittest.TestCase):
+    def test_trace_keeps_recent_events(self):
+        level = logging.getLogger(PACKAGE_LOGGER).level
+        buffer = start_trace(capacity=16)
+        try:
+            Solver(PuzzleLibrary.extreme_puzzle(), default_strategies()).solve()
+        finally:
+            stop_trace(buffer)
+        self.assertEqual(16, len(buffer.events))
+        self.assertEqual(level, logging.getLogger(PACKAGE_LOGGER).level)
+        self.assertTrue(all(e.logger.startswith(PACKAGE_LOGGER) for e in buffer.events))
+        self.assertTrue(all(isinstance(m, str) for m in buffer.messages()))
+
+    def test_solve_step_rendered_only_when_formatted(self):
+        buffer = start_trace()
+        try:
+            Solver(PuzzleLibrary.easy_puzzle(), default_strategies()).one_solve_step()
+        finally:
+            stop_trace(buffer)
+        step = next(e for e in buffer.events if e.msg.startswith("Starting a solve step"))
+        self.assertIsInstance(step.args[0], Lazy)
+        self.assertIn("||", step.message())
+
+    def test_trace_captures_module_loggers(self):
+        buffer = start_trace()
+        try:
+            Solver(PuzzleLibrary.extreme_puzzle(), [GroupExclusiveSolver(), OnlyOptionSolver()]).solve()
+        finally:
+            stop_trace(buffer)
+        self.assertIn("sudoku_solve.only_option_solver", {e.logger for e in buffer.events})
+
+    def test_lazy_argument_not_computed_when_disabled(self):
+        calls = []
+        logger = logging.getLogger(PACKAGE_LOGGER + ".test")
+        logger.setLevel(logging.INFO)
+        logger.debug("%s", Lazy(calls.append, 1))
+        self.assertEqual([], calls)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import importlib.util
+import unittest
+
+from sudoku_solve.puzzle import MalformedPuzzle
+from sudoku_solve.puzzle_library import PuzzleLibrary, PUZZLE_STRS_BY_DIFFICULTY
+from sudoku_solve.puzzle_read import read_puzzle_line
+from sudoku_solve.puzzle_render import render_puzzle_line
+
+HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+if HAVE_NUMPY:
+    from sudoku_solve.vectorized import masks_from_lines, lines_from_masks, propagate_batch, solve_vectorized, \
+        SOLVED, STALLED, INVALID
+
+
+@unittest.skipUnless(HAVE_NUMPY, "numpy is not installed")
+class TestVectorized(unittest.TestCase):
+    @staticmethod
+    def __lines() -> list[str]:
+        return [''.join(s.split()) for s in PUZZLE_STRS_BY_DIFFICULTY.values()]
+
+    def test_line_round_trip(self):
+        lines = [render_puzzle_line(PuzzleLibrary.extreme_puzzle())]
+        masks = masks_from_lines(lines)
+        self.assertEqual((1, 81), masks.shape)
+        self.assertEqual(PuzzleLibrary.extreme_puzzle().grid.masks, masks[0].tolist())
+        self.assertEqual(lines, lines_from_masks(masks))
+
+    def test_malformed(self):
+        with self.assertRaises(MalformedPuzzle):
+            masks_from_lines(["1" * 80])
+        with self.assertRaises(MalformedPuzzle):
+            masks_from_lines(["x" * 81])
+
+    def test_propagate_batch(self):
+        masks = masks_from_lines(render_puzzle_line(p) for p in (PuzzleLibrary.easy_puzzle(),
+                                                                 PuzzleLibrary.extreme_puzzle()))
+        status = propagate_batch(masks)
+        self.assertEqual([SOLVED, STALLED], status.tolist())
+        self.assertTrue(read_puzzle_line(lines_from_masks(masks)[0]).is_solved())
+        for before, after in zip(PuzzleLibrary.extreme_puzzle().grid.masks, masks[1].tolist()):
+            self.assertEqual(after, before & after)
+
+    def test_invalid_puzzle(self):
+        line = render_puzzle_line(PuzzleLibrary.easy_puzzle())
+        first_known = next(i for i, ch in enumerate(line) if ch != '-')
+        row_start = first_known - first_known % 9
+        unknown = next(i for i in range(row_start, row_start + 9) if line[i] == '-')
+        invalid = line[:unknown] + line[first_known] + line[unknown + 1:]
+        self.assertEqual([INVALID], propagate_batch(masks_from_lines([invalid])).tolist())
+
+    def test_solve_vectorized(self):
+        lines = self.__lines()
+        result = solve_vectorized(lines * 3)
+        self.assertTrue(all(result.solved))
+        self.assertEqual(len(lines) * 3, result.vectorized + result.scalar)
+        self.assertGreater(result.vectorized, 0)
+        self.assertTrue(all(read_puzzle_line(s).is_solved() for s in result.solutions))
+
+
+if __name__ == '__main__':
+    unittest.main()